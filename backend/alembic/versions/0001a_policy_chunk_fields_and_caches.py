@@ -0,0 +1,77 @@
+"""policy chunk fields and caches
+
+마이그레이션 도입 전 스키마(0001) 이후 모델에 추가된 부분.
+policy_chunks의 title/category 컬럼, 정책 요약 캐시(policy_summaries), 프로필 유형별 검색어 캐시(profile_queries).
+이전 init_db가 누락된 테이블을 현재 모델로 만들어 둔 DB가 있으므로 이미 있는 테이블/컬럼은 건너뜁니다.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-17 21:35:10.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    chunk_columns = {column['name'] for column in inspector.get_columns('policy_chunks')}
+    with op.batch_alter_table('policy_chunks') as batch_op:
+        if 'title' not in chunk_columns:
+            batch_op.add_column(sa.Column('title', sa.String(length=255), nullable=True))
+        if 'category' not in chunk_columns:
+            batch_op.add_column(sa.Column('category', sa.String(length=100), nullable=True))
+
+    if 'policy_summaries' not in tables:
+        op.create_table('policy_summaries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('vector_id', sa.String(length=255), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('eligibility', sa.JSON(), nullable=True),
+        sa.Column('benefits', sa.JSON(), nullable=True),
+        sa.Column('application', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_policy_summaries_id'), 'policy_summaries', ['id'], unique=False)
+        op.create_index(op.f('ix_policy_summaries_vector_id'), 'policy_summaries', ['vector_id'], unique=True)
+
+    if 'profile_queries' not in tables:
+        op.create_table('profile_queries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('profile_type_id', sa.Integer(), nullable=False),
+        sa.Column('prompt_version', sa.Integer(), nullable=False),
+        sa.Column('query', sa.Text(), nullable=False),
+        sa.Column('embedding_model', sa.String(length=100), nullable=False),
+        sa.Column('embedding', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['profile_type_id'], ['profile_types.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('profile_type_id')
+        )
+        op.create_index(op.f('ix_profile_queries_id'), 'profile_queries', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_profile_queries_id'), table_name='profile_queries')
+    op.drop_table('profile_queries')
+    op.drop_index(op.f('ix_policy_summaries_vector_id'), table_name='policy_summaries')
+    op.drop_index(op.f('ix_policy_summaries_id'), table_name='policy_summaries')
+    op.drop_table('policy_summaries')
+    with op.batch_alter_table('policy_chunks') as batch_op:
+        batch_op.drop_column('category')
+        batch_op.drop_column('title')
@@ -0,0 +1,50 @@
+"""hot path indexes
+
+요청마다 실행되는 사용자/채팅별 조회에 인덱스 추가.
+saved_policies/recommended_policies의 user_id, profile_recommendations의 (profile_type_id, rank_order)는
+기존 유니크 제약 조건 인덱스가 같은 컬럼으로 시작하므로 따로 추가하지 않습니다.
+(app/scripts/check_query_plans.py로 실행 계획 확인)
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-17 21:36:02.118534
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼) - 첫 컬럼은 모두 외래 키
+INDEXES = [
+    ('ix_user_profiles_user_id', 'user_profiles', ['user_id']),
+    ('ix_chats_user_id_created_at', 'chats', ['user_id', 'created_at']),
+    ('ix_chat_messages_chat_id_created_at', 'chat_messages', ['chat_id', 'created_at']),
+    ('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at']),
+    ('ix_saved_policies_user_id_saved_at', 'saved_policies', ['user_id', 'saved_at']),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        # 현재 모델로 create_all한 DB를 stamp한 경우 인덱스가 이미 있음
+        if name in {index['name'] for index in inspector.get_indexes(table)}:
+            continue
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    is_mysql = op.get_bind().dialect.name == 'mysql'
+    for name, table, columns in reversed(INDEXES):
+        if is_mysql and table != 'saved_policies':
+            # MySQL은 새 인덱스를 만들 때 외래 키용 자동 인덱스를 지우므로, 외래 키 인덱스를 다시 만든 뒤 삭제
+            op.create_index(f'{table}_{columns[0]}_fk', table, [columns[0]], unique=False)
+        op.drop_index(name, table_name=table)
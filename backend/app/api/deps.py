@@ -1,3 +1,4 @@
+import secrets
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2
@@ -7,8 +8,13 @@ from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 from app.db.models import User
+from app.services import clients
+from app.services.lexical_index import LexicalIndex
+from app.services.llm_service import RAGService
+from app.services.policy_matcher import PolicyMatcher
+from app.services.principal_cache import principal_cache
 
 # 기존 OAuth2 스키마
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
@@ -33,8 +39,19 @@ class OAuth2PasswordBearerOptional(OAuth2):
 # 선택적 OAuth2 스키마 인스턴스 생성
 optional_oauth2_scheme = OAuth2PasswordBearerOptional(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+def resolve_principal(request: Request, db: Session, user_id: int) -> Optional[User]:
+    """
+    토큰의 사용자 (프로필 포함, get_user_profile로 추가 조회 없이 사용)
+    같은 요청에서는 한 번만 확인하고, 프로세스 캐시에 있으면 DB를 조회하지 않습니다.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is None or principal[0] != user_id:
+        principal = (user_id, principal_cache.get(db, user_id))
+        request.state.principal = principal
+    return principal[1]
+
 def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+    request: Request, db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
 ) -> User:
     try:
         payload = jwt.decode(
@@ -47,17 +64,26 @@ def get_current_user(
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-    except (JWTError, ValidationError):
+        user_id = int(user_id)
+    except (JWTError, ValidationError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = db.query(User).filter(User.id == user_id).first()
+    user = resolve_principal(request, db, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+def require_metrics_token(request: Request) -> None:
+    """운영 통계 조회 토큰 확인 (METRICS_TOKEN이 없으면 통계 엔드포인트를 숨김)"""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    token = request.headers.get("X-Metrics-Token", "")
+    if not secrets.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="통계 조회 권한이 없습니다.")
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -66,6 +92,7 @@ def get_current_active_user(
     return current_user
 
 def get_current_user_optional(
+    request: Request,
     db: Session = Depends(get_db),
     token: str = Depends(optional_oauth2_scheme)
 ) -> Optional[User]:
@@ -78,8 +105,20 @@ def get_current_user_optional(
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-    except (JWTError, ValidationError):
+        user_id = int(user_id)
+    except (JWTError, ValidationError, ValueError):
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
-    return user
\ No newline at end of file
+    return resolve_principal(request, db, user_id)
+
+def get_rag_service() -> RAGService:
+    """프로세스 전역 RAG 서비스 (공유 클라이언트 사용)"""
+    return clients.get_rag_service()
+
+def get_policy_matcher() -> PolicyMatcher:
+    """프로세스 전역 정책 매처 (공유 클라이언트 사용)"""
+    return clients.get_policy_matcher()
+
+def get_lexical_index() -> Optional[LexicalIndex]:
+    """정책명/본문 n-gram 역색인 (로컬 청크 데이터가 없으면 None)"""
+    return clients.get_lexical_index()
@@ -8,7 +8,8 @@ from app.core.config import settings
 from app.core.security import create_access_token, verify_password, get_password_hash
 from app.api.deps import get_db, get_current_user
 from app.db.models import User, UserProfile, ProfileType, ProfileRecommendation
-from app.services.policy_matcher import PolicyMatcher
+from app.services.jobs import job_queue
+from app.services.principal_cache import get_user_profile, principal_cache
 
 router = APIRouter()
 
@@ -118,34 +119,6 @@ def get_or_create_profile_type(db: Session, profile_data: dict) -> int:
     
     return profile_type.id
 
-def extract_title_from_text(text: str) -> str:
-    """텍스트에서 제목 추출 (첫번째 유의미한 줄 사용)"""
-    lines = text.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if line and len(line) < 100:  # 적당한 길이의 줄 찾기
-            return line
-    return "제목 없음"
-
-def extract_category(text: str) -> str:
-    """텍스트 내용 기반으로 카테고리 추정"""
-    categories = {
-        "청년": ["청년", "20대", "30대", "학졸자", "구직자"],
-        "고령자": ["고령자", "신중년", "50대", "60대"],
-        "장애인": ["장애인", "중증장애", "경증장애"],
-        "여성": ["여성", "육아", "출산", "모성"],
-        "외국인": ["외국인", "다문화", "이주민"],
-        "사업주": ["사업주", "기업", "고용주", "사업장"],
-        "직업능력개발": ["직업훈련", "능력개발", "자격증", "교육훈련"]
-    }
-    
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            if keyword in text:
-                return category
-    
-    return "기타"
-
 @router.post("/login")
 def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
@@ -236,70 +209,29 @@ def register_user(
         db.add(profile)
         db.commit()
     
-    # 프로필 유형 ID가 있는 경우, 해당 유형에 맞는 추천 정책 생성
+    # 프로필 유형 ID가 있는 경우, 해당 유형에 맞는 추천 정책 생성 (백그라운드 작업)
+    recommendation_job_id = None
     if profile_type_id:
-        # 기존 추천 정책이 있는지 확인
-        existing_recommendations = db.query(ProfileRecommendation).filter(
+        # 기존 추천 정책이 없을 때만 생성
+        existing_recommendation = db.query(ProfileRecommendation.id).filter(
             ProfileRecommendation.profile_type_id == profile_type_id
-        ).all()
+        ).first()
         
-        # 기존 추천 정책이 없으면 생성
-        if not existing_recommendations:
+        if not existing_recommendation:
             try:
-                # 여기서 scripts.generate_profile_recommendations의 로직을 가져와서 사용
-                from app.services.policy_matcher import PolicyMatcher
-                
-                # 프로필 타입 정보 가져오기
-                profile_type = db.query(ProfileType).filter(ProfileType.id == profile_type_id).first()
-                
-                if profile_type:
-                    # 정책 매처 초기화
-                    policy_matcher = PolicyMatcher()
-                    
-                    # 프로필 딕셔너리 생성
-                    profile_dict = {
-                        "age": 25 if profile_type.age_group == "청년" else 45 if profile_type.age_group == "중장년" else 65,
-                        "gender": "male" if profile_type.gender == "남성" else "female" if profile_type.gender == "여성" else "other",
-                        "employment_status": (
-                            "employed" if profile_type.employment_status == "재직자" else
-                            "unemployed" if profile_type.employment_status == "구직자" else
-                            "business" if profile_type.employment_status == "자영업자" else "student"
-                        ),
-                        "is_disabled": profile_type.is_disabled,
-                        "is_foreign": profile_type.is_foreign,
-                        "family_status": (
-                            "parent" if profile_type.family_status == "영유아 자녀 있음" else
-                            "single_parent" if profile_type.family_status == "한부모" else
-                            "caregiver" if profile_type.family_status == "주 양육자" else "none"
-                        )
-                    }
-                    
-                    # 정책 추천 가져오기
-                    recommendations = policy_matcher.recommend_policies(profile_dict, top_k=5)
-                    
-                    # 추천 저장
-                    for rank, rec in enumerate(recommendations, 1):
-                        policy_text = rec.get("text", "")
-                        policy_title = rec.get("title") or extract_title_from_text(policy_text)
-                        
-                        recommendation = ProfileRecommendation(
-                            profile_type_id=profile_type.id,
-                            policy_id=rec.get("id", "") or rec.get("policy_id", ""),
-                            policy_title=policy_title,
-                            policy_content=policy_text,
-                            page_number=rec.get("page", ""),
-                            category=rec.get("category") or extract_category(policy_text),
-                            relevance_score=rec.get("score", 0.0),
-                            rank_order=rank
-                        )
-                        db.add(recommendation)
-                    
-                    db.commit()
+                recommendation_job_id = job_queue.enqueue(
+                    "generate_profile_type_recommendations", profile_type_id, dedup_key=f"recommendations:type:{profile_type_id}",
+                    owner_id=new_user.id
+                )
             except Exception as e:
-                print(f"추천 정책 생성 중 오류 발생: {str(e)}")
+                print(f"추천 정책 생성 작업 등록 중 오류 발생: {str(e)}")
                 # 오류가 발생해도 회원가입은 성공하도록 오류를 무시
     
-    return {"message": "사용자가 성공적으로 등록되었습니다", "user_id": new_user.id}
+    return {
+        "message": "사용자가 성공적으로 등록되었습니다",
+        "user_id": new_user.id,
+        "recommendation_job_id": recommendation_job_id
+    }
 
 @router.get("/me", response_model=dict)
 def read_users_me(
@@ -310,7 +242,7 @@ def read_users_me(
     현재 사용자 정보 가져오기 (프로필 정보 포함)
     """
     # 사용자 프로필 정보 가져오기
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = get_user_profile(current_user)
     
     # 프로필이 없으면 기본 정보만 반환//
     if not profile:
@@ -428,5 +360,7 @@ def update_user_profile(
     
     db.commit()
     db.refresh(profile)
+    # 캐시된 인증 사용자(프로필 포함) 무효화
+    principal_cache.invalidate(profile.user_id)
     
     return {"message": "프로필이 성공적으로 업데이트되었습니다", "user_id": current_user.id}
\ No newline at end of file
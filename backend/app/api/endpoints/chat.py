@@ -1,17 +1,24 @@
-from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import json
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_async_db, get_current_user, get_rag_service
+from app.api.pagination import CursorPage, SortKey
 from app.core.config import settings
+from app.db.base import SessionLocal
 from app.db.models import User, Policy, PolicyChunk, Chat, ChatMessage 
+from app.services.answer_cache import profile_bucket
+from app.services.llm_gateway import LLMUnavailableError
 from app.services.llm_service import RAGService
+from app.services.principal_cache import get_user_profile
 
 router = APIRouter()
 
-# RAG 서비스 초기화
-rag_service = RAGService()
-
 class ChatRequest(BaseModel):
     query: str
     user_profile: Optional[dict] = None
@@ -21,16 +28,99 @@ class Source(BaseModel):
     text: str
     similarity: Optional[float] = None
 
+class ChatUsage(BaseModel):
+    prompt_tokens: int
+    context_tokens: int
+    raw_context_tokens: int
+
 class ChatResponse(BaseModel):
     answer: str
     sources: List[Source] = []
+    usage: Optional[ChatUsage] = None
+
+def resolve_user_profile(current_user: User, chat_request: ChatRequest) -> Tuple[Optional[dict], Optional[str]]:
+    """답변 생성에 사용할 사용자 프로필과 답변 캐시 버킷"""
+    # 요청에 프로필이 포함된 경우 사용
+    if chat_request.user_profile:
+        return chat_request.user_profile, None
+    
+    # 사용자 프로필 정보 추가 (있는 경우)
+    profile = get_user_profile(current_user)
+    if profile:
+        user_profile = {
+            "age": profile.age,
+            "gender": profile.gender,
+            "employment_status": profile.employment_status,
+            "region": profile.region
+        }
+        # 같은 프로필 유형의 사용자끼리 답변 캐시 공유
+        return user_profile, profile_bucket(user_profile, profile.profile_type_id)
+    
+    return None, None
+
+def make_chat_title(text: str) -> str:
+    """메시지의 앞부분으로 채팅 제목 생성 (너무 길면 자름)"""
+    return text[:30] + "..." if len(text) > 30 else text
+
+def save_assistant_message(db: Session, chat: Chat, query: str, response: dict) -> None:
+    """어시스턴트 응답을 저장하고, 첫 메시지라면 채팅 제목을 업데이트합니다."""
+    assistant_message = ChatMessage(
+        chat_id=chat.id,
+        is_user=0,
+        content=response["answer"],
+        sources=response["sources"]
+    )
+    db.add(assistant_message)
+    
+    # 첫 메시지라면 채팅 제목 업데이트
+    messages_count = db.query(ChatMessage).filter(ChatMessage.chat_id == chat.id).count()
+    if messages_count <= 2:  # 사용자 메시지와 시스템 응답을 합쳐 2개
+        chat.title = make_chat_title(query)
+        db.add(chat)
+        
+    db.commit()
+
+async def get_user_chat(db: AsyncSession, chat_id: int, user_id: int) -> Chat:
+    """현재 사용자의 채팅 (없거나 다른 사용자의 채팅이면 404)"""
+    chat = await db.scalar(select(Chat).where(Chat.id == chat_id, Chat.user_id == user_id))
+    if not chat:
+        raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
+    return chat
+
+def sse_event(event: str, data: Any) -> str:
+    """Server-Sent Events 형식의 이벤트 문자열"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def stream_chat_events(
+    rag_service: RAGService,
+    query: str,
+    user_profile: Optional[dict],
+    cache_bucket: Optional[str],
+    on_complete: Optional[Callable[[dict], None]] = None,
+) -> Iterator[str]:
+    """
+    답변 생성 이벤트를 SSE로 변환합니다. (sources → token... → done)
+    on_complete는 답변이 끝까지 생성된 뒤 한 번 호출됩니다.
+    """
+    try:
+        for event in rag_service.stream_response(query, user_profile, cache_bucket=cache_bucket):
+            event_type = event.pop("type")
+            if event_type == "done" and on_complete is not None:
+                on_complete(event)
+            yield sse_event(event_type, event)
+    except Exception as e:
+        print(f"챗봇 스트리밍 오류: {str(e)}")
+        yield sse_event("error", {"detail": f"챗봇 오류: {str(e)}"})
+
+# 프록시(nginx 등)가 스트림을 버퍼링하지 않도록 설정
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 @router.post("/", response_model=ChatResponse)
 async def chat_with_assistant(
     *,
-    db: Session = Depends(get_db),
     chat_request: ChatRequest,
     current_user: User = Depends(get_current_user),
+    rag_service: RAGService = Depends(get_rag_service),
 ) -> Any:
     """
     고용노동 정책 어시스턴트와 대화
@@ -38,23 +128,13 @@ async def chat_with_assistant(
     query = chat_request.query
     
     try:
-        # 사용자 프로필 정보 추가 (있는 경우)
-        user_profile = None
-        if current_user.profiles and len(current_user.profiles) > 0:
-            profile = current_user.profiles[0]
-            user_profile = {
-                "age": profile.age,
-                "gender": profile.gender,
-                "employment_status": profile.employment_status,
-                "region": profile.region
-            }
+        # 사용자 프로필 정보 (요청에 프로필이 포함된 경우 요청 값 사용)
+        user_profile, cache_bucket = resolve_user_profile(current_user, chat_request)
         
-        # 요청에 프로필이 포함된 경우 사용
-        if chat_request.user_profile:
-            user_profile = chat_request.user_profile
-        
-        # RAG 서비스를 통한 응답 생성
-        response = rag_service.generate_response(query, user_profile)
+        # RAG 서비스를 통한 응답 생성 (유사 질문 답변 캐시 우선, 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+        response = await run_in_threadpool(
+            rag_service.generate_response, query, user_profile, cache_bucket=cache_bucket
+        )
         
         # 응답 형식 변환
         sources_formatted = []
@@ -69,16 +149,37 @@ async def chat_with_assistant(
         
         return {
             "answer": response["answer"],
-            "sources": sources_formatted
+            "sources": sources_formatted,
+            "usage": response.get("usage")
         }
         
+    except LLMUnavailableError:
+        # 게이트웨이가 호출하지 않고 거절한 경우는 503으로 응답 (main.py 예외 처리기)
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"챗봇 오류: {str(e)}")
     
 
+@router.post("/stream")
+async def stream_chat_with_assistant(
+    *,
+    chat_request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+    rag_service: RAGService = Depends(get_rag_service),
+) -> Any:
+    """
+    고용노동 정책 어시스턴트와 대화 (SSE 스트리밍)
+    """
+    user_profile, cache_bucket = resolve_user_profile(current_user, chat_request)
+    return StreamingResponse(
+        stream_chat_events(rag_service, chat_request.query, user_profile, cache_bucket),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 @router.post("/create", response_model=dict)
 async def create_new_chat(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """새 채팅 생성"""
@@ -89,8 +190,7 @@ async def create_new_chat(
         title="새 대화"  # 기본 제목
     )
     db.add(new_chat)
-    db.commit()
-    db.refresh(new_chat)
+    await db.commit()
     
     return {
         "id": new_chat.id,
@@ -98,54 +198,92 @@ async def create_new_chat(
         "created_at": new_chat.created_at
     }
 
+# 채팅 목록 정렬 키 (최신순)
+CHAT_LIST_KEYS = [SortKey(Chat.created_at), SortKey(Chat.id)]
+
+def list_user_chats(
+    db: Session,
+    user_id: int,
+    page: CursorPage,
+    response: Optional[Response] = None,
+) -> List[dict]:
+    """
+    사용자의 채팅 목록을 최신순으로 한 페이지 조회합니다. (쿼리 1회)
+    제목이 없는 채팅은 첫 사용자 메시지로 제목을 만듭니다.
+    """
+    chats_page = page.apply(
+        db.query(Chat.id, Chat.title, Chat.created_at).filter(Chat.user_id == user_id),
+        CHAT_LIST_KEYS
+    ).subquery()
+
+    # 페이지에 포함된 채팅 중 제목이 없는 채팅의 첫 사용자 메시지 (제목에 필요한 앞부분만 가져옴)
+    first_messages = db.query(
+        ChatMessage.chat_id.label("chat_id"),
+        func.substr(ChatMessage.content, 1, 31).label("preview"),
+        func.row_number().over(
+            partition_by=ChatMessage.chat_id,
+            order_by=(ChatMessage.created_at, ChatMessage.id)
+        ).label("position"),
+    ).join(chats_page, chats_page.c.id == ChatMessage.chat_id)\
+        .filter(ChatMessage.is_user == 1, chats_page.c.title.is_(None))\
+        .subquery()
+
+    rows = db.query(chats_page.c.id, chats_page.c.title, chats_page.c.created_at, first_messages.c.preview)\
+        .outerjoin(first_messages, and_(
+            first_messages.c.chat_id == chats_page.c.id,
+            first_messages.c.position == 1
+        ))\
+        .order_by(chats_page.c.created_at.desc(), chats_page.c.id.desc())\
+        .all()
+
+    chats = []
+    for row in page.finish(rows, CHAT_LIST_KEYS, response):
+        title = row.title
+        if row.preview and not title:
+            title = make_chat_title(row.preview)
+        chats.append({
+            "id": row.id,
+            "title": title,
+            "created_at": row.created_at.isoformat()
+        })
+    return chats
+
 @router.get("/list", response_model=List[dict])
 async def get_chat_list(
-    db: Session = Depends(get_db),
+    response: Response,
+    page: CursorPage = Depends(),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
-    """사용자의 채팅 목록 조회"""
-    
-    chats = db.query(Chat).filter(Chat.user_id == current_user.id).order_by(Chat.created_at.desc()).all()
-    
-    result = []
-    for chat in chats:
-        # 각 채팅의 첫 메시지를 제목으로 사용
-        first_message = db.query(ChatMessage)\
-            .filter(ChatMessage.chat_id == chat.id, ChatMessage.is_user == 1)\
-            .order_by(ChatMessage.created_at).first()
-            
-        title = chat.title
-        if first_message and not title:
-            # 첫 메시지의 일부를 제목으로 설정 (너무 길면 자름)
-            title = first_message.content[:30] + "..." if len(first_message.content) > 30 else first_message.content
-            
-        result.append({
-            "id": chat.id,
-            "title": title,
-            "created_at": chat.created_at.isoformat()
-        })
-    
-    return result
+    """
+    사용자의 채팅 목록 조회 (최신순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    return await db.run_sync(list_user_chats, current_user.id, page, response)
 
 @router.get("/{chat_id}/messages", response_model=List[dict])
 async def get_chat_messages(
     chat_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    page: CursorPage = Depends(),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
-    """특정 채팅의 메시지 목록 조회"""
+    """
+    특정 채팅의 메시지 목록 조회 (오래된 순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
     
     # 해당 채팅이 현재 사용자의 것인지 확인
-    chat = db.query(Chat).filter(Chat.id == chat_id, Chat.user_id == current_user.id).first()
-    if not chat:
-        raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
+    await get_user_chat(db, chat_id, current_user.id)
     
-    messages = db.query(ChatMessage)\
-        .filter(ChatMessage.chat_id == chat_id)\
-        .order_by(ChatMessage.created_at).all()
+    keys = [SortKey(ChatMessage.created_at, descending=False), SortKey(ChatMessage.id, descending=False)]
+    messages = (await db.scalars(
+        page.apply(select(ChatMessage).where(ChatMessage.chat_id == chat_id), keys)
+    )).all()
     
     result = []
-    for message in messages:
+    for message in page.finish(messages, keys, response):
         result.append({
             "id": message.id,
             "content": message.content,
@@ -160,15 +298,14 @@ async def get_chat_messages(
 async def add_message_to_chat(
     chat_id: int,
     chat_request: ChatRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    rag_service: RAGService = Depends(get_rag_service),
 ) -> Any:
     """채팅에 새 메시지 추가 및 응답 생성"""
     
     # 해당 채팅이 현재 사용자의 것인지 확인
-    chat = db.query(Chat).filter(Chat.id == chat_id, Chat.user_id == current_user.id).first()
-    if not chat:
-        raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
+    chat = await get_user_chat(db, chat_id, current_user.id)
     
     query = chat_request.query
     
@@ -180,43 +317,19 @@ async def add_message_to_chat(
         sources=None
     )
     db.add(user_message)
-    db.commit()
+    await db.commit()
     
     try:
-        # 사용자 프로필 정보 추가 (있는 경우)
-        user_profile = None
-        if current_user.profiles and len(current_user.profiles) > 0:
-            profile = current_user.profiles[0]
-            user_profile = {
-                "age": profile.age,
-                "gender": profile.gender,
-                "employment_status": profile.employment_status,
-                "region": profile.region
-            }
-        
-        # 요청에 프로필이 포함된 경우 사용
-        if chat_request.user_profile:
-            user_profile = chat_request.user_profile
+        # 사용자 프로필 정보 (요청에 프로필이 포함된 경우 요청 값 사용)
+        user_profile, cache_bucket = resolve_user_profile(current_user, chat_request)
         
-        # RAG 서비스를 통한 응답 생성
-        response = rag_service.generate_response(query, user_profile)
-        
-        # 응답 저장
-        assistant_message = ChatMessage(
-            chat_id=chat_id,
-            is_user=0,
-            content=response["answer"],
-            sources=response["sources"]
+        # RAG 서비스를 통한 응답 생성 (유사 질문 답변 캐시 우선, 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+        response = await run_in_threadpool(
+            rag_service.generate_response, query, user_profile, cache_bucket=cache_bucket
         )
-        db.add(assistant_message)
         
-        # 첫 메시지라면 채팅 제목 업데이트
-        messages_count = db.query(ChatMessage).filter(ChatMessage.chat_id == chat_id).count()
-        if messages_count <= 2:  # 사용자 메시지와 시스템 응답을 합쳐 2개
-            chat.title = query[:30] + "..." if len(query) > 30 else query
-            db.add(chat)
-            
-        db.commit()
+        # 응답 저장 (첫 메시지라면 채팅 제목 업데이트)
+        await db.run_sync(save_assistant_message, chat, query, response)
         
         # 응답 형식 변환
         sources_formatted = []
@@ -231,30 +344,78 @@ async def add_message_to_chat(
         
         return {
             "answer": response["answer"],
-            "sources": sources_formatted
+            "sources": sources_formatted,
+            "usage": response.get("usage")
         }
+    except LLMUnavailableError:
+        await db.rollback()
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"챗봇 오류: {str(e)}")
 
+@router.post("/{chat_id}/message/stream")
+async def stream_message_to_chat(
+    chat_id: int,
+    chat_request: ChatRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    rag_service: RAGService = Depends(get_rag_service),
+) -> Any:
+    """채팅에 새 메시지 추가 및 응답 스트리밍 (SSE). 응답이 끝나면 저장합니다."""
+    
+    # 해당 채팅이 현재 사용자의 것인지 확인
+    await get_user_chat(db, chat_id, current_user.id)
+    
+    query = chat_request.query
+    
+    # 사용자 메시지 저장
+    user_message = ChatMessage(
+        chat_id=chat_id,
+        is_user=1,
+        content=query,
+        sources=None
+    )
+    db.add(user_message)
+    await db.commit()
+    
+    user_profile, cache_bucket = resolve_user_profile(current_user, chat_request)
+    
+    def persist(response: dict) -> None:
+        # 스트림은 스레드풀에서 순회하고 요청 세션은 이미 닫혔을 수 있으므로 새 동기 세션으로 저장
+        session = SessionLocal()
+        try:
+            stream_chat = session.query(Chat).filter(Chat.id == chat_id).first()
+            if stream_chat:
+                save_assistant_message(session, stream_chat, query, response)
+        except Exception as e:
+            session.rollback()
+            print(f"챗봇 응답 저장 오류: {str(e)}")
+        finally:
+            session.close()
+    
+    return StreamingResponse(
+        stream_chat_events(rag_service, query, user_profile, cache_bucket, on_complete=persist),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 @router.delete("/{chat_id}", response_model=dict)
 async def delete_chat(
     chat_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """채팅 삭제"""
     
     # 해당 채팅이 현재 사용자의 것인지 확인
-    chat = db.query(Chat).filter(Chat.id == chat_id, Chat.user_id == current_user.id).first()
-    if not chat:
-        raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
+    chat = await get_user_chat(db, chat_id, current_user.id)
     
     # 채팅 관련 메시지 먼저 삭제
-    db.query(ChatMessage).filter(ChatMessage.chat_id == chat_id).delete()
+    await db.execute(delete(ChatMessage).where(ChatMessage.chat_id == chat_id))
     
     # 채팅 삭제
-    db.delete(chat)
-    db.commit()
+    await db.delete(chat)
+    await db.commit()
     
     return {"message": "채팅이 성공적으로 삭제되었습니다."}
\ No newline at end of file
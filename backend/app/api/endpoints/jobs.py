@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from app.api.deps import get_current_user
+from app.db.models import User
+from app.services.jobs import job_queue
+
+router = APIRouter()
+
+class JobStatus(BaseModel):
+    id: str
+    name: Optional[str] = None
+    status: str  # queued, running, succeeded, failed
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+@router.get("/{job_id}", response_model=JobStatus)
+def get_job_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """백그라운드 작업 상태 조회 (본인이 요청한 작업만, 다른 사용자의 작업은 404)"""
+    job = job_queue.get(job_id, owner_id=current_user.id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
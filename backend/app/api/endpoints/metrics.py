@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+from app.api.deps import require_metrics_token
+from app.core.singleflight import openai_flight
+from app.services.answer_cache import answer_cache
+from app.services.context_builder import context_stats
+from app.services.description_cache import description_cache
+from app.services.embedding_cache import embedding_cache
+from app.services.jobs import job_queue
+from app.services.llm_gateway import llm_gateway
+from app.services.principal_cache import principal_cache
+from app.services.search_cache import search_response_cache
+
+# 운영 통계 (METRICS_TOKEN이 있는 요청만 조회)
+router = APIRouter(dependencies=[Depends(require_metrics_token)])
+
+@router.get("/cache")
+def cache_metrics():
+    """캐시 적중/미스 통계"""
+    return {
+        "embedding": embedding_cache.stats(),
+        "search": search_response_cache.stats(),
+        "policy_description": description_cache.stats(),
+        "chat_answer": answer_cache.stats(),
+        "principal": principal_cache.stats(),
+        "chat_context": context_stats.stats(),
+        "openai_singleflight": openai_flight.stats(),
+    }
+
+@router.get("/llm")
+def llm_metrics():
+    """OpenAI 게이트웨이 통계 (속도 제한, 재시도, 회로 상태, 지연 시간)"""
+    return llm_gateway.stats()
+
+@router.get("/jobs")
+def job_metrics():
+    """백그라운드 작업 큐 상태별 작업 수"""
+    return job_queue.stats()
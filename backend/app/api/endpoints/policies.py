@@ -1,36 +1,45 @@
-from typing import Any, List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Body
+from typing import Any, List, Optional, Dict, Set, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Body
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_current_user_optional, get_db, get_current_user
-from app.db.models import Policy, ProfileRecommendation, User, UserProfile
+from app.api.deps import get_async_db, get_current_user_optional, get_db, get_current_user, get_policy_matcher, get_lexical_index
+from app.api.pagination import CursorPage, SortKey
+from app.db.models import Policy, ProfileRecommendation, SavedPolicy, User
 from app.services.policy_matcher import PolicyMatcher
-from pydantic import BaseModel
+from app.services.principal_cache import get_user_profile
+from app.services.clients import get_index_version
+from app.services.ingestion import query_serving_chunks
+from app.services.llm_gateway import LLMUnavailableError
+from app.services.lexical_index import LexicalIndex, reciprocal_rank_fusion
+from app.services.policy_metadata import title_and_category
+from app.services.profile_queries import recommend_for_profile
+from app.services.policy_summaries import (
+    describe_policies,
+    generate_user_friendly_policy_description,
+    get_stored_summaries
+)
+from app.services.jobs import job_queue
+from app.services.search_cache import search_response_cache
+from app.services.vector_search import get_policies_by_ids
+from pydantic import BaseModel, Field
 from app.schemas.policy import PolicyDisplay
-import json
-from openai import OpenAI
-import os
-from dotenv import load_dotenv
 
 from app.services.policy_service import (
     get_user_recommended_policies, 
     save_policy, 
     unsave_policy, 
-    get_saved_policies,
-    is_policy_saved,
-    create_user_policy_recommendations
+    get_saved_policy_ids,
+    is_policy_saved
 )
 
-# .env 파일에서 환경 변수 로드
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
 router = APIRouter()
 
-# OpenAI 클라이언트 초기화
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+# 검색 결과로 보여줄 최대 정책 수
+MAX_SEARCH_RESULTS = 6
 
-# 정책 매처 초기화
-policy_matcher = PolicyMatcher()
+# /enhance/batch 한 번에 요청할 수 있는 최대 정책 수
+MAX_ENHANCE_BATCH = 20
 
 class PolicyResponse(BaseModel):
     id: int
@@ -60,6 +69,21 @@ class PolicyEnhanceResponse(BaseModel):
     benefits: List[str]
     application: str
 
+class PolicyEnhanceBatchRequest(BaseModel):
+    policy_ids: List[str] = Field(..., min_length=1, max_length=MAX_ENHANCE_BATCH)
+
+class PolicyEnhanceBatchItem(BaseModel):
+    policy_id: str
+    # False면 설명 생성이 시간 초과/실패한 것으로, 나중에 다시 요청할 수 있음
+    enhanced: bool
+    summary: Optional[str] = None
+    eligibility: List[str] = Field(default_factory=list)
+    benefits: List[str] = Field(default_factory=list)
+    application: Optional[str] = None
+
+class PolicyEnhanceBatchResponse(BaseModel):
+    results: List[PolicyEnhanceBatchItem]
+
 class ProfileModel(BaseModel):
     age: Optional[int] = None
     gender: Optional[str] = None
@@ -84,76 +108,68 @@ class RecommendationResponse(BaseModel):
     recommendations: List[PolicyRecommendation]
     profile_summary: str
 
-def generate_user_friendly_policy_description(policy_text: str, user_profile: Optional[Dict] = None) -> Dict:
-    """정책 텍스트를 사용자 친화적인 형태로 변환"""
-    try:
-        # 프로필 정보가 있으면 사용자 맞춤형 설명 추가
-        profile_context = ""
-        if user_profile:
-            profile_context = f"""
-            다음은 사용자 프로필 정보입니다:
-            {json.dumps(user_profile, ensure_ascii=False, indent=2)}
-            
-            위 사용자에게 이 정책이 어떻게 도움이 될 수 있는지 고려하여 설명해주세요.
-            """
-        
-        prompt = f"""
-        다음은 고용노동부 정책 내용입니다:
-        {policy_text[:3000]}  # 정책 텍스트 길이 제한
-        
-        다음 정보를 추출해서 JSON 형식으로 반환해주세요:
-        1. "summary": 이 정책의 핵심 내용을 3-4문장으로 요약 (일반인이 이해하기 쉽게)
-        2. "eligibility": 이 정책의 대상자/신청자격을 2-4가지 항목으로 정리 (리스트 형식)
-        3. "benefits": 이 정책의 주요 혜택을 2-4가지 항목으로 추출 (리스트 형식)
-        4. "application": 신청 방법을 1-2문장으로 간략히 설명
-        
-        {profile_context}
-        
-        JSON 형식으로 반환해주세요. 각 항목은 간결하고 이해하기 쉽게 작성해주세요.
-        """
-        
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "당신은 고용노동부 정책을 일반인이 이해하기 쉽게 설명해주는 전문가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        # JSON 파싱
-        result = json.loads(response.choices[0].message.content)
-        return result
-    except Exception as e:
-        print(f"정책 설명 생성 오류: {str(e)}")
-        # 파싱 실패시 기본값 반환
-        return {
-            "summary": "이 정책은 고용노동부에서 제공하는 지원 제도입니다. 자세한 내용은 상세 정보를 확인해주세요.",
-            "eligibility": ["해당 정책의 지원 대상 정보를 확인할 수 없습니다."],
-            "benefits": ["해당 정책의 혜택 정보를 확인할 수 없습니다."],
-            "application": "자세한 신청 방법은 고용노동부 홈페이지나 관련 기관에 문의하세요."
-        }
+def load_user_profile(current_user: Optional[User]) -> Tuple[Optional[Dict], Optional[int]]:
+    """로그인한 사용자의 프로필 딕셔너리와 프로필 유형 ID (없으면 None)"""
+    if not current_user:
+        return None, None
+    profile = get_user_profile(current_user)
+    if not profile:
+        return None, None
+    return {
+        "age": profile.age,
+        "gender": profile.gender,
+        "employment_status": profile.employment_status,
+        "region": profile.region,
+        "is_disabled": profile.is_disabled,
+        "is_foreign": profile.is_foreign,
+        "family_status": profile.family_status
+    }, profile.profile_type_id
+
+def load_saved_policy_ids(db: Session, current_user: Optional[User], policy_ids) -> Set[str]:
+    """policy_ids 중 로그인한 사용자가 저장한 정책 ID (비로그인이면 빈 집합)"""
+    if not current_user:
+        return set()
+    return get_saved_policy_ids(db, current_user.id, policy_ids)
+
+def retrieve_policy_matches(q: str, policy_matcher: PolicyMatcher, lexical_index: Optional[LexicalIndex]) -> List[Any]:
+    """검색어에 맞는 청크 목록 (match 객체, 순위순)"""
+    if lexical_index is not None:
+        # 정책명이 정확히/거의 일치하면 임베딩과 벡터 검색 없이 바로 반환
+        title_matches = lexical_index.match_title(q, top_k=MAX_SEARCH_RESULTS)
+        if title_matches:
+            return title_matches
+    
+    query_embedding = policy_matcher.get_embedding(q)
+    # 목차 청크 제외
+    vector_matches = query_serving_chunks(policy_matcher.index, query_embedding, MAX_SEARCH_RESULTS)
+    
+    if lexical_index is None:
+        return vector_matches
+    
+    # 키워드와 의미가 섞인 검색어를 위해 본문 n-gram 검색 결과와 순위 결합
+    lexical_matches = lexical_index.search(q, top_k=MAX_SEARCH_RESULTS)
+    return reciprocal_rank_fusion([vector_matches, lexical_matches], top_k=MAX_SEARCH_RESULTS)
 
 @router.get("/", response_model=List[PolicyResponse])
 def get_policies(
+    response: Response,
+    page: CursorPage = Depends(),
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
     category: Optional[str] = None,
     target_region: Optional[str] = None,
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """
-    정책 목록 조회 (필터링 가능)
+    정책 목록 조회 (필터링 가능, ID 순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
     query = db.query(Policy)
     if category:
         query = query.filter(Policy.category == category)
     if target_region:
         query = query.filter(Policy.target_region == target_region)
-    policies = query.offset(skip).limit(limit).all()
-    return policies
+    keys = [SortKey(Policy.id, descending=False)]
+    return page.finish(page.apply(query, keys).all(), keys, response)
 
 @router.get("/{policy_id}", response_model=PolicyResponse)
 def get_policy(
@@ -173,32 +189,17 @@ def get_policy(
 @router.post("/enhance", response_model=PolicyEnhanceResponse)
 async def enhance_policy_description(
     request: PolicyEnhanceRequest,
-    db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ) -> Any:
     """
     정책 설명을 LLM을 사용하여 사용자 친화적으로 변환
     """
     # 사용자 프로필 정보 가져오기
-    profile_dict = None
+    profile_dict, _ = load_user_profile(current_user)
     
-    if current_user:
-        user_profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
-        if user_profile:
-            # 프로필 정보를 딕셔너리로 변환
-            profile_dict = {
-                "age": user_profile.age,
-                "gender": user_profile.gender,
-                "employment_status": user_profile.employment_status,
-                "region": user_profile.region,
-                "is_disabled": user_profile.is_disabled,
-                "is_foreign": user_profile.is_foreign,
-                "family_status": user_profile.family_status
-            }
-    
-    # LLM으로 정책 설명 생성
-    enhanced_description = generate_user_friendly_policy_description(
-        request.policy_content, profile_dict
+    # LLM으로 정책 설명 생성 (스레드풀에서 실행해 이벤트 루프를 막지 않고, 같은 요청은 한 번만 호출)
+    enhanced_description = await run_in_threadpool(
+        generate_user_friendly_policy_description, request.policy_content, profile_dict
     )
     
     # 결과에 정책 ID 추가
@@ -206,112 +207,144 @@ async def enhance_policy_description(
     
     return PolicyEnhanceResponse(**enhanced_description)
 
+@router.post("/enhance/batch", response_model=PolicyEnhanceBatchResponse)
+async def enhance_policy_descriptions(
+    request: PolicyEnhanceBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+) -> Any:
+    """
+    여러 정책의 사용자 친화적 설명을 한 번에 반환 (/search/?summaries=false 결과를 채우는 용도)
+    
+    저장된 요약은 바로 반환하고 없는 정책만 LLM으로 동시에 생성합니다.
+    결과는 요청한 순서대로이며, 인덱스에 없는 정책 ID는 제외합니다.
+    """
+    profile_dict, _ = load_user_profile(current_user)
+    
+    # 정책 본문을 한 번에 조회 (중복 ID 제거)
+    policy_ids = list(dict.fromkeys(request.policy_ids))
+    policies = await run_in_threadpool(get_policies_by_ids, policy_ids)
+    policy_texts = {policy["id"]: policy["content"] for policy in policies}
+    
+    descriptions = await describe_policies(db, policy_texts, profile_dict)
+    
+    results = []
+    for policy_id in policy_ids:
+        if policy_id not in policy_texts:
+            continue
+        description = descriptions.get(policy_id)
+        item = None
+        if description is not None:
+            try:
+                item = PolicyEnhanceBatchItem(policy_id=policy_id, enhanced=True, **description)
+            except Exception as e:
+                print(f"정책 요약 생성 오류: {str(e)}")
+        results.append(item or PolicyEnhanceBatchItem(policy_id=policy_id, enhanced=False))
+    
+    return PolicyEnhanceBatchResponse(results=results)
+
 @router.get("/search/", response_model=List[PolicyDisplay])
-def search_policies(
+async def search_policies(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     q: str = Query(..., min_length=1),
     current_user: Optional[User] = Depends(get_current_user_optional),
+    policy_matcher: PolicyMatcher = Depends(get_policy_matcher),
+    lexical_index: Optional[LexicalIndex] = Depends(get_lexical_index),
+    summaries: bool = Query(True, description="false면 LLM 요약을 기다리지 않고 순위 결과를 바로 반환 (요약은 /enhance/batch로 채움)"),
 ) -> Any:
     """
-    사용자 친화적인 정책 검색 (벡터 검색 + LLM 요약)
+    사용자 친화적인 정책 검색 (정책명/벡터 검색 + LLM 요약)
     """
     # 사용자 프로필 정보 (로그인한 경우)
-    user_profile = None
-    if current_user:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
-        if profile:
-            user_profile = {
-                "age": profile.age,
-                "gender": profile.gender,
-                "employment_status": profile.employment_status,
-                "region": profile.region,
-                "is_disabled": profile.is_disabled,
-                "is_foreign": profile.is_foreign,
-                "family_status": profile.family_status
-            }
+    user_profile, profile_type_id = load_user_profile(current_user)
+    
+    # 같은 검색어 + 같은 프로필 유형의 결과는 캐시에서 반환 (프로필 유형이 없는 프로필 사용자는 캐시 미사용)
+    cache_key = None
+    index_version = get_index_version()
+    if user_profile is None or profile_type_id is not None:
+        cache_key = search_response_cache.make_key(q, profile_type_id)
+        cached = search_response_cache.get(cache_key, index_version)
+        if cached is not None:
+            saved_policy_ids = await db.run_sync(load_saved_policy_ids, current_user, [policy.id for policy in cached])
+            return [policy.model_copy(update={"is_saved": policy.id in saved_policy_ids}) for policy in cached]
     
     try:
-        # 벡터 검색 사용
-        query_embedding = policy_matcher.get_embedding(q)
-        search_results = policy_matcher.index.query(
-            vector=query_embedding,
-            top_k=10,
-            include_metadata=True
-        )
+        # 정책명 빠른 검색 → 없으면 벡터 검색 (+ 본문 n-gram 검색과 순위 결합)
+        matches = await run_in_threadpool(retrieve_policy_matches, q, policy_matcher, lexical_index)
         
-        # 저장된 정책 ID 목록 (로그인한 경우)
-        saved_policy_ids = set()
-        if current_user:
-            saved_policies = get_saved_policies(db, current_user.id)
-            saved_policy_ids = {p.policy_id for p in saved_policies}
+        policy_texts = {match.id: match.metadata.get("text", "") for match in matches}
+        # 검색 결과 중 저장한 정책 (로그인한 경우)
+        saved_policy_ids = await db.run_sync(load_saved_policy_ids, current_user, policy_texts)
+        if summaries:
+            # 미리 생성된 요약을 한 번에 조회하고, 없는 정책만 LLM으로 동시에 생성
+            descriptions = await describe_policies(db, policy_texts, user_profile)
+        else:
+            # 저장된 요약만 붙이고 나머지는 원문으로 반환
+            descriptions = await db.run_sync(get_stored_summaries, policy_texts)
         
-        # 결과 가공 및 동시에 모든 정책에 대해 LLM 요약 생성
         policies = []
+        # 요약이 시간 초과/실패한 정책 (응답은 캐시하지 않고 요약은 백그라운드에서 생성)
+        unsummarized = []
         
-        for match in search_results.matches:
-            # 페이지 번호 확인 (목차 페이지 건너뛰기)
+        for match in matches:
+            summary_result = descriptions.get(match.id)
             page = match.metadata.get("page", "0")
-            try:
-                page_num = int(page)
-                if page_num <= 20:  # 목차 페이지 건너뛰기
-                    continue
-            except (ValueError, TypeError):
-                pass
-                
             policy_text = match.metadata.get("text", "")
             
-            # 제목 추출
-            title = match.metadata.get("title", "") or policy_matcher.extract_title_from_text(policy_text)
+            # 적재 시 계산된 제목/카테고리 (없으면 본문에서 추출)
+            title, category = title_and_category(match.metadata)
             
-            # 카테고리 추출
-            category = match.metadata.get("category", "") or policy_matcher.extract_category(policy_text)
+            policy_fields = {
+                "id": match.id,
+                "title": title,
+                "content": policy_text,
+                "page": page,
+                "category": category,
+                "is_saved": match.id in saved_policy_ids
+            }
             
-            # 모든 정책에 대해 LLM 처리
-            try:
-                # LLM으로 정책 요약 생성 (동기적 처리)
-                summary_result = generate_user_friendly_policy_description(policy_text[:3000], user_profile)
-                
-                # PolicyDisplay 객체 생성
-                policy_info = PolicyDisplay(
-                    id=match.id,
-                    title=title,
-                    content=policy_text,
-                    page=page,
-                    category=category,
-                    is_saved=match.id in saved_policy_ids,
-                    # LLM으로 생성된 향상된 정보
-                    enhanced_summary=summary_result.get("summary", ""),
-                    enhanced_eligibility=summary_result.get("eligibility", []),
-                    enhanced_benefits=summary_result.get("benefits", []),
-                    enhanced_application=summary_result.get("application", "")
-                )
-                
-                policies.append(policy_info)
-                
-                # 최대 6개 정책만 처리
-                if len(policies) >= 6:
-                    break
-                    
-            except Exception as e:
-                # LLM 처리 실패 시 기본 정보만 포함
-                print(f"정책 요약 생성 오류: {str(e)}")
-                policy_info = PolicyDisplay(
-                    id=match.id,
-                    title=title,
-                    content=policy_text,
-                    page=page,
-                    category=category,
-                    is_saved=match.id in saved_policy_ids
-                )
-                policies.append(policy_info)
-                
-                # 최대 6개 정책만 처리
-                if len(policies) >= 6:
-                    break
+            policy_info = None
+            if summary_result is not None:
+                try:
+                    # LLM으로 생성된 향상된 정보 포함
+                    policy_info = PolicyDisplay(
+                        **policy_fields,
+                        enhanced_summary=summary_result.get("summary", ""),
+                        enhanced_eligibility=summary_result.get("eligibility", []),
+                        enhanced_benefits=summary_result.get("benefits", []),
+                        enhanced_application=summary_result.get("application", "")
+                    )
+                except Exception as e:
+                    print(f"정책 요약 생성 오류: {str(e)}")
+            
+            if policy_info is None:
+                # 요약이 늦거나 실패한 정책은 원문만 표시
+                unsummarized.append(match.id)
+                policy_info = PolicyDisplay(**policy_fields)
+            
+            policies.append(policy_info)
+        
+        if summaries and unsummarized:
+            # Celery 백엔드는 Redis 왕복이 있으므로 이벤트 루프 밖에서 실행
+            await run_in_threadpool(
+                job_queue.enqueue,
+                "generate_policy_summaries", unsummarized, dedup_key="summaries:" + ",".join(sorted(unsummarized))
+            )
+        
+        if cache_key is not None and not unsummarized:
+            # 사용자별 저장 여부는 빼고 캐시
+            search_response_cache.set(
+                cache_key,
+                index_version,
+                [policy.model_copy(update={"is_saved": False}) for policy in policies],
+            )
         
         return policies
         
+    except LLMUnavailableError:
+        # 게이트웨이가 호출하지 않고 거절한 경우는 503으로 응답 (main.py 예외 처리기)
+        raise
     except Exception as e:
         # 오류 발생 시 원인 로깅 후 예외 발생
         print(f"정책 검색 오류 상세: {str(e)}")
@@ -322,12 +355,13 @@ def recommend_policies_llm(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    policy_matcher: PolicyMatcher = Depends(get_policy_matcher),
 ) -> Any:
     """
     사용자 프로필 기반 맞춤형 정책 추천 (LLM 향상)
     """
     # 사용자 프로필 정보 가져오기
-    user_profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    user_profile = get_user_profile(current_user)
     if not user_profile:
         raise HTTPException(status_code=404, detail="프로필 정보가 없습니다")
     
@@ -343,11 +377,11 @@ def recommend_policies_llm(
     }
     
     try:
-        # 정책 추천 가져오기
-        recommendations = policy_matcher.recommend_policies(profile_dict, top_k=6)
+        # 정책 추천 가져오기 (프로필 유형별로 저장된 검색어/임베딩 재사용)
+        recommendations = recommend_for_profile(db, policy_matcher, profile_dict, user_profile.profile_type_id, top_k=6)
         
-        # 저장된 정책 ID 목록
-        saved_policy_ids = {p.policy_id for p in get_saved_policies(db, current_user.id)}
+        # 추천 정책 중 저장한 정책 ID
+        saved_policy_ids = get_saved_policy_ids(db, current_user.id, [rec.get("policy_id", "") for rec in recommendations])
         
         # 결과 가공
         result = []
@@ -365,6 +399,8 @@ def recommend_policies_llm(
             result.append(policy)
         
         return result
+    except LLMUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"정책 추천 중 오류 발생: {str(e)}")
 
@@ -375,7 +411,7 @@ def get_recommended_policies(
 ):
     """사용자 프로필 유형에 기반한 미리 계산된 추천 정책 가져오기"""
     # 사용자 프로필 가져오기
-    user_profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    user_profile = get_user_profile(current_user)
     
     if not user_profile or not user_profile.profile_type_id:
         raise HTTPException(status_code=404, detail="프로필 정보가 없습니다")
@@ -385,10 +421,8 @@ def get_recommended_policies(
         ProfileRecommendation.profile_type_id == user_profile.profile_type_id
     ).order_by(ProfileRecommendation.rank_order).all()
     
-    # 저장된 정책 ID 목록 가져오기
-    saved_policy_ids = {
-        p.policy_id for p in get_saved_policies(db, current_user.id)
-    }
+    # 추천 정책 중 저장한 정책 ID 가져오기
+    saved_policy_ids = get_saved_policy_ids(db, current_user.id, [rec.policy_id for rec in recommendations])
     
     # 반환 형식으로 변환
     result = []
@@ -404,14 +438,16 @@ def get_recommended_policies(
     
     return result
 
-@router.post("/refresh-recommendations/", status_code=status.HTTP_200_OK)
+@router.post("/refresh-recommendations/", status_code=status.HTTP_202_ACCEPTED)
 def refresh_recommended_policies(
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """사용자 추천 정책 강제 갱신"""
-    create_user_policy_recommendations(db, current_user.id)
-    return {"message": "추천 정책이 갱신되었습니다."}
+    """사용자 추천 정책 강제 갱신 (백그라운드 작업으로 실행, 상태는 /jobs/{job_id}에서 확인)"""
+    job_id = job_queue.enqueue(
+        "refresh_user_recommendations", current_user.id, dedup_key=f"recommendations:user:{current_user.id}",
+        owner_id=current_user.id
+    )
+    return {"message": "추천 정책 갱신을 시작했습니다.", "job_id": job_id}
 
 @router.post("/save/{policy_id}", status_code=status.HTTP_200_OK)
 def save_user_policy(
@@ -437,32 +473,43 @@ def unsave_user_policy(
 
 @router.get("/saved/", response_model=List[PolicyDisplay])
 def get_user_saved_policies(
+    response: Response,
+    page: CursorPage = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """사용자가 저장한 관심 정책 목록 가져오기"""
-    from app.services.vector_search import get_policy_by_id
+    """
+    사용자가 저장한 관심 정책 목록 가져오기 (최근 저장 순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    keys = [SortKey(SavedPolicy.saved_at), SortKey(SavedPolicy.id)]
+    saved_policies = page.finish(
+        page.apply(db.query(SavedPolicy).filter(SavedPolicy.user_id == current_user.id), keys).all(),
+        keys,
+        response
+    )
     
-    saved_policies = get_saved_policies(db, current_user.id)
+    # 저장된 정책을 한 번의 조회로 가져옴 (저장 순서 유지)
+    policies = get_policies_by_ids([saved.policy_id for saved in saved_policies])
     
     result = []
-    for saved in saved_policies:
-        policy_data = get_policy_by_id(saved.policy_id)
-        if policy_data:
-            result.append(PolicyDisplay(
-                id=saved.policy_id,
-                title=policy_data.get("title", "제목 없음"),
-                content=policy_data.get("content", ""),
-                page=policy_data.get("page"),
-                category=policy_data.get("category", "기타"),
-                is_saved=True
-            ))
+    for policy_data in policies:
+        result.append(PolicyDisplay(
+            id=policy_data["id"],
+            title=policy_data.get("title", "제목 없음"),
+            content=policy_data.get("content", ""),
+            page=policy_data.get("page"),
+            category=policy_data.get("category", "기타"),
+            is_saved=True
+        ))
     
     return result
 
 @router.get("/profiles/me/saved-policies", response_model=List[PolicyDisplay])
 def get_my_saved_policies_alias(
+    response: Response,
+    page: CursorPage = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return get_user_saved_policies(db, current_user)
+    return get_user_saved_policies(response, page, db, current_user)
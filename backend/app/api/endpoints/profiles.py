@@ -1,10 +1,13 @@
 from typing import Any, List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.api.deps import get_db, get_current_user
-from app.db.models import User, UserProfile, Policy, Notification
+from app.api.pagination import CursorPage, SortKey
+from app.db.models import User, UserProfile, Policy, Notification, ProfileRecommendation
+from app.services.policy_summaries import generate_user_friendly_policy_description
+from app.services.principal_cache import get_user_profile, principal_cache
 
 router = APIRouter()
 
@@ -28,7 +31,7 @@ def get_my_profile(
     """
     현재 사용자의 프로필 정보 조회
     """
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = get_user_profile(current_user)
     
     # 연령대 변환
     age_group = ""
@@ -126,6 +129,8 @@ def update_profile(
     
     db.commit()
     db.refresh(profile)
+    # 캐시된 인증 사용자(프로필 포함) 무효화
+    principal_cache.invalidate(profile.user_id)
     
     return {
         "message": "프로필 정보가 성공적으로 업데이트되었습니다."
@@ -145,18 +150,23 @@ def get_saved_policies(
 
 @router.get("/me/notifications")
 def get_notifications(
+    response: Response,
+    page: CursorPage = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> List:
     """
-    사용자 알림 목록 조회
+    사용자 알림 목록 조회 (최신순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
-    notifications = db.query(Notification).filter(
-        Notification.user_id == current_user.id
-    ).order_by(Notification.created_at.desc()).all()
+    keys = [SortKey(Notification.created_at), SortKey(Notification.id)]
+    notifications = page.apply(
+        db.query(Notification).filter(Notification.user_id == current_user.id),
+        keys
+    ).all()
     
     result = []
-    for notification in notifications:
+    for notification in page.finish(notifications, keys, response):
         result.append({
             "id": notification.id,
             "title": notification.title,
@@ -175,7 +185,7 @@ def get_recommended_policies(
 ):
     """사용자에게 추천된 정책 목록 가져오기"""
     # 프로필 정보 가져오기
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = get_user_profile(current_user)
     if not profile:
         raise HTTPException(status_code=404, detail="프로필 정보가 없습니다")
     
@@ -210,7 +220,7 @@ def get_recommended_policies(
             "original_content": rec.policy_content,
         }
         
-        # LLM 사용하여 사용자 친화적인 설명 생성
+        # LLM 사용하여 사용자 친화적인 설명 생성 (비슷한 프로필 사용자와 캐시 공유)
         user_friendly_info = generate_user_friendly_policy_description(
             rec.policy_content, user_profile
         )
@@ -0,0 +1,88 @@
+# app/api/pagination.py
+"""
+목록 API 공통 커서(키셋) 페이지네이션
+
+OFFSET 대신 정렬 키 (예: created_at, id)의 마지막 값 다음부터 조회하므로
+깊은 페이지에서도 조회 시간이 일정합니다. 커서는 마지막 항목의 정렬 키 값을 base64로 감싼
+불투명한 문자열이며, 다음 페이지가 있으면 X-Next-Cursor 응답 헤더로 전달합니다.
+(응답 본문은 기존처럼 목록 그대로 유지)
+
+    @router.get("/items", response_model=List[dict])
+    def list_items(response: Response, page: CursorPage = Depends(), ...):
+        keys = [SortKey(Item.created_at), SortKey(Item.id)]
+        rows = page.apply(db.query(Item).filter(...), keys).all()
+        return page.finish(rows, keys, response)
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class SortKey(NamedTuple):
+    """정렬 키 컬럼과 방향. 마지막 키는 고유한 값(기본 키)이어야 순서가 안정적입니다."""
+    column: Any
+    descending: bool = True
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """커서를 정렬 키 값 목록으로 변환 (형식이 맞지 않으면 400)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("정렬 키 수 불일치")
+        return [
+            datetime.fromisoformat(value) if key.column.type.python_type is datetime else key.column.type.python_type(value)
+            for key, value in zip(keys, values)
+        ]
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+def keyset_condition(keys: Sequence[SortKey], values: Sequence[Any]):
+    """정렬 순서상 커서 값 다음에 오는 행의 조건: (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ..."""
+    clauses = []
+    for position, key in enumerate(keys):
+        value = values[position]
+        after = key.column < value if key.descending else key.column > value
+        equal = [previous.column == values[index] for index, previous in enumerate(keys[:position])]
+        clauses.append(and_(*equal, after) if equal else after)
+    return or_(*clauses)
+
+class CursorPage:
+    """커서 페이지 요청 파라미터 (cursor, limit). 엔드포인트에서 Depends()로 사용합니다."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+    def apply(self, query, keys: Sequence[SortKey]):
+        """키셋 조건과 정렬을 적용하고, 다음 페이지 여부 확인을 위해 limit보다 1개 더 조회"""
+        if self.cursor:
+            query = query.filter(keyset_condition(keys, decode_cursor(self.cursor, keys)))
+        order_by = [key.column.desc() if key.descending else key.column.asc() for key in keys]
+        return query.order_by(*order_by).limit(self.limit + 1)
+
+    def finish(self, rows: List[Any], keys: Sequence[SortKey], response: Optional[Response] = None) -> List[Any]:
+        """limit을 넘는 행을 잘라내고, 다음 페이지가 있으면 커서를 응답 헤더에 설정"""
+        if len(rows) <= self.limit:
+            return rows
+
+        rows = rows[:self.limit]
+        if response is not None:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                [getattr(rows[-1], key.column.key) for key in keys]
+            )
+        return rows
@@ -40,6 +40,25 @@ class Settings(BaseSettings):
             return os.getenv("DATABASE_URL")
         return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DB}"
 
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URI(self) -> str:
+        """같은 DB의 비동기 드라이버 주소 (pymysql -> aiomysql, sqlite -> aiosqlite)"""
+        uri = self.SQLALCHEMY_DATABASE_URI
+        for sync_prefix, async_prefix in (
+            ("mysql+pymysql://", "mysql+aiomysql://"),
+            ("mysql://", "mysql+aiomysql://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if uri.startswith(sync_prefix):
+                return async_prefix + uri[len(sync_prefix):]
+        return uri
+
+    # DB 연결 풀 설정 (동기/비동기 엔진 각각 적용, recycle은 MySQL wait_timeout보다 짧게)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+
     # JWT 설정
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-for-dev")
     ALGORITHM: str = "HS256"
@@ -47,12 +66,75 @@ class Settings(BaseSettings):
     
     # OpenAI API 설정
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+    OPENAI_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+    # LLM 게이트웨이 설정 (분당 요청/토큰 한도는 0이면 제한 없음, 재시도 포함 호출 1건당 제한 시간)
+    OPENAI_REQUESTS_PER_MINUTE: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    OPENAI_TOKENS_PER_MINUTE: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    OPENAI_RETRY_BASE_SECONDS: float = float(os.getenv("OPENAI_RETRY_BASE_SECONDS", "0.5"))
+    OPENAI_RETRY_MAX_SECONDS: float = float(os.getenv("OPENAI_RETRY_MAX_SECONDS", "8"))
+    OPENAI_DEADLINE_SECONDS: float = float(os.getenv("OPENAI_DEADLINE_SECONDS", "30"))
+    # 연속 실패가 이 횟수에 이르면 회로를 열고, 이 시간(초) 동안 호출 없이 바로 실패 처리
+    OPENAI_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("OPENAI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    OPENAI_CIRCUIT_RESET_SECONDS: float = float(os.getenv("OPENAI_CIRCUIT_RESET_SECONDS", "30"))
+    # 검색 결과 LLM 요약 동시 호출 수와 요약 1건당 제한 시간 (초과 시 원문으로 표시)
+    LLM_SUMMARY_CONCURRENCY: int = int(os.getenv("LLM_SUMMARY_CONCURRENCY", "8"))
+    LLM_SUMMARY_TIMEOUT_SECONDS: float = float(os.getenv("LLM_SUMMARY_TIMEOUT_SECONDS", "8"))
     
     # Pinecone 설정
     PINECONE_API_KEY: Optional[str] = os.getenv("PINECONE_API_KEY")
     PINECONE_ENVIRONMENT: str = os.getenv("PINECONE_ENVIRONMENT", "us-west1-gcp")
     PINECONE_INDEX_NAME: str = os.getenv("PINECONE_INDEX_NAME", "labor-policy")
-    
+    PINECONE_INDEX_HOST: Optional[str] = os.getenv("PINECONE_INDEX_HOST")  # 설정 시 describe_index 호출 생략
+
+    # 벡터 검색 백엔드 설정 ("pinecone" 또는 "local")
+    VECTOR_BACKEND: str = os.getenv("VECTOR_BACKEND", "pinecone")
+    LOCAL_VECTOR_INDEX_PATH: str = os.getenv("LOCAL_VECTOR_INDEX_PATH", "data/vector_index.npz")
+    IVF_NPROBE: int = int(os.getenv("IVF_NPROBE", "8"))  # IVF 인덱스 검색 시 탐색할 클러스터 수
+
+    # 쿼리 임베딩 캐시 설정 (경로를 비우면 디스크 캐시 사용 안 함)
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", "data/embedding_cache.sqlite3")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "2048"))
+
+    # 정책 설명(LLM) 캐시 설정 (1단계 프로세스 내 LRU, 2단계 Redis 공유 저장소 - URL을 비우면 프로세스 내 저장소 사용)
+    DESCRIPTION_CACHE_MAX_ENTRIES: int = int(os.getenv("DESCRIPTION_CACHE_MAX_ENTRIES", "1024"))
+    DESCRIPTION_CACHE_TTL_SECONDS: float = float(os.getenv("DESCRIPTION_CACHE_TTL_SECONDS", "86400"))
+    DESCRIPTION_CACHE_REDIS_URL: str = os.getenv("DESCRIPTION_CACHE_REDIS_URL", "")
+
+    # 정책 검색 응답 캐시 설정 (SEARCH_INDEX_VERSION을 올리면 캐시된 검색 결과가 무효화됨)
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+    SEARCH_CACHE_TTL_SECONDS: float = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "600"))
+    SEARCH_INDEX_VERSION: str = os.getenv("SEARCH_INDEX_VERSION", "1")
+
+    # 인증 사용자 캐시 설정 (토큰의 사용자와 프로필을 워커 프로세스마다 TTL 동안 재사용 - 다른 워커의 프로필 수정은 TTL 후 반영)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
+    # 챗봇 답변 의미 캐시 설정 (질문 임베딩 코사인 유사도가 임계값 이상이면 저장된 답변 반환)
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+
+    # 챗봇 컨텍스트 설정 (검색할 후보 청크 수, 컨텍스트에 넣을 최대 토큰 수)
+    CHAT_CONTEXT_CANDIDATES: int = int(os.getenv("CHAT_CONTEXT_CANDIDATES", "8"))
+    CHAT_CONTEXT_TOKEN_BUDGET: int = int(os.getenv("CHAT_CONTEXT_TOKEN_BUDGET", "1500"))
+
+    # 백그라운드 작업 큐 ("local": API 프로세스 안의 스레드 풀, "celery": Redis 브로커 + celery_worker.py)
+    JOB_BACKEND: str = os.getenv("JOB_BACKEND", "local")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))  # local 백엔드의 동시 작업 수
+    JOB_HISTORY_MAX_ENTRIES: int = int(os.getenv("JOB_HISTORY_MAX_ENTRIES", "1000"))
+    CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+    CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
+    # 서버 워커(프로세스) 수 (uvicorn/gunicorn이 --workers 기본값으로 읽는 값, local 작업 큐는 1개에서만 사용 가능)
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # 운영 통계(/metrics/*) 조회 토큰 (X-Metrics-Token 헤더, 비워 두면 /metrics 비활성화)
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+
+    # 목록 API 커서 페이지 크기 (기본/최대)
+    PAGE_SIZE_DEFAULT: int = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+    PAGE_SIZE_MAX: int = int(os.getenv("PAGE_SIZE_MAX", "100"))
+
     # PDF 설정
     PDF_STORAGE_PATH: str = os.getenv("PDF_STORAGE_PATH", "data/policies")
     
@@ -0,0 +1,91 @@
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+def request_key(*parts: Any) -> str:
+    """요청 내용(모델, 메시지, 옵션 등)의 해시. 같은 내용의 요청은 같은 키가 됩니다."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    같은 키의 호출이 동시에 여러 번 들어오면 한 번만 실행하고 결과를 공유합니다.
+
+    do()는 스레드풀(동기) 경로용, ado()는 이벤트 루프(비동기) 경로용입니다.
+    실행이 끝나면 키를 지우므로 결과를 저장하지는 않습니다. (캐시는 호출하는 쪽에서)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # 이벤트 루프는 단일 스레드이므로 조회와 등록 사이에 다른 코루틴이 끼어들지 않음
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish_task(key, done))
+            self.executed += 1
+        else:
+            self.shared += 1
+
+        # 먼저 기다리던 호출자가 취소(시간 초과 등)되어도 공유 작업은 계속 실행
+        return await asyncio.shield(task)
+
+    def _finish_task(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 호출자가 모두 시간 초과로 빠진 경우에도 예외를 회수해 경고가 남지 않게 함
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.executed + self.shared
+        return {
+            "in_flight": len(self._calls) + len(self._tasks),
+            "executed": self.executed,
+            "shared": self.shared,
+            "shared_rate": self.shared / total if total else 0.0,
+        }
+
+# OpenAI 호출 공용 인스턴스
+openai_flight = SingleFlight()
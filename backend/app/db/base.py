@@ -1,12 +1,34 @@
+from typing import Any, AsyncIterator, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+def pool_options(url: str) -> Dict[str, Any]:
+    """연결 풀 설정 (SQLite는 파일 잠금으로 동시성이 제한되므로 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,  # MySQL wait_timeout 전에 연결 교체
+        "pool_pre_ping": True,
+    }
+
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **pool_options(settings.SQLALCHEMY_DATABASE_URI))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async def 엔드포인트용 비동기 엔진 (DB 왕복 중에도 이벤트 루프가 다른 요청을 처리)
+async_engine = create_async_engine(
+    settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+    **pool_options(settings.SQLALCHEMY_ASYNC_DATABASE_URI)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 # 의존성 주입을 위한 함수
@@ -15,4 +37,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """async def 엔드포인트용 세션. 동기 서비스 함수는 await db.run_sync(func, ...)로 호출합니다."""
+    async with AsyncSessionLocal() as db:
+        yield db
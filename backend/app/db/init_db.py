@@ -1,19 +1,34 @@
-# app/db/init_db.py 파일 생성
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+# app/db/init_db.py
+from pathlib import Path
 
-from app.core.config import settings
-from app.db.base import Base
-from app.db.models import User, Policy, PolicyChunk, UserProfile  # UserProfile 추가
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 
-# 데이터베이스 엔진 생성
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+from app.db.base import engine
 
-# 데이터베이스 테이블 생성
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 마이그레이션 도입 전(create_all로 만든 DB)의 스키마에 해당하는 리비전
+BASELINE_REVISION = "0001"
+
+def get_alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    return config
+
+# 데이터베이스 테이블 생성/업그레이드 (alembic upgrade head와 같음)
 def init_db():
-    Base.metadata.create_all(bind=engine)
-    print("데이터베이스 테이블이 생성되었습니다.")
+    config = get_alembic_config()
+    tables = set(inspect(engine).get_table_names())
+
+    if tables and "alembic_version" not in tables:
+        # create_all로 만든 기존 DB: 초기 스키마 리비전으로 표시한 뒤 이후 리비전을 적용
+        command.stamp(config, BASELINE_REVISION)
+        print("기존 데이터베이스를 초기 스키마 리비전으로 표시했습니다.")
+
+    command.upgrade(config, "head")
+    print("데이터베이스 마이그레이션이 완료되었습니다.")
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
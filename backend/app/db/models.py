@@ -1,6 +1,6 @@
 from typing import List, Optional
 from openai import BaseModel
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, DateTime, Float, JSON, UniqueConstraint
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Text, DateTime, Float, JSON, LargeBinary, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -28,7 +28,7 @@ class UserProfile(Base):
     __tablename__ = "user_profiles"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     age = Column(Integer, nullable=True)
     gender = Column(String(10), nullable=True)
     region = Column(String(50), nullable=True)
@@ -76,9 +76,25 @@ class PolicyChunk(Base):
     page_number = Column(Integer, nullable=True)
     chunk_index = Column(Integer, nullable=True)
     vector_id = Column(String(255), nullable=True)  # Pinecone에 저장된 벡터 ID
+    title = Column(String(255), nullable=True)  # 적재 시 추출한 정책 제목
+    category = Column(String(100), nullable=True)  # 적재 시 분류한 카테고리
     chunk_metadata = Column(JSON, nullable=True)  # 추가 메타데이터 (metadata에서 이름 변경)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class PolicySummary(Base):
+    """청크별로 미리 생성해 둔 사용자 친화적 정책 설명 (generate_policy_summaries.py로 생성)"""
+    __tablename__ = "policy_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    vector_id = Column(String(255), unique=True, index=True, nullable=False)  # Pinecone에 저장된 벡터 ID
+    content_hash = Column(String(64), nullable=False)  # 요약 생성에 사용한 본문/프롬프트 버전의 해시
+    summary = Column(Text, nullable=True)
+    eligibility = Column(JSON, nullable=True)
+    benefits = Column(JSON, nullable=True)
+    application = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class Notification(Base):
     __tablename__ = "notifications"
 
@@ -93,6 +109,11 @@ class Notification(Base):
     
     # 관계 설정
     user = relationship("User", back_populates="notifications")
+    
+    # 사용자별 최신순 알림 목록
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
 
 class Chat(Base):
     __tablename__ = "chats"
@@ -106,6 +127,11 @@ class Chat(Base):
     # 관계 설정
     user = relationship("User", back_populates="chats")
     messages = relationship("ChatMessage", back_populates="chat", cascade="all, delete-orphan")
+    
+    # 사용자별 최신순 채팅 목록
+    __table_args__ = (
+        Index("ix_chats_user_id_created_at", "user_id", "created_at"),
+    )
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
@@ -119,6 +145,11 @@ class ChatMessage(Base):
     
     # 관계 설정
     chat = relationship("Chat", back_populates="messages")
+    
+    # 채팅별 메시지 목록 / 첫 사용자 메시지 조회
+    __table_args__ = (
+        Index("ix_chat_messages_chat_id_created_at", "chat_id", "created_at"),
+    )
 
 class ProfileType(Base):
     __tablename__ = "profile_types"
@@ -140,6 +171,22 @@ class ProfileType(Base):
         ),
     )
 
+class ProfileQuery(Base):
+    """프로필 유형별로 생성해 둔 정책 검색어와 임베딩 (프롬프트 버전이 바뀌면 다시 생성)"""
+    __tablename__ = "profile_queries"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    profile_type_id = Column(Integer, ForeignKey("profile_types.id", ondelete="CASCADE"), unique=True, nullable=False)
+    prompt_version = Column(Integer, nullable=False)
+    query = Column(Text, nullable=False)
+    embedding_model = Column(String(100), nullable=False)
+    embedding = Column(LargeBinary, nullable=False)  # float32 배열
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 관계 설정
+    profile_type = relationship("ProfileType")
+
 class ProfileRecommendation(Base):
     __tablename__ = "profile_recommendations"
     
@@ -193,9 +240,10 @@ class SavedPolicy(Base):
     # 관계 설정
     user = relationship("User", back_populates="saved_policies")
     
-    # 중복 저장 방지를 위한 유니크 제약 조건
+    # 중복 저장 방지를 위한 유니크 제약 조건, 사용자별 최근 저장 순 목록
     __table_args__ = (
         UniqueConstraint('user_id', 'policy_id', name='unique_user_policy'),
+        Index("ix_saved_policies_user_id_saved_at", "user_id", "saved_at"),
     )
 
 class PolicyDisplay(BaseModel):
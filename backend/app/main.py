@@ -1,7 +1,13 @@
-from fastapi import FastAPI
+import math
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.endpoints import auth, policies, profiles, chat
+from app.api.endpoints import auth, policies, profiles, chat, jobs, metrics
+from app.services.clients import close_async_clients, close_clients, get_lexical_index
+from app.db.base import async_engine
+from app.services.jobs import job_queue
+from app.services.llm_gateway import LLMUnavailableError
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -17,15 +23,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
-    expose_headers=["Content-Type", "Authorization"],
+    expose_headers=["Content-Type", "Authorization", "X-Next-Cursor"],
     max_age=600,  # 프리플라이트 캐시 시간 (초)
 )
 
+@app.on_event("startup")
+def check_job_backend():
+    # local 작업 큐의 작업 상태는 프로세스 메모리에만 있으므로, 워커가 여러 개면
+    # /jobs/{job_id} 조회가 작업을 넣은 워커가 아닌 곳으로 가서 404가 됨
+    if settings.JOB_BACKEND == "local" and settings.WEB_CONCURRENCY > 1:
+        raise RuntimeError("JOB_BACKEND=local은 워커 1개에서만 사용할 수 있습니다. 여러 워커로 실행하려면 JOB_BACKEND=celery로 설정하세요.")
+
+@app.on_event("startup")
+def build_search_indexes():
+    # 정책명 빠른 검색을 위한 n-gram 역색인을 미리 생성
+    lexical_index = get_lexical_index()
+    if lexical_index is not None:
+        print(f"정책명/본문 역색인 생성 완료: 청크 {len(lexical_index)}개")
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    # 공유 OpenAI/Pinecone 연결 정리
+    await close_async_clients()
+    close_clients()
+    # 실행 중인 백그라운드 작업 정리
+    job_queue.shutdown()
+    # 비동기 DB 연결 풀 정리
+    await async_engine.dispose()
+
+@app.exception_handler(LLMUnavailableError)
+async def llm_unavailable_handler(request: Request, exc: LLMUnavailableError):
+    # OpenAI 장애/호출 한도 초과 시 오래 기다리지 않고 바로 503 반환
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"AI 서비스를 일시적으로 사용할 수 없습니다: {str(exc)}"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
 # 라우터 등록
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["인증"])
 app.include_router(policies.router, prefix=f"{settings.API_V1_STR}/policies", tags=["정책"])
 app.include_router(profiles.router, prefix=f"{settings.API_V1_STR}/profiles", tags=["프로필"])
 app.include_router(chat.router, prefix=f"{settings.API_V1_STR}/chat", tags=["챗봇"])
+app.include_router(jobs.router, prefix=f"{settings.API_V1_STR}/jobs", tags=["작업"])
+app.include_router(metrics.router, prefix="/metrics", tags=["운영 통계"], include_in_schema=False)
 
 @app.get("/health")
 def health_check():
@@ -0,0 +1,69 @@
+# app/scripts/backfill_chunk_metadata.py
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+from tqdm import tqdm
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.db.models import PolicyChunk
+from app.services.clients import get_pinecone_client
+from app.services.ingestion import is_front_matter
+from app.services.policy_metadata import category_classifier, extract_title_from_text
+
+FETCH_BATCH_SIZE = 100
+
+def backfill_chunk_metadata():
+    """이미 업로드된 Pinecone 벡터에 목차 여부(is_toc)와 제목/카테고리 메타데이터를 기록"""
+    index = get_pinecone_client().Index(settings.PINECONE_INDEX_NAME)
+
+    vector_ids = []
+    for id_batch in index.list():
+        vector_ids.extend(id_batch)
+
+    updated = 0
+    flagged = 0
+    for start in tqdm(range(0, len(vector_ids), FETCH_BATCH_SIZE)):
+        result = index.fetch(ids=vector_ids[start:start + FETCH_BATCH_SIZE])
+        vectors = list(result.vectors.items())
+        texts = [(vector.metadata or {}).get("text", "") for _, vector in vectors]
+        categories = category_classifier.classify_batch(texts)
+
+        for (vector_id, vector), text, category in zip(vectors, texts, categories):
+            metadata = vector.metadata or {}
+            computed = {
+                "is_toc": is_front_matter(metadata.get("page")),
+                "title": extract_title_from_text(text),
+                "category": category,
+            }
+            flagged += computed["is_toc"]
+            changed = {key: value for key, value in computed.items() if metadata.get(key) != value}
+            if not changed:
+                continue
+            index.update(id=vector_id, set_metadata=changed)
+            updated += 1
+
+    print(f"벡터 {len(vector_ids)}개 중 목차 청크 {flagged}개, 메타데이터 갱신 {updated}개")
+
+def backfill_policy_chunks():
+    """DB에 저장된 청크(PolicyChunk) 중 제목/카테고리가 비어 있는 행을 채움"""
+    db = SessionLocal()
+    try:
+        chunks = db.query(PolicyChunk).filter(PolicyChunk.title.is_(None)).all()
+        categories = category_classifier.classify_batch([chunk.content or "" for chunk in chunks])
+        for chunk, category in zip(chunks, categories):
+            chunk.title = extract_title_from_text(chunk.content or "")
+            chunk.category = category
+        db.commit()
+        print(f"DB 청크 {len(chunks)}개의 제목/카테고리 저장")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    backfill_chunk_metadata()
+    backfill_policy_chunks()
@@ -0,0 +1,150 @@
+# app/scripts/benchmark_async_db.py
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="동기 세션을 쓰는 async 엔드포인트(기존)와 AsyncSession 엔드포인트의 동시 요청 처리량 비교"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="방식별 전체 요청 수")
+    # 기존 방식은 동시 요청 수가 연결 풀 크기(SQLite 기본 5+10)를 넘으면 풀 대기로 이벤트 루프가 멈추므로 그 이하로 측정
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="SQL 문마다 추가할 DB 왕복 지연 (네트워크 MySQL 가정)")
+    parser.add_argument("--page-size", type=int, default=20)
+    return parser.parse_args()
+
+args = parse_args()
+
+# 엔진은 import 시점에 설정으로 만들어지므로 app 모듈보다 먼저 임시 DB를 지정
+tmp_dir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{tmp_dir.name}/benchmark.sqlite3"
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.api.endpoints import chat
+from app.api.pagination import CursorPage, SortKey
+from app.db.base import Base, SessionLocal, async_engine, engine, get_db
+from app.db.models import Chat, ChatMessage, User
+
+legacy_router = APIRouter()
+
+@legacy_router.get("/{chat_id}/messages")
+async def legacy_get_chat_messages(
+    chat_id: int,
+    response: Response,
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """기존 구현: async def 안에서 동기 세션으로 조회 (DB 왕복 동안 이벤트 루프가 멈춤)"""
+    chat_row = db.query(Chat).filter(Chat.id == chat_id, Chat.user_id == current_user.id).first()
+    if not chat_row:
+        raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
+
+    keys = [SortKey(ChatMessage.created_at, descending=False), SortKey(ChatMessage.id, descending=False)]
+    messages = page.apply(db.query(ChatMessage).filter(ChatMessage.chat_id == chat_id), keys).all()
+    return [
+        {"id": message.id, "content": message.content, "is_user": message.is_user == 1, "created_at": message.created_at.isoformat()}
+        for message in page.finish(messages, keys, response)
+    ]
+
+def add_latency(latency_seconds: float):
+    """SQL 문마다 드라이버에서 지연을 추가 (동기 드라이버는 호출한 스레드, aiosqlite는 전용 스레드에서 대기)"""
+
+    def on_statement(statement):
+        time.sleep(latency_seconds)
+
+    @event.listens_for(engine, "connect")
+    def on_sync_connect(dbapi_connection, connection_record):
+        dbapi_connection.set_trace_callback(on_statement)
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def on_async_connect(dbapi_connection, connection_record):
+        dbapi_connection.run_async(lambda connection: connection.set_trace_callback(on_statement))
+
+def seed(messages: int) -> tuple:
+    """메시지가 있는 채팅 하나를 가진 사용자 생성 (사용자, 채팅 ID)"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(email="bench@example.com", hashed_password="x", full_name="bench")
+    db.add(user)
+    db.flush()
+    chat_row = Chat(user_id=user.id, title="벤치마크")
+    db.add(chat_row)
+    db.flush()
+    start = datetime(2024, 1, 1)
+    db.add_all([
+        ChatMessage(chat_id=chat_row.id, is_user=1 - i % 2, content=f"{i}번째 메시지", created_at=start + timedelta(seconds=i))
+        for i in range(messages)
+    ])
+    db.commit()
+    chat_id = chat_row.id
+    db.refresh(user)
+    db.expunge(user)
+    db.close()
+    return user, chat_id
+
+async def run_load(client: httpx.AsyncClient, url: str, total: int, concurrency: int):
+    """(초당 요청 수, p50 ms, p99 ms)"""
+    timings = []
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return total / elapsed, float(np.percentile(timings, 50)), float(np.percentile(timings, 99))
+
+async def main():
+    user, chat_id = seed(args.page_size * 2)
+    add_latency(args.latency_ms / 1000)
+
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/chat")
+    app.include_router(legacy_router, prefix="/legacy")
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 두 방식이 같은 결과를 반환하는지 확인
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy = (await client.get(f"/legacy/{chat_id}/messages?limit={args.page_size}")).json()
+        ported = (await client.get(f"/chat/{chat_id}/messages?limit={args.page_size}")).json()
+        assert [m["id"] for m in legacy] == [m["id"] for m in ported]
+
+        print(f"요청 {args.requests}개, SQL 문당 지연 {args.latency_ms}ms, 페이지 크기 {args.page_size}")
+        print(f"{'conc':>5}{'sync req/s':>12}{'p50':>8}{'p99':>8}{'async req/s':>13}{'p50':>8}{'p99':>8}")
+        for concurrency in args.concurrency:
+            sync_result = await run_load(client, f"/legacy/{chat_id}/messages?limit={args.page_size}", args.requests, concurrency)
+            async_result = await run_load(client, f"/chat/{chat_id}/messages?limit={args.page_size}", args.requests, concurrency)
+            print(f"{concurrency:>5}{sync_result[0]:>12.1f}{sync_result[1]:>8.1f}{sync_result[2]:>8.1f}"
+                  f"{async_result[0]:>13.1f}{async_result[1]:>8.1f}{async_result[2]:>8.1f}")
+
+    await async_engine.dispose()
+    engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    tmp_dir.cleanup()
@@ -0,0 +1,125 @@
+# app/scripts/benchmark_chat_list.py
+
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+import numpy as np
+from fastapi import Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.endpoints.chat import list_user_chats, make_chat_title
+from app.api.pagination import NEXT_CURSOR_HEADER, CursorPage
+from app.db.base import Base
+from app.db.models import Chat, ChatMessage, User
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+def legacy_chat_list(db, user_id: int):
+    """기존 구현: 채팅 목록 조회 후 채팅마다 첫 사용자 메시지를 따로 조회 (N+1)"""
+    chats = db.query(Chat).filter(Chat.user_id == user_id).order_by(Chat.created_at.desc()).all()
+    result = []
+    for chat in chats:
+        first_message = db.query(ChatMessage)\
+            .filter(ChatMessage.chat_id == chat.id, ChatMessage.is_user == 1)\
+            .order_by(ChatMessage.created_at).first()
+        title = chat.title
+        if first_message and not title:
+            title = make_chat_title(first_message.content)
+        result.append({"id": chat.id, "title": title, "created_at": chat.created_at.isoformat()})
+    return result
+
+def seed(db, chat_count: int, messages_per_chat: int) -> int:
+    """채팅 chat_count개를 가진 사용자 생성 (절반은 제목 없이 첫 메시지로 제목 표시)"""
+    user = User(email=f"bench-{chat_count}-{time.time_ns()}@example.com", hashed_password="x", full_name="bench")
+    db.add(user)
+    db.flush()
+
+    start = datetime(2024, 1, 1)
+    for i in range(chat_count):
+        created_at = start + timedelta(minutes=i)
+        chat = Chat(user_id=user.id, title=None if i % 2 else f"대화 {i}", created_at=created_at)
+        db.add(chat)
+        db.flush()
+        db.add_all([
+            ChatMessage(
+                chat_id=chat.id,
+                is_user=1 if j % 2 == 0 else 0,
+                content=f"{i}번째 대화의 {j}번째 메시지입니다. 청년 고용 지원 정책에 대해 알려주세요.",
+                created_at=created_at + timedelta(seconds=j)
+            )
+            for j in range(messages_per_chat)
+        ])
+    db.commit()
+    return user.id
+
+def measure(counter: QueryCounter, func, repeat: int):
+    """(호출 1회당 쿼리 수, 지연 시간 중앙값 ms)"""
+    counter.count = 0
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return counter.count // repeat, float(np.median(timings))
+
+def run_benchmark(database_url: str, counts: list, messages_per_chat: int, page_size: int, repeat: int):
+    if database_url.startswith("sqlite"):
+        engine = create_engine(database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    counter = QueryCounter(engine)
+
+    print(f"채팅당 메시지 {messages_per_chat}개, 페이지 크기 {page_size}, 중앙값 {repeat}회 기준")
+    print(f"{'chats':>6}{'legacy q':>10}{'legacy(ms)':>12}{'page q':>8}{'page(ms)':>10}{'all pages q':>13}{'all(ms)':>10}")
+    for count in counts:
+        user_id = seed(db, count, messages_per_chat)
+
+        legacy_queries, legacy_ms = measure(counter, lambda: legacy_chat_list(db, user_id), repeat)
+        page_queries, page_ms = measure(counter, lambda: list_user_chats(db, user_id, CursorPage(None, page_size)), repeat)
+
+        def all_pages():
+            cursor, pages = None, []
+            while True:
+                response = Response()
+                pages.extend(list_user_chats(db, user_id, CursorPage(cursor, page_size), response))
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if cursor is None:
+                    return pages
+
+        # 페이지를 끝까지 넘긴 결과가 기존 구현과 같은지 확인
+        assert all_pages() == legacy_chat_list(db, user_id)
+        all_queries, all_ms = measure(counter, all_pages, repeat)
+        print(f"{count:>6}{legacy_queries:>10}{legacy_ms:>12.2f}{page_queries:>8}{page_ms:>10.2f}"
+              f"{all_queries:>13}{all_ms:>10.2f}")
+
+    db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="채팅 수에 따른 채팅 목록 조회 쿼리 수와 지연 시간 비교 (기존 N+1 대비)")
+    parser.add_argument("--database-url", default="sqlite://", help="벤치마크용 DB (기본: 메모리 SQLite, 운영 DB 사용 금지)")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 100, 200, 500])
+    parser.add_argument("--messages-per-chat", type=int, default=6)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.database_url, args.counts, args.messages_per_chat, args.page_size, args.repeat)
@@ -0,0 +1,67 @@
+# app/scripts/benchmark_saved_policies.py
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from app.services import clients
+from app.services import vector_search
+from app.services.vector_store import LocalVectorIndex
+
+class SimulatedRemoteIndex:
+    """로컬 인덱스에 요청당 네트워크 왕복 지연을 더해 원격 인덱스를 흉내냄"""
+
+    def __init__(self, index, rtt_ms: float):
+        self.index = index
+        self.rtt_seconds = rtt_ms / 1000
+
+    def fetch(self, ids, **kwargs):
+        time.sleep(self.rtt_seconds)
+        return self.index.fetch(ids=ids, **kwargs)
+
+def make_index(size: int) -> LocalVectorIndex:
+    rng = np.random.default_rng(0)
+    ids = [f"chunk-{i}" for i in range(size)]
+    metadata = [{"text": f"정책 {i}\n정책 내용", "page": str(i)} for i in range(size)]
+    return LocalVectorIndex(ids, rng.normal(size=(size, 8)).astype(np.float32), metadata)
+
+def time_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+def run_benchmark(counts: list, rtt_ms: float, repeat: int):
+    local_index = make_index(max(counts) * 2)
+    index = SimulatedRemoteIndex(local_index, rtt_ms) if rtt_ms > 0 else local_index
+
+    # 벤치마크 동안 설정된 백엔드 대신 준비한 인덱스를 사용
+    clients.get_vector_index = lambda: index
+    vector_search.get_vector_index = clients.get_vector_index
+
+    print(f"요청당 왕복 지연 {rtt_ms}ms 가정, 중앙값 {repeat}회 기준")
+    print(f"{'saved':>6}{'per-id(ms)':>14}{'bulk(ms)':>12}{'speedup':>10}")
+    for count in counts:
+        policy_ids = local_index.ids[:count]
+
+        per_id = time_ms(lambda: [vector_search.get_policy_by_id(policy_id) for policy_id in policy_ids], repeat)
+        bulk = time_ms(lambda: vector_search.get_policies_by_ids(policy_ids), repeat)
+        print(f"{count:>6}{per_id:>14.2f}{bulk:>12.2f}{per_id / bulk if bulk else 0:>9.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 정책 수에 따른 개별 조회 대비 일괄 조회 지연 시간 비교")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 5, 10, 20, 40, 80])
+    parser.add_argument("--rtt-ms", type=float, default=30.0, help="원격 인덱스 요청당 왕복 지연 (0이면 로컬 인덱스)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.counts, args.rtt_ms, args.repeat)
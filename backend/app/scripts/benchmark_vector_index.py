@@ -0,0 +1,82 @@
+# app/scripts/benchmark_vector_index.py
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from app.services.vector_store import LocalVectorIndex, IVFVectorIndex, load_vector_index
+
+def make_synthetic_corpus(size: int, dim: int, n_topics: int = 200, seed: int = 0):
+    """주제별로 모여 있는 임베딩과 비슷한 분포의 합성 벡터 생성"""
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(n_topics, dim)).astype(np.float32)
+    labels = rng.integers(n_topics, size=size)
+    embeddings = 0.4 * topics[labels] + rng.normal(size=(size, dim)).astype(np.float32)
+    ids = [f"chunk-{i}" for i in range(size)]
+    metadata = [{"text": "", "page": str(i)} for i in range(size)]
+    return ids, embeddings, metadata
+
+def measure(index, queries: np.ndarray, top_k: int, **query_kwargs):
+    """쿼리별 결과 ID와 지연 시간(ms) 측정"""
+    results = []
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        response = index.query(vector=query, top_k=top_k, **query_kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([match.id for match in response.matches])
+    return results, np.array(latencies)
+
+def recall_at_k(results, ground_truth) -> float:
+    hits = sum(len(set(found) & set(expected)) for found, expected in zip(results, ground_truth))
+    total = sum(len(expected) for expected in ground_truth)
+    return hits / total if total else 0.0
+
+def run_benchmark(input_path: str, size: int, dim: int, n_queries: int, top_k: int, nlist: int, nprobes: list):
+    if input_path:
+        source = load_vector_index(input_path)
+        ids, embeddings, metadata = source.ids, source.matrix, source.metadata
+    else:
+        ids, embeddings, metadata = make_synthetic_corpus(size, dim)
+
+    rng = np.random.default_rng(1)
+    query_rows = rng.choice(len(ids), size=min(n_queries, len(ids)), replace=False)
+    queries = embeddings[query_rows] + 0.5 * rng.normal(size=(len(query_rows), embeddings.shape[1])).astype(np.float32)
+
+    exact = LocalVectorIndex(ids, embeddings, metadata)
+    build_start = time.perf_counter()
+    ivf = IVFVectorIndex.build(ids, embeddings, metadata, nlist=nlist)
+    build_seconds = time.perf_counter() - build_start
+
+    ground_truth, exact_latencies = measure(exact, queries, top_k)
+
+    print(f"벡터 {len(ids)}개, 차원 {embeddings.shape[1]}, 쿼리 {len(queries)}개, top_k={top_k}")
+    print(f"IVF 인덱스 생성 시간: {build_seconds:.2f}s (nlist={ivf.nlist})")
+    print(f"{'index':<16}{'recall@k':>10}{'p50(ms)':>10}{'p99(ms)':>10}")
+    print(f"{'exact':<16}{1.0:>10.3f}{np.percentile(exact_latencies, 50):>10.3f}{np.percentile(exact_latencies, 99):>10.3f}")
+
+    for nprobe in nprobes:
+        results, latencies = measure(ivf, queries, top_k, nprobe=nprobe)
+        label = f"ivf nprobe={nprobe}"
+        print(f"{label:<16}{recall_at_k(results, ground_truth):>10.3f}"
+              f"{np.percentile(latencies, 50):>10.3f}{np.percentile(latencies, 99):>10.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전수 검색 대비 IVF 인덱스의 recall@k와 지연 시간 비교")
+    parser.add_argument("--input", help="벤치마크할 인덱스 파일 (없으면 합성 데이터 사용)")
+    parser.add_argument("--size", type=int, default=50000, help="합성 벡터 수")
+    parser.add_argument("--dim", type=int, default=1536, help="합성 벡터 차원")
+    parser.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=256)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    run_benchmark(args.input, args.size, args.dim, args.queries, args.top_k, args.nlist, args.nprobe)
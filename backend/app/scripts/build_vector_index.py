@@ -0,0 +1,44 @@
+# app/scripts/build_vector_index.py
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+from app.core.config import settings
+from app.services.vector_store import IVFVectorIndex, load_vector_index
+
+def build_vector_index(input_path: str, output_path: str, nlist: int, nprobe: int, append_paths: list):
+    """로컬 인덱스 파일로부터 IVF 인덱스를 생성하고, 추가 문서의 벡터를 삽입하여 저장"""
+    source = load_vector_index(input_path)
+
+    if isinstance(source, IVFVectorIndex):
+        # 이미 IVF 인덱스면 기존 클러스터를 유지하고 벡터만 추가
+        index = source
+        index.nprobe = nprobe
+    else:
+        print(f"{len(source)}개 벡터로 IVF 인덱스를 생성합니다 (nlist={nlist})...")
+        index = IVFVectorIndex.build(source.ids, source.matrix, source.metadata, nlist=nlist, nprobe=nprobe)
+
+    # 새 문서(연도별 개정판, 지역별 안내서 등)의 벡터를 점진적으로 삽입
+    for append_path in append_paths:
+        extra = load_vector_index(append_path)
+        index.add(extra.ids, extra.matrix, extra.metadata)
+        print(f"{append_path}에서 {len(extra)}개 벡터를 추가했습니다.")
+
+    index.save(output_path)
+    print(f"IVF 인덱스가 저장되었습니다: {output_path} (벡터 {len(index)}개, 클러스터 {index.nlist}개)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IVF 근사 최근접 이웃 인덱스 생성")
+    parser.add_argument("--input", default=settings.LOCAL_VECTOR_INDEX_PATH, help="원본 인덱스 파일")
+    parser.add_argument("--output", default=settings.LOCAL_VECTOR_INDEX_PATH, help="저장할 인덱스 파일")
+    parser.add_argument("--nlist", type=int, default=64, help="클러스터 수")
+    parser.add_argument("--nprobe", type=int, default=settings.IVF_NPROBE, help="기본 탐색 클러스터 수")
+    parser.add_argument("--append", nargs="*", default=[], help="추가로 삽입할 인덱스 파일 목록")
+    args = parser.parse_args()
+
+    build_vector_index(args.input, args.output, args.nlist, args.nprobe, args.append)
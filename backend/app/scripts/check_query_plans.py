@@ -0,0 +1,231 @@
+# app/scripts/check_query_plans.py
+
+import re
+import sys
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+from alembic import command
+from alembic.script import ScriptDirectory
+from fastapi import Response
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api.endpoints.chat import list_user_chats
+from app.api.endpoints.profiles import get_notifications
+from app.api.pagination import CursorPage, SortKey
+from app.db.base import Base
+from app.db.init_db import get_alembic_config
+from app.db.models import (
+    Chat,
+    ChatMessage,
+    Notification,
+    ProfileRecommendation,
+    ProfileType,
+    RecommendedPolicy,
+    SavedPolicy,
+    User,
+    UserProfile,
+)
+from app.services.policy_service import get_user_recommended_policies
+from app.services.principal_cache import PrincipalCache
+
+# 주요 조회용 인덱스를 추가하는 리비전 (alembic/versions/0002_hot_path_indexes.py)
+INDEX_REVISION = "0002"
+
+def get_script() -> ScriptDirectory:
+    return ScriptDirectory.from_config(get_alembic_config())
+
+class Sample:
+    """실행 계획을 확인할 때 사용할 시드 데이터의 ID"""
+    user = None
+    chat_id = None
+    profile_type_id = None
+
+def saved_policies_page(db, sample):
+    # /policies/saved/ 의 저장 정책 페이지 조회 (정책 본문은 벡터 인덱스에서 가져오므로 DB 조회만 확인)
+    keys = [SortKey(SavedPolicy.saved_at), SortKey(SavedPolicy.id)]
+    page = CursorPage(None, 20)
+    return page.apply(db.query(SavedPolicy).filter(SavedPolicy.user_id == sample.user.id), keys).all()
+
+def chat_messages_page(db, sample):
+    # /chat/{id}/messages 의 메시지 페이지 조회 (엔드포인트는 AsyncSession을 쓰므로 같은 쿼리를 동기 세션으로 실행)
+    keys = [SortKey(ChatMessage.created_at, descending=False), SortKey(ChatMessage.id, descending=False)]
+    page = CursorPage(None, 20)
+    return db.scalars(page.apply(select(ChatMessage).where(ChatMessage.chat_id == sample.chat_id), keys)).all()
+
+def chat_list_next_page(db, sample):
+    response = Response()
+    list_user_chats(db, sample.user.id, CursorPage(None, 5), response)
+    return list_user_chats(db, sample.user.id, CursorPage(response.headers["X-Next-Cursor"], 5))
+
+# (이름, 실행할 코드) - 요청마다 실행되는 조회
+HOT_PATHS = [
+    ("principal", lambda db, s: PrincipalCache()._fetch(db, s.user.id)),
+    ("chat_list", lambda db, s: list_user_chats(db, s.user.id, CursorPage(None, 20))),
+    ("chat_list_next_page", chat_list_next_page),
+    ("chat_messages", chat_messages_page),
+    ("notifications", lambda db, s: get_notifications(Response(), CursorPage(None, 20), db, s.user)),
+    ("saved_policies", saved_policies_page),
+    ("user_recommended_policies", lambda db, s: get_user_recommended_policies(db, s.user.id)),
+    ("profile_recommendations", lambda db, s: db.query(ProfileRecommendation).filter(
+        ProfileRecommendation.profile_type_id == s.profile_type_id
+    ).order_by(ProfileRecommendation.rank_order).all()),
+]
+
+def seed(db, users: int) -> Sample:
+    """사용자별 채팅/메시지/알림/저장 정책/추천 정책이 있는 DB 생성"""
+    start = datetime(2024, 1, 1)
+    profile_types = []
+    for i in range(5):
+        profile_type = ProfileType(
+            age_group="청년", gender="남성" if i % 2 else "여성", employment_status=f"상태{i}",
+            is_disabled=False, is_foreign=False, family_status="해당 없음"
+        )
+        db.add(profile_type)
+        profile_types.append(profile_type)
+    db.flush()
+    for profile_type in profile_types:
+        db.add_all([
+            ProfileRecommendation(
+                profile_type_id=profile_type.id, policy_id=f"policy-{rank}", policy_title="정책",
+                policy_content="내용", rank_order=rank
+            )
+            for rank in range(1, 6)
+        ])
+
+    sample = Sample()
+    for i in range(users):
+        user = User(email=f"plan-{i}@example.com", hashed_password="x", full_name=f"사용자{i}")
+        db.add(user)
+        db.flush()
+        profile_type = profile_types[i % len(profile_types)]
+        db.add(UserProfile(user_id=user.id, age=30, profile_type_id=profile_type.id))
+        for j in range(10):
+            created_at = start + timedelta(days=i, minutes=j)
+            chat = Chat(user_id=user.id, title=None if j % 2 else f"대화 {j}", created_at=created_at)
+            db.add(chat)
+            db.flush()
+            db.add_all([
+                ChatMessage(chat_id=chat.id, is_user=1 - k % 2, content=f"메시지 {k}", created_at=created_at + timedelta(seconds=k))
+                for k in range(6)
+            ])
+            db.add(Notification(user_id=user.id, title=f"알림 {j}", content="내용", created_at=created_at))
+        db.add_all([SavedPolicy(user_id=user.id, policy_id=f"policy-{j}", saved_at=start + timedelta(minutes=j)) for j in range(5)])
+        db.add_all([
+            RecommendedPolicy(user_id=user.id, policy_id=f"policy-{j}", policy_title="정책", policy_content="내용", relevance_score=j)
+            for j in range(5)
+        ])
+        if i == users // 2:
+            sample.user, sample.chat_id, sample.profile_type_id = user, chat.id, profile_type.id
+    db.commit()
+    db.refresh(sample.user)
+    return sample
+
+def capture_statements(engine, db, func, sample) -> list:
+    """func 실행 중 DB에 보낸 SELECT 문과 파라미터"""
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        func(db, sample)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return statements
+
+def table_aliases(statement: str, tables: set) -> dict:
+    """실행 계획에 나오는 이름 -> 테이블 (SQLAlchemy는 "user_profiles AS user_profiles_1" 처럼 별칭을 붙임)"""
+    aliases = {table: table for table in tables}
+    for table, alias in re.findall(r"[`\"]?(\w+)[`\"]? AS [`\"]?(\w+)[`\"]?", statement):
+        if table in tables:
+            aliases[alias] = table
+    return aliases
+
+def resolve_table(name: str, aliases: dict):
+    """테이블 또는 테이블 별칭이면 테이블 이름, 서브쿼리(anon_1 등)면 None"""
+    name = name.strip("`\"")
+    if name in aliases:
+        return aliases[name]
+    base = re.sub(r"_\d+$", "", name)
+    return base if base in aliases.values() else None
+
+def full_scans(connection, statement, parameters, tables: set) -> tuple:
+    """(전체 스캔한 테이블, 실행 계획 요약)"""
+    aliases = table_aliases(statement, tables)
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+        plan = [row[3] for row in rows]
+        scanned = []
+        for detail in plan:
+            words = [word for word in detail.split() if word != "TABLE"]
+            if words[0] not in ("SCAN", "SEARCH") or len(words) < 2:
+                continue
+            table = resolve_table(words[1], aliases)
+            # "SCAN chats" 는 전체 스캔, "SCAN chats USING INDEX ..." 는 인덱스 순회
+            # "USING AUTOMATIC ... INDEX" 는 쿼리마다 테이블 전체를 읽어 임시 인덱스를 만드는 것이므로 전체 스캔
+            if table and ("AUTOMATIC" in detail or (words[0] == "SCAN" and "INDEX" not in detail)):
+                scanned.append(table)
+        return scanned, plan
+
+    rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters).mappings().fetchall()
+    plan = [f"{row['table']}: {row['type']} {row['key'] or ''} {row['Extra'] or ''}".strip() for row in rows]
+    scanned = [resolve_table(row["table"] or "", aliases) for row in rows if row["type"] == "ALL"]
+    return [table for table in scanned if table], plan
+
+def run_check(database_url: str, users: int, revision: str = "head") -> bool:
+    config = get_alembic_config()
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    command.upgrade(config, revision)
+
+    engine = create_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    sample = seed(db, users)
+    if engine.dialect.name == "mysql":
+        # 통계를 갱신해야 작은 테이블에서도 실제 운영과 비슷한 계획이 나옴
+        with engine.connect() as connection:
+            for table in Base.metadata.tables:
+                connection.execute(text(f"ANALYZE TABLE {table}"))
+
+    tables = set(Base.metadata.tables)
+    ok = True
+    with engine.connect() as connection:
+        for name, func in HOT_PATHS:
+            for statement, parameters in capture_statements(engine, db, func, sample):
+                scanned, plan = full_scans(connection, statement, parameters, tables)
+                status = "FAIL" if scanned else "ok"
+                ok = ok and not scanned
+                print(f"[{status}] {name}" + (f" - 전체 스캔: {', '.join(scanned)}" if scanned else ""))
+                for line in plan:
+                    print(f"       {line}")
+
+    db.close()
+    engine.dispose()
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시드 데이터를 넣은 DB에서 주요 조회의 실행 계획을 확인하고, 전체 스캔이 있으면 실패")
+    parser.add_argument("--database-url", help="확인용 빈 DB (기본: 임시 SQLite 파일, 운영 DB 사용 금지)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--self-test", action="store_true", help=f"인덱스 리비전({INDEX_REVISION}) 적용 전 스키마에서 확인이 실패하는지 검사")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/query_plans.sqlite3"
+        if args.self_test:
+            # 인덱스가 없는 스키마에서도 통과하면 검사가 전체 스캔을 놓치고 있는 것
+            if run_check(database_url, args.users, get_script().get_revision(INDEX_REVISION).down_revision):
+                print(f"자체 검사 실패: {INDEX_REVISION} 적용 전 스키마에서 전체 스캔을 찾지 못했습니다.")
+                sys.exit(1)
+            print(f"자체 검사 통과: {INDEX_REVISION} 적용 전 스키마에서 전체 스캔을 찾았습니다.")
+            sys.exit(0)
+        sys.exit(0 if run_check(database_url, args.users) else 1)
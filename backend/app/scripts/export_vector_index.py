@@ -0,0 +1,57 @@
+# app/scripts/export_vector_index.py
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+import numpy as np
+from tqdm import tqdm
+
+from app.core.config import settings
+from app.services.clients import get_pinecone_client
+from app.services.ingestion import is_front_matter
+from app.services.policy_metadata import title_and_category
+from app.services.vector_store import LocalVectorIndex
+
+FETCH_BATCH_SIZE = 100
+
+def export_vector_index(output_path: str = None):
+    """Pinecone 인덱스의 모든 벡터를 로컬 인덱스 파일로 내보내기"""
+    output_path = output_path or settings.LOCAL_VECTOR_INDEX_PATH
+
+    index = get_pinecone_client().Index(settings.PINECONE_INDEX_NAME)
+
+    # 전체 벡터 ID 목록 가져오기
+    vector_ids = []
+    for id_batch in index.list():
+        vector_ids.extend(id_batch)
+
+    print(f"{len(vector_ids)}개 벡터를 내보냅니다...")
+
+    ids = []
+    embeddings = []
+    metadata = []
+    for start in tqdm(range(0, len(vector_ids), FETCH_BATCH_SIZE)):
+        batch_ids = vector_ids[start:start + FETCH_BATCH_SIZE]
+        result = index.fetch(ids=batch_ids)
+        for vector_id in batch_ids:
+            vector = result.vectors.get(vector_id)
+            if vector is None:
+                continue
+            ids.append(vector_id)
+            embeddings.append(vector.values)
+            chunk_metadata = dict(vector.metadata or {})
+            chunk_metadata.setdefault("is_toc", is_front_matter(chunk_metadata.get("page")))
+            chunk_metadata["title"], chunk_metadata["category"] = title_and_category(chunk_metadata)
+            metadata.append(chunk_metadata)
+
+    local_index = LocalVectorIndex(ids, np.array(embeddings, dtype=np.float32), metadata)
+    local_index.save(output_path)
+
+    print(f"로컬 벡터 인덱스가 저장되었습니다: {output_path}")
+
+if __name__ == "__main__":
+    export_vector_index(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,117 @@
+# app/scripts/generate_policy_summaries.py
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = str(Path(__file__).parent.parent.parent)
+sys.path.insert(0, project_root)
+
+from tqdm import tqdm
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.db.models import PolicySummary
+from app.services.clients import close_async_clients, get_pinecone_client
+from app.services.ingestion import is_front_matter
+from app.services.policy_summaries import (
+    agenerate_user_friendly_policy_description,
+    save_summary,
+    summary_content_hash
+)
+
+FETCH_BATCH_SIZE = 100
+
+def load_chunks():
+    """요약 대상 청크 (벡터 ID, 본문) 목록. 로컬 인덱스 파일이 있으면 파일에서, 없으면 Pinecone에서 읽음"""
+    if os.path.exists(settings.LOCAL_VECTOR_INDEX_PATH):
+        from app.services.vector_store import load_vector_index
+
+        index = load_vector_index(settings.LOCAL_VECTOR_INDEX_PATH)
+        entries = zip(index.ids, index.metadata)
+    else:
+        index = get_pinecone_client().Index(settings.PINECONE_INDEX_NAME)
+        vector_ids = []
+        for id_batch in index.list():
+            vector_ids.extend(id_batch)
+
+        entries = []
+        for start in tqdm(range(0, len(vector_ids), FETCH_BATCH_SIZE), desc="청크 조회"):
+            result = index.fetch(ids=vector_ids[start:start + FETCH_BATCH_SIZE])
+            entries.extend((vector_id, vector.metadata or {}) for vector_id, vector in result.vectors.items())
+
+    # 목차 청크는 검색되지 않으므로 요약하지 않음
+    return [
+        (vector_id, metadata.get("text", ""))
+        for vector_id, metadata in entries
+        if metadata.get("text") and not metadata.get("is_toc", is_front_matter(metadata.get("page")))
+    ]
+
+async def generate_policy_summaries(concurrency: int, batch_size: int, timeout: float, limit: int = None, force: bool = False):
+    """
+    모든 청크의 사용자 친화적 설명을 미리 생성해 policy_summaries 테이블에 저장
+
+    배치마다 커밋하므로 중간에 멈춰도 다시 실행하면 남은 청크부터 이어서 생성하며,
+    본문(또는 프롬프트 버전)의 해시가 그대로인 청크는 건너뜁니다.
+    """
+    db = SessionLocal()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    try:
+        chunks = load_chunks()
+        existing = {row.vector_id: row for row in db.query(PolicySummary).all()}
+
+        pending = []
+        for vector_id, text in chunks:
+            content_hash = summary_content_hash(text)
+            row = existing.get(vector_id)
+            if force or row is None or row.content_hash != content_hash:
+                pending.append((vector_id, text, content_hash))
+        if limit:
+            pending = pending[:limit]
+
+        print(f"청크 {len(chunks)}개 중 요약 생성 대상 {len(pending)}개")
+
+        generated = 0
+        failed = 0
+        with tqdm(total=len(pending), desc="요약 생성") as progress:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                descriptions = await asyncio.gather(*[
+                    agenerate_user_friendly_policy_description(text, timeout=timeout, semaphore=semaphore)
+                    for _, text, _ in batch
+                ])
+
+                for (vector_id, _, content_hash), description in zip(batch, descriptions):
+                    if description is None:
+                        # 실패한 청크는 다음 실행에서 다시 시도
+                        failed += 1
+                        continue
+                    save_summary(db, vector_id, content_hash, description, existing.get(vector_id))
+                    generated += 1
+
+                db.commit()
+                progress.update(len(batch))
+
+        print(f"요약 {generated}개 생성 완료 (실패 {failed}개)")
+
+    except Exception as e:
+        print(f"오류 발생: {str(e)}")
+        db.rollback()
+    finally:
+        db.close()
+        await close_async_clients()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정책 청크 요약 일괄 생성")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 LLM 호출 수")
+    parser.add_argument("--batch-size", type=int, default=50, help="커밋 단위 청크 수")
+    parser.add_argument("--timeout", type=float, default=60, help="요약 1건당 제한 시간(초)")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 생성할 최대 청크 수")
+    parser.add_argument("--force", action="store_true", help="해시가 같아도 모두 다시 생성")
+    args = parser.parse_args()
+
+    asyncio.run(generate_policy_summaries(args.concurrency, args.batch_size, args.timeout, args.limit, args.force))
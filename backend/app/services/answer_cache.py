@@ -0,0 +1,169 @@
+# app/services/answer_cache.py
+import json
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+# 프로필 정보가 없는 사용자 버킷
+ANONYMOUS = "anonymous"
+
+# 임계값보다 이만큼 낮은 유사도까지는 '아깝게 놓친' 조회로 집계 (임계값 조정용)
+NEAR_MISS_MARGIN = 0.05
+
+def profile_bucket(user_profile: Optional[Dict[str, Any]], profile_type_id: Optional[int] = None) -> str:
+    """
+    답변을 공유할 수 있는 사용자 묶음.
+    프로필 유형이 있으면 유형 단위로, 없으면 프로필 값이 완전히 같은 사용자끼리 공유합니다.
+    """
+    if profile_type_id is not None:
+        return f"type:{profile_type_id}"
+    if not user_profile:
+        return ANONYMOUS
+    return "profile:" + json.dumps(user_profile, sort_keys=True, ensure_ascii=False, default=str)
+
+def _percentile(values, q: float) -> Optional[float]:
+    if not values:
+        return None
+    return float(np.percentile(np.fromiter(values, dtype=np.float64), q))
+
+class _Bucket:
+    """버킷 하나에 속한 질문 임베딩 행렬과 항목 ID"""
+
+    def __init__(self, dimension: int):
+        self.entry_ids: List[int] = []
+        self.matrix = np.empty((0, dimension), dtype=np.float32)
+
+    def add(self, entry_id: int, vector: np.ndarray) -> None:
+        self.entry_ids.append(entry_id)
+        self.matrix = np.vstack([self.matrix, vector[None, :]])
+
+    def remove(self, entry_id: int) -> None:
+        row = self.entry_ids.index(entry_id)
+        del self.entry_ids[row]
+        self.matrix = np.delete(self.matrix, row, axis=0)
+
+    def nearest(self, vector: np.ndarray) -> Tuple[Optional[int], float]:
+        if not self.entry_ids:
+            return None, -1.0
+        scores = self.matrix @ vector
+        row = int(np.argmax(scores))
+        return self.entry_ids[row], float(scores[row])
+
+class SemanticAnswerCache:
+    """
+    챗봇 답변 의미 캐시
+
+    이전에 답변한 질문의 임베딩을 프로필 버킷별로 보관하고, 새 질문과 코사인 유사도가
+    임계값 이상인 질문이 있으면 저장된 답변과 출처를 그대로 반환합니다.
+    전체 항목 수는 max_entries로 제한하며 가장 오래 사용하지 않은 답변부터 제거합니다.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.index_version: Optional[str] = None
+        self._buckets: Dict[str, _Bucket] = {}
+        # 항목 ID -> (버킷, 답변), 사용 순서 유지
+        self._entries: "OrderedDict[int, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.near_misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._hit_similarities = deque(maxlen=1000)
+        self._latencies = {"hit": deque(maxlen=1000), "miss": deque(maxlen=1000)}
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _check_version(self, index_version: Optional[str]) -> None:
+        # 검색 인덱스가 바뀌면 이전 답변의 근거가 달라지므로 모두 버림
+        if index_version is None or self.index_version == index_version:
+            return
+        if self.index_version is not None and self._entries:
+            self._buckets.clear()
+            self._entries.clear()
+            self.invalidations += 1
+        self.index_version = index_version
+
+    def lookup(self, embedding: List[float], bucket: str, index_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """유사한 질문의 답변이 있으면 반환하고, 없으면 None을 반환합니다."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._check_version(index_version)
+            entry_id, similarity = None, -1.0
+            if bucket in self._buckets:
+                entry_id, similarity = self._buckets[bucket].nearest(vector)
+
+            if entry_id is None or similarity < self.threshold:
+                self.misses += 1
+                if similarity >= self.threshold - NEAR_MISS_MARGIN:
+                    self.near_misses += 1
+                return None
+
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            self._hit_similarities.append(similarity)
+            return dict(self._entries[entry_id][1])
+
+    def store(self, embedding: List[float], bucket: str, response: Dict[str, Any], index_version: Optional[str] = None) -> None:
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._check_version(index_version)
+            if bucket not in self._buckets:
+                self._buckets[bucket] = _Bucket(len(vector))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._buckets[bucket].add(entry_id, vector)
+            self._entries[entry_id] = (bucket, response)
+
+            while len(self._entries) > self.max_entries:
+                old_id, (old_bucket, _) = self._entries.popitem(last=False)
+                self._buckets[old_bucket].remove(old_id)
+                if not self._buckets[old_bucket].entry_ids:
+                    del self._buckets[old_bucket]
+                self.evictions += 1
+
+    def record_latency(self, hit: bool, seconds: float) -> None:
+        self._latencies["hit" if hit else "miss"].append(seconds * 1000)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "buckets": len(self._buckets),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "near_misses": self.near_misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+            "median_hit_similarity": _percentile(self._hit_similarities, 50),
+            "p50_hit_ms": _percentile(self._latencies["hit"], 50),
+            "p50_miss_ms": _percentile(self._latencies["miss"], 50),
+        }
+
+answer_cache = SemanticAnswerCache(
+    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+)
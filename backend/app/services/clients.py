@@ -0,0 +1,134 @@
+# app/services/clients.py
+"""
+프로세스 전역 클라이언트 레지스트리
+
+OpenAI/Pinecone 클라이언트와 검색 인덱스, 이를 사용하는 서비스 객체를 프로세스당 한 번만 만들어
+커넥션 풀과 keep-alive 연결을 모든 요청이 함께 사용하도록 합니다.
+엔드포인트는 app.api.deps의 의존성 함수를 통해 이 객체들을 주입받습니다.
+"""
+import os
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI, DefaultHttpxClient
+from pinecone import Pinecone
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_openai_client() -> OpenAI:
+    """커넥션 풀을 공유하는 OpenAI 클라이언트"""
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+            keepalive_expiry=60,
+        ),
+    )
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        timeout=settings.OPENAI_TIMEOUT_SECONDS,
+        max_retries=0,  # 재시도는 LLM 게이트웨이에서 (app.services.llm_gateway)
+        http_client=http_client,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_openai_client() -> AsyncOpenAI:
+    """비동기 엔드포인트에서 사용하는 OpenAI 클라이언트 (커넥션 풀 공유)"""
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+            keepalive_expiry=60,
+        ),
+    )
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        timeout=settings.OPENAI_TIMEOUT_SECONDS,
+        max_retries=0,
+        http_client=http_client,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_pinecone_client() -> Pinecone:
+    return Pinecone(api_key=settings.PINECONE_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def get_vector_index():
+    """
+    설정된 검색 백엔드의 인덱스를 반환합니다.
+
+    VECTOR_BACKEND가 "local"이면 로컬 인덱스 파일(전수 검색 또는 IVF)을, 그 외에는 Pinecone 인덱스를 사용합니다.
+    두 백엔드 모두 query(vector=..., top_k=..., include_metadata=...)와 fetch(ids=...)를 지원합니다.
+    """
+    if settings.VECTOR_BACKEND == "local":
+        from app.services.vector_store import IVFVectorIndex, load_vector_index
+
+        index = load_vector_index(settings.LOCAL_VECTOR_INDEX_PATH)
+        if isinstance(index, IVFVectorIndex):
+            index.nprobe = settings.IVF_NPROBE
+        return index
+
+    # 호스트를 알고 있으면 describe_index 호출 없이 바로 연결
+    if settings.PINECONE_INDEX_HOST:
+        return get_pinecone_client().Index(host=settings.PINECONE_INDEX_HOST)
+    return get_pinecone_client().Index(settings.PINECONE_INDEX_NAME)
+
+
+def get_index_version() -> str:
+    """
+    검색 결과 캐시의 무효화 기준이 되는 인덱스 버전.
+    로컬 인덱스는 내용이 바뀔 때마다, Pinecone은 SEARCH_INDEX_VERSION 설정을 올릴 때 바뀝니다.
+    """
+    if settings.VECTOR_BACKEND == "local":
+        return f"local:{settings.SEARCH_INDEX_VERSION}:{get_vector_index().version}"
+    return f"pinecone:{settings.PINECONE_INDEX_NAME}:{settings.SEARCH_INDEX_VERSION}"
+
+
+@lru_cache(maxsize=None)
+def get_lexical_index():
+    """
+    정책명/본문 n-gram 역색인. 로컬 인덱스 파일의 청크 메타데이터로 생성하며,
+    파일이 없으면 None을 반환합니다 (이 경우 벡터 검색만 사용).
+    """
+    from app.services.lexical_index import LexicalIndex
+    from app.services.vector_store import load_vector_index
+
+    if settings.VECTOR_BACKEND == "local":
+        return LexicalIndex.from_vector_index(get_vector_index())
+    if os.path.exists(settings.LOCAL_VECTOR_INDEX_PATH):
+        return LexicalIndex.from_vector_index(load_vector_index(settings.LOCAL_VECTOR_INDEX_PATH))
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_rag_service():
+    from app.services.llm_service import RAGService
+
+    return RAGService(client=get_openai_client(), index=get_vector_index())
+
+
+@lru_cache(maxsize=None)
+def get_policy_matcher():
+    from app.services.policy_matcher import PolicyMatcher
+
+    return PolicyMatcher(client=get_openai_client(), index=get_vector_index())
+
+
+async def close_async_clients() -> None:
+    """비동기 클라이언트 연결을 정리합니다. (이벤트 루프 안에서 호출)"""
+    if get_async_openai_client.cache_info().currsize:
+        await get_async_openai_client().close()
+    get_async_openai_client.cache_clear()
+
+
+def close_clients() -> None:
+    """애플리케이션 종료 시 열려 있는 연결을 정리합니다."""
+    if get_openai_client.cache_info().currsize:
+        get_openai_client().close()
+    for cached in (get_rag_service, get_policy_matcher, get_lexical_index, get_vector_index, get_pinecone_client, get_openai_client):
+        cached.cache_clear()
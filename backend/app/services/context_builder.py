@@ -0,0 +1,212 @@
+# app/services/context_builder.py
+import threading
+from typing import Any, Dict, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 글자 수 기반 추정치 사용
+    tiktoken = None
+
+CHAT_MODEL = "gpt-3.5-turbo"
+
+# 청크 분할 시 겹침(200자)을 찾을 때 비교할 최대/최소 길이
+MAX_OVERLAP_CHARS = 400
+MIN_OVERLAP_CHARS = 20
+
+# 이 페이지 수 이내의 청크끼리만 이어 붙임
+PAGE_MERGE_DISTANCE = 1
+
+# 남은 예산이 이보다 적으면 구간을 잘라 넣지 않음
+MIN_TRUNCATED_TOKENS = 50
+
+# chat completion 메시지 하나당 추가되는 토큰 수
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_encoding = None
+_encoding_lock = threading.Lock()
+# 토크나이저 로드에 실패했음을 기록 (다시 시도하지 않고 추정치 사용)
+_ENCODING_UNAVAILABLE = object()
+
+def _get_encoding():
+    global _encoding
+    if tiktoken is None:
+        return None
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                try:
+                    _encoding = tiktoken.encoding_for_model(CHAT_MODEL)
+                except Exception as e:
+                    print(f"토크나이저 로드 오류 (이후 추정치 사용): {str(e)}")
+                    _encoding = _ENCODING_UNAVAILABLE
+    return None if _encoding is _ENCODING_UNAVAILABLE else _encoding
+
+def count_tokens(text: str) -> int:
+    """모델 토크나이저 기준 토큰 수 (tiktoken이 없으면 ASCII 4자당 1토큰, 그 외 1자당 1토큰으로 추정)"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """chat completion 요청의 프롬프트 토큰 수 (근사)"""
+    return sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages) + 3
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    encoding = _get_encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+    # 추정치 기준으로 앞에서부터 예산만큼 자름
+    used = 0
+    for position, char in enumerate(text):
+        used += 0.25 if ord(char) < 128 else 1
+        if used > max_tokens:
+            return text[:position]
+    return text
+
+def _parse_page(page: Any) -> Optional[int]:
+    try:
+        return int(page)
+    except (ValueError, TypeError):
+        return None
+
+def _overlap_length(left: str, right: str) -> int:
+    """left의 끝과 right의 시작이 겹치는 길이 (MIN_OVERLAP_CHARS 미만이면 0)"""
+    longest = min(len(left), len(right), MAX_OVERLAP_CHARS)
+    for length in range(longest, MIN_OVERLAP_CHARS - 1, -1):
+        if left.endswith(right[:length]):
+            return length
+    return 0
+
+class ContextSegment:
+    """이어 붙인 청크 구간 (같은/인접 페이지의 겹치는 청크들)"""
+
+    def __init__(self, match: Any):
+        self.text = match.metadata.get("text", "")
+        self.score = match.score or 0.0
+        self.matches = [match]
+        page = _parse_page(match.metadata.get("page"))
+        self.pages = [page] if page is not None else []
+
+    def is_near(self, other: "ContextSegment") -> bool:
+        if not self.pages or not other.pages:
+            return False
+        return min(other.pages) - PAGE_MERGE_DISTANCE <= max(self.pages) and min(self.pages) - PAGE_MERGE_DISTANCE <= max(other.pages)
+
+    def merge(self, other: "ContextSegment") -> bool:
+        """겹치거나 포함 관계인 구간을 합칩니다. 합칠 수 없으면 False"""
+        if other.text in self.text:
+            merged = self.text
+        elif self.text in other.text:
+            merged = other.text
+        elif not self.is_near(other):
+            return False
+        else:
+            forward = _overlap_length(self.text, other.text)
+            backward = _overlap_length(other.text, self.text)
+            if not forward and not backward:
+                return False
+            if forward >= backward:
+                merged = self.text + other.text[forward:]
+            else:
+                merged = other.text + self.text[backward:]
+
+        self.text = merged
+        self.score = max(self.score, other.score)
+        self.matches.extend(other.matches)
+        self.pages.extend(other.pages)
+        return True
+
+    def label(self) -> str:
+        if not self.pages:
+            return "[출처: 페이지 정보 없음]"
+        first, last = min(self.pages), max(self.pages)
+        return f"[출처: {first}페이지]" if first == last else f"[출처: {first}-{last}페이지]"
+
+class PackedContext:
+    def __init__(self, text: str, matches: List[Any], tokens: int, raw_tokens: int):
+        self.text = text
+        self.matches = matches  # 컨텍스트에 실제로 들어간 청크 (점수순)
+        self.tokens = tokens
+        self.raw_tokens = raw_tokens  # 청크를 그대로 이어 붙였을 때의 토큰 수
+
+def build_context(matches: List[Any], token_budget: int) -> PackedContext:
+    """
+    검색된 청크로 토큰 예산 안의 컨텍스트를 구성합니다.
+
+    같은/인접 페이지에서 겹치는 청크는 하나의 구간으로 이어 붙여 중복 텍스트를 없애고,
+    점수가 높은 구간부터 예산이 찰 때까지 넣습니다. (마지막 구간은 남은 예산만큼 잘라 넣음)
+    """
+    raw_tokens = count_tokens("\n\n".join(match.metadata.get("text", "") for match in matches))
+
+    segments: List[ContextSegment] = []
+    for match in sorted(matches, key=lambda match: match.score or 0.0, reverse=True):
+        segment = ContextSegment(match)
+        if not segment.text.strip():
+            continue
+        # 새 구간이 기존 구간들을 잇는 경우가 있으므로 더 합칠 수 없을 때까지 반복
+        merged = True
+        while merged:
+            merged = False
+            for existing in segments:
+                if existing.merge(segment):
+                    segments.remove(existing)
+                    segment = existing
+                    merged = True
+                    break
+        segments.append(segment)
+
+    segments.sort(key=lambda segment: segment.score, reverse=True)
+
+    parts = []
+    included = []
+    used = 0
+    for segment in segments:
+        block = f"{segment.label()}\n{segment.text}"
+        block_tokens = count_tokens(block) + (2 if parts else 0)
+        if used + block_tokens > token_budget:
+            remaining = token_budget - used
+            if remaining < MIN_TRUNCATED_TOKENS:
+                break
+            block = truncate_to_tokens(block, remaining - 2)
+            block_tokens = count_tokens(block) + (2 if parts else 0)
+        parts.append(block)
+        included.extend(segment.matches)
+        used += block_tokens
+        if used >= token_budget:
+            break
+
+    included.sort(key=lambda match: match.score or 0.0, reverse=True)
+    text = "\n\n".join(parts)
+    return PackedContext(text, included, count_tokens(text), raw_tokens)
+
+class ContextStats:
+    """요청별 프롬프트 토큰 수 집계 (/metrics/cache에서 확인)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.context_tokens = 0
+        self.raw_context_tokens = 0
+
+    def record(self, prompt_tokens: int, context: PackedContext) -> None:
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.context_tokens += context.tokens
+            self.raw_context_tokens += context.raw_tokens
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.requests or 1
+        return {
+            "requests": self.requests,
+            "tokenizer": "tiktoken" if _get_encoding() is not None else "estimate",
+            "avg_prompt_tokens": self.prompt_tokens / requests,
+            "avg_context_tokens": self.context_tokens / requests,
+            "avg_raw_context_tokens": self.raw_context_tokens / requests,
+            "context_tokens_saved": self.raw_context_tokens - self.context_tokens,
+        }
+
+context_stats = ContextStats()
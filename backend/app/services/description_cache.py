@@ -0,0 +1,257 @@
+# app/services/description_cache.py
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.singleflight import openai_flight
+
+# 다른 워커가 같은 설명을 생성 중일 때 잠금 유지 시간과 결과를 기다리는 최대 시간
+LOCK_TTL_SECONDS = 60
+LOCK_WAIT_SECONDS = 20
+LOCK_POLL_SECONDS = 0.2
+
+def normalize_profile(user_profile: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    캐시를 공유할 프로필 묶음.
+    나이는 연령대로 바꾸고 지역처럼 설명에 영향이 적은 값은 빼서, 비슷한 사용자끼리 같은 설명을 사용합니다.
+    """
+    if not user_profile:
+        return None
+
+    age_group = None
+    try:
+        age = int(user_profile.get("age"))
+        age_group = "청년" if age < 35 else "중장년" if age < 65 else "노년"
+    except (TypeError, ValueError):
+        pass
+
+    normalized = {
+        "age_group": age_group,
+        "gender": user_profile.get("gender"),
+        "employment_status": user_profile.get("employment_status"),
+        "is_disabled": bool(user_profile.get("is_disabled")),
+        "is_foreign": bool(user_profile.get("is_foreign")),
+        "family_status": user_profile.get("family_status"),
+    }
+    return {key: value for key, value in normalized.items() if value not in (None, "")}
+
+class MemoryDescriptionStore:
+    """공유 저장소의 프로세스 내 대체 구현 (개발 환경/테스트용)"""
+
+    def __init__(self, max_entries: int):
+        self._cache = LRUCache(max_entries=max_entries)
+        self._locks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        with self._lock:
+            now = time.monotonic()
+            if self._locks.get(key, 0) > now:
+                return None
+            self._locks[key] = now + ttl_seconds
+            return key
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            self._locks.pop(key, None)
+
+class RedisDescriptionStore:
+    """
+    여러 워커가 함께 쓰는 Redis 저장소.
+    항목마다 TTL을 두고, 크기 제한은 Redis의 maxmemory-policy(allkeys-lru 등)로 관리합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "policy_description:"):
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._client.set(self.prefix + key, value, ex=max(1, int(ttl_seconds)))
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if self._client.set(self.prefix + "lock:" + key, token, nx=True, ex=int(ttl_seconds)):
+            return token
+        return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        # 잠금이 만료되어 다른 워커가 다시 잡은 경우에는 지우지 않음
+        lock_key = self.prefix + "lock:" + key
+        if self._client.get(lock_key) == token.encode("utf-8"):
+            self._client.delete(lock_key)
+
+class DescriptionCache:
+    """
+    정책 설명 2단계 캐시
+
+    키는 (프롬프트 버전, 정책 본문, 프로필 묶음)의 해시입니다.
+    1단계는 프로세스 내 LRU, 2단계는 모든 워커가 함께 읽는 공유 저장소이며,
+    미스가 나면 프로세스 안에서는 single-flight로, 워커 사이에서는 공유 저장소의 잠금으로
+    같은 설명을 한 번만 생성합니다.
+    """
+
+    def __init__(self, store, max_entries: int = 1024, ttl_seconds: float = 86400):
+        self.memory = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.shared_hits = 0
+        self.lock_waits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt_version: int, policy_text: str, profile: Optional[Dict[str, Any]]) -> str:
+        payload = json.dumps([prompt_version, policy_text, profile], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _read_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            value = self.store.get(key)
+        except Exception as e:
+            print(f"정책 설명 캐시 조회 오류: {str(e)}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def _write_shared(self, key: str, description: Dict[str, Any]) -> None:
+        try:
+            self.store.set(key, json.dumps(description, ensure_ascii=False), self.ttl_seconds)
+        except Exception as e:
+            print(f"정책 설명 캐시 저장 오류: {str(e)}")
+
+    def _acquire_lock(self, key: str) -> Optional[str]:
+        try:
+            return self.store.acquire_lock(key, LOCK_TTL_SECONDS)
+        except Exception as e:
+            # 저장소를 쓸 수 없으면 잠금 없이 생성
+            print(f"정책 설명 캐시 잠금 오류: {str(e)}")
+            return ""
+
+    def _release_lock(self, key: str, token: str) -> None:
+        if not token:
+            return
+        try:
+            self.store.release_lock(key, token)
+        except Exception as e:
+            print(f"정책 설명 캐시 잠금 해제 오류: {str(e)}")
+
+    def get_or_create(
+        self,
+        key: str,
+        create: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """캐시에 있으면 저장된 설명을, 없으면 create()로 생성해 저장 후 반환합니다. (호출자마다 사본 반환)"""
+        description = self.memory.get(key)
+        if description is None:
+            # 같은 키의 조회/생성이 동시에 들어오면 한 번만 실행
+            description = openai_flight.do(("policy_description", key), lambda: self._load_or_create(key, create))
+        return dict(description)
+
+    def _load_or_create(self, key: str, create: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        description = self._read_shared(key)
+        if description is not None:
+            self.shared_hits += 1
+            self.memory.set(key, description)
+            return description
+
+        token = self._acquire_lock(key)
+        if token is None:
+            # 다른 워커가 생성 중이면 저장될 때까지 기다렸다가 읽음 (너무 오래 걸리면 직접 생성)
+            self.lock_waits += 1
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_SECONDS)
+                description = self._read_shared(key)
+                if description is not None:
+                    self.shared_hits += 1
+                    self.memory.set(key, description)
+                    return description
+
+        try:
+            self.misses += 1
+            description = create()
+            self.memory.set(key, description)
+            self._write_shared(key, description)
+            return description
+        finally:
+            self._release_lock(key, token)
+
+    async def aget_or_create(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """get_or_create의 비동기 버전. 공유 저장소 조회/잠금은 블로킹 I/O이므로 스레드에서 실행합니다."""
+        description = self.memory.get(key)
+        if description is None:
+            description = await openai_flight.ado(("policy_description", key), lambda: self._aload_or_create(key, create))
+        return dict(description)
+
+    async def _aload_or_create(self, key: str, create: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        description = await asyncio.to_thread(self._read_shared, key)
+        if description is not None:
+            self.shared_hits += 1
+            self.memory.set(key, description)
+            return description
+
+        token = await asyncio.to_thread(self._acquire_lock, key)
+        if token is None:
+            self.lock_waits += 1
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                description = await asyncio.to_thread(self._read_shared, key)
+                if description is not None:
+                    self.shared_hits += 1
+                    self.memory.set(key, description)
+                    return description
+
+        try:
+            self.misses += 1
+            description = await create()
+            self.memory.set(key, description)
+            await asyncio.to_thread(self._write_shared, key, description)
+            return description
+        finally:
+            await asyncio.to_thread(self._release_lock, key, token)
+
+    def stats(self) -> Dict[str, Any]:
+        memory_stats = self.memory.stats()
+        total = memory_stats["hits"] + self.shared_hits + self.misses
+        return {
+            "memory": memory_stats,
+            "memory_hits": memory_stats["hits"],
+            "shared_store": type(self.store).__name__,
+            "shared_hits": self.shared_hits,
+            "lock_waits": self.lock_waits,
+            "misses": self.misses,
+            "hit_rate": (memory_stats["hits"] + self.shared_hits) / total if total else 0.0,
+        }
+
+def create_description_store():
+    if settings.DESCRIPTION_CACHE_REDIS_URL:
+        return RedisDescriptionStore(settings.DESCRIPTION_CACHE_REDIS_URL)
+    return MemoryDescriptionStore(settings.DESCRIPTION_CACHE_MAX_ENTRIES)
+
+# 프로세스 전역 정책 설명 캐시
+description_cache = DescriptionCache(
+    create_description_store(),
+    max_entries=settings.DESCRIPTION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DESCRIPTION_CACHE_TTL_SECONDS,
+)
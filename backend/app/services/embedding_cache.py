@@ -0,0 +1,122 @@
+# app/services/embedding_cache.py
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from typing import Callable, Dict, Any, List, Optional
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.singleflight import openai_flight
+
+def normalize_query(text: str) -> str:
+    """캐시 키로 쓰기 위해 쿼리 문자열을 정규화합니다 (유니코드 NFC, 공백 정리, 소문자)."""
+    text = unicodedata.normalize("NFC", text or "")
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+class EmbeddingCache:
+    """
+    쿼리 임베딩 2단계 캐시
+
+    1단계는 프로세스 내 LRU, 2단계는 SQLite 파일로 재시작 후에도 유지되며
+    같은 파일을 여러 uvicorn 워커가 함께 사용합니다.
+    """
+
+    def __init__(self, path: Optional[str], max_entries: int = 2048):
+        self.memory = LRUCache(max_entries=max_entries)
+        self.path = path
+        self.disk_hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    " model TEXT NOT NULL,"
+                    " query TEXT NOT NULL,"
+                    " vector BLOB NOT NULL,"
+                    " PRIMARY KEY (model, query))"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite 연결은 스레드마다 따로 유지
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _read_disk(self, model: str, query: str) -> Optional[List[float]]:
+        if not self.path:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND query = ?", (model, query)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"임베딩 캐시 조회 오류: {str(e)}")
+            return None
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+    def _write_disk(self, model: str, query: str, embedding: List[float]) -> None:
+        if not self.path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (model, query, vector) VALUES (?, ?, ?)",
+                    (model, query, np.asarray(embedding, dtype=np.float32).tobytes()),
+                )
+        except sqlite3.Error as e:
+            print(f"임베딩 캐시 저장 오류: {str(e)}")
+
+    def get_or_create(self, text: str, model: str, create: Callable[[str], List[float]]) -> List[float]:
+        """캐시에 있으면 저장된 임베딩을, 없으면 create(text)로 생성하여 저장 후 반환합니다."""
+        query = normalize_query(text)
+        key = (model, query)
+
+        embedding = self.memory.get(key)
+        if embedding is not None:
+            return embedding
+
+        embedding = self._read_disk(model, query)
+        if embedding is not None:
+            self.disk_hits += 1
+            self.memory.set(key, embedding)
+            return embedding
+
+        # 같은 쿼리의 임베딩 생성이 동시에 들어오면 한 번만 호출
+        return openai_flight.do(("embedding", model, query), lambda: self._create_and_store(text, model, query, create))
+
+    def _create_and_store(self, text: str, model: str, query: str, create: Callable[[str], List[float]]) -> List[float]:
+        self.misses += 1
+        embedding = create(text)
+        self.memory.set((model, query), embedding)
+        self._write_disk(model, query, embedding)
+        return embedding
+
+    def stats(self) -> Dict[str, Any]:
+        memory_stats = self.memory.stats()
+        total = memory_stats["hits"] + self.disk_hits + self.misses
+        return {
+            "memory": memory_stats,
+            "memory_hits": memory_stats["hits"],
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (memory_stats["hits"] + self.disk_hits) / total if total else 0.0,
+        }
+
+# 프로세스 전역 임베딩 캐시
+embedding_cache = EmbeddingCache(
+    settings.EMBEDDING_CACHE_PATH or None,
+    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+)
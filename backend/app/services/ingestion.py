@@ -0,0 +1,51 @@
+# app/services/ingestion.py
+from typing import Any, Dict, List, Optional
+
+from app.services.policy_metadata import extract_category, extract_title_from_text
+
+# '한권으로 통하는 고용노동정책'의 1-20페이지는 목차/앞부분이므로 검색 대상에서 제외
+TOC_LAST_PAGE = 20
+
+# 목차/앞부분 청크를 제외하는 검색 필터 (Pinecone, 로컬 인덱스 공통)
+SERVING_FILTER = {"is_toc": {"$ne": True}}
+
+# is_toc가 없는 청크를 걸러낸 뒤 다시 검색할 때의 최대 top_k (Pinecone의 메타데이터 포함 조회 한도)
+MAX_SERVING_FETCH = 1000
+
+def is_front_matter(page: Any) -> bool:
+    """페이지 번호가 목차/앞부분에 해당하는지 확인합니다. (파싱할 수 없는 페이지는 본문으로 간주)"""
+    try:
+        return int(page) <= TOC_LAST_PAGE
+    except (ValueError, TypeError):
+        return False
+
+def build_chunk_metadata(text: str, page: Any, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """청크를 벡터 인덱스에 올릴 때 사용할 메타데이터를 생성합니다. (제목/카테고리는 적재 시 한 번만 계산)"""
+    metadata = dict(extra or {})
+    metadata.update({
+        "text": text,
+        "page": page,
+        "is_toc": is_front_matter(page),
+        "title": extract_title_from_text(text),
+        "category": extract_category(text),
+    })
+    return metadata
+
+def is_servable(metadata: Dict[str, Any]) -> bool:
+    """검색 결과로 보여줄 청크인지 확인합니다. (is_toc가 없는 기존 청크는 페이지 번호로 판단)"""
+    return not metadata.get("is_toc", is_front_matter(metadata.get("page")))
+
+def query_serving_chunks(index, vector: List[float], top_k: int) -> List[Any]:
+    """
+    목차/앞부분 청크를 제외한 top_k개의 검색 결과(match 목록)
+
+    SERVING_FILTER로 검색하고, backfill_chunk_metadata.py를 실행하기 전이라 is_toc가 없는
+    앞부분 청크가 섞여 있으면 걸러낸 만큼 더 가져옵니다.
+    """
+    fetch_k = top_k
+    while True:
+        matches = index.query(vector=vector, top_k=fetch_k, filter=SERVING_FILTER, include_metadata=True).matches
+        servable = [match for match in matches if is_servable(match.metadata)]
+        if len(servable) >= top_k or len(matches) < fetch_k or fetch_k >= MAX_SERVING_FETCH:
+            return servable[:top_k]
+        fetch_k = min(fetch_k * 2, MAX_SERVING_FETCH)
@@ -0,0 +1,241 @@
+# app/services/jobs.py
+"""
+백그라운드 작업 큐
+
+JOB_BACKEND가 "local"이면 API 프로세스 안의 스레드 풀(JOB_WORKERS개)에서 실행하고
+작업 상태는 메모리에 보관합니다. "celery"면 Redis 브로커로 celery_worker.py 워커에 보내고
+상태는 Celery 결과 백엔드에서 조회합니다.
+
+같은 dedup_key의 작업이 대기/실행 중이면 새로 넣지 않고 기존 작업 ID를 반환합니다.
+작업을 요청한 사용자(owner_id)를 함께 기록하고, 상태는 그 사용자에게만 보여줍니다.
+(dedup으로 같은 작업을 받은 사용자도 소유자로 추가)
+"""
+import json
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+def create_celery_app():
+    """API 프로세스(작업 전송)와 celery_worker.py(작업 실행)가 함께 쓰는 Celery 앱"""
+    from celery import Celery
+
+    celery_app = Celery(
+        "labor_policy",
+        broker=settings.CELERY_BROKER_URL,
+        backend=settings.CELERY_RESULT_BACKEND,
+    )
+    celery_app.conf.update(
+        task_serializer="json",
+        result_serializer="json",
+        accept_content=["json"],
+        task_track_started=True,  # 실행 중 상태(STARTED) 기록
+        task_acks_late=True,
+        worker_prefetch_multiplier=1,  # 오래 걸리는 작업을 한 워커가 몰아 받지 않도록
+        result_extended=True,  # 작업 이름 등을 결과와 함께 저장
+        result_expires=24 * 60 * 60,
+    )
+    return celery_app
+
+class LocalJobQueue:
+    """API 프로세스 안에서 스레드 풀로 실행하는 작업 큐"""
+
+    def __init__(self, workers: int, max_history: int = 1000):
+        self.workers = workers
+        self.max_history = max_history
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._active: Dict[str, str] = {}  # dedup_key -> 대기/실행 중인 작업 ID
+        self._owners: Dict[str, Set[int]] = {}  # 작업 ID -> 요청한 사용자 ID
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+        return self._executor
+
+    def enqueue(self, name: str, *args: Any, dedup_key: Optional[str] = None, owner_id: Optional[int] = None) -> str:
+        from app.services.tasks import TASKS
+
+        task = TASKS[name]
+        with self._lock:
+            if dedup_key is not None and dedup_key in self._active:
+                job_id = self._active[dedup_key]
+                if owner_id is not None:
+                    self._owners.setdefault(job_id, set()).add(owner_id)
+                return job_id
+
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "id": job_id,
+                "name": name,
+                "status": QUEUED,
+                "result": None,
+                "error": None,
+                "created_at": datetime.utcnow(),
+                "started_at": None,
+                "finished_at": None,
+            }
+            if owner_id is not None:
+                self._owners[job_id] = {owner_id}
+            if dedup_key is not None:
+                self._active[dedup_key] = job_id
+            # 오래된 작업 기록부터 정리 (대기/실행 중인 작업은 유지)
+            for old_id in list(self._jobs):
+                if len(self._jobs) <= self.max_history:
+                    break
+                if self._jobs[old_id]["status"] in (SUCCEEDED, FAILED):
+                    del self._jobs[old_id]
+                    self._owners.pop(old_id, None)
+
+            self._get_executor().submit(self._run, job_id, task, args, dedup_key)
+        return job_id
+
+    def _run(self, job_id: str, task, args, dedup_key: Optional[str]) -> None:
+        job = self._jobs[job_id]
+        job["status"] = RUNNING
+        job["started_at"] = datetime.utcnow()
+        try:
+            job["result"] = task(*args)
+            job["status"] = SUCCEEDED
+        except Exception as e:
+            print(f"백그라운드 작업 오류 ({job['name']}): {str(e)}")
+            traceback.print_exc()
+            job["error"] = str(e)
+            job["status"] = FAILED
+        finally:
+            job["finished_at"] = datetime.utcnow()
+            with self._lock:
+                if dedup_key is not None and self._active.get(dedup_key) == job_id:
+                    del self._active[dedup_key]
+
+    def get(self, job_id: str, owner_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """작업 상태 (owner_id를 주면 그 사용자가 요청한 작업이 아닐 때 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or (owner_id is not None and owner_id not in self._owners.get(job_id, ())):
+                return None
+            return dict(job)
+
+    def shutdown(self) -> None:
+        # 대기 중인 작업은 취소하고 실행 중인 작업이 끝날 때까지 기다림
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            statuses = [job["status"] for job in self._jobs.values()]
+        return {
+            "backend": "local",
+            "workers": self.workers,
+            **{status: statuses.count(status) for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)},
+        }
+
+# Celery 작업 상태 -> 작업 큐 상태
+CELERY_STATUSES = {
+    "PENDING": QUEUED,
+    "RECEIVED": QUEUED,
+    "RETRY": QUEUED,
+    "STARTED": RUNNING,
+    "SUCCESS": SUCCEEDED,
+    "FAILURE": FAILED,
+    "REVOKED": FAILED,
+}
+# 아직 끝나지 않은 Celery 작업 상태 (같은 dedup_key의 작업을 새로 넣지 않음)
+CELERY_ACTIVE_STATES = ("PENDING", "RECEIVED", "RETRY", "STARTED")
+
+class CeleryJobQueue:
+    """Redis 브로커로 celery_worker.py 워커에 작업을 보내는 작업 큐"""
+
+    def __init__(self, max_active: int = 1000):
+        self.max_active = max_active
+        self._app = None
+        self._active: Dict[str, str] = {}  # dedup_key -> 마지막으로 보낸 작업 ID
+        self._lock = threading.Lock()
+
+    @property
+    def app(self):
+        if self._app is None:
+            self._app = create_celery_app()
+        return self._app
+
+    def _owner_key(self, job_id: str) -> bytes:
+        return self.app.backend.get_key_for_task(job_id, key="-owners")
+
+    def _get_owners(self, job_id: str) -> Set[int]:
+        value = self.app.backend.get(self._owner_key(job_id))
+        return set(json.loads(value)) if value else set()
+
+    def _add_owner(self, job_id: str, owner_id: Optional[int]) -> None:
+        # 여러 API 프로세스가 조회하므로 결과 백엔드(Redis)에 결과와 같은 만료 시간으로 저장
+        if owner_id is None:
+            return
+        owners = self._get_owners(job_id)
+        if owner_id not in owners:
+            self.app.backend.set(self._owner_key(job_id), json.dumps(sorted(owners | {owner_id})))
+
+    def _prune_active(self) -> None:
+        """끝난 작업의 dedup 키 정리 (_lock을 잡은 상태에서 호출)"""
+        for dedup_key, job_id in list(self._active.items()):
+            if self.app.AsyncResult(job_id).state not in CELERY_ACTIVE_STATES:
+                del self._active[dedup_key]
+
+    def enqueue(self, name: str, *args: Any, dedup_key: Optional[str] = None, owner_id: Optional[int] = None) -> str:
+        with self._lock:
+            if dedup_key is not None and dedup_key in self._active:
+                job_id = self._active[dedup_key]
+                if self.app.AsyncResult(job_id).state in CELERY_ACTIVE_STATES:
+                    self._add_owner(job_id, owner_id)
+                    return job_id
+                del self._active[dedup_key]
+            job_id = self.app.send_task(name, args=list(args)).id
+            self._add_owner(job_id, owner_id)
+            if dedup_key is not None:
+                # 결과 백엔드 조회가 필요하므로 키가 많이 쌓였을 때만 한 번에 정리
+                if len(self._active) >= self.max_active:
+                    self._prune_active()
+                self._active[dedup_key] = job_id
+        return job_id
+
+    def get(self, job_id: str, owner_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """작업 상태 (owner_id를 주면 그 사용자가 요청한 작업이 아닐 때 None)"""
+        if owner_id is not None and owner_id not in self._get_owners(job_id):
+            return None
+        # Celery는 알 수 없는 작업 ID도 PENDING으로 반환하므로 대기 중으로 표시
+        result = self.app.AsyncResult(job_id)
+        status = CELERY_STATUSES.get(result.state, QUEUED)
+        return {
+            "id": job_id,
+            "name": result.name,
+            "status": status,
+            "result": result.result if status == SUCCEEDED else None,
+            "error": str(result.result) if status == FAILED else None,
+            "created_at": None,
+            "started_at": None,
+            "finished_at": result.date_done,
+        }
+
+    def shutdown(self) -> None:
+        if self._app is not None:
+            self._app.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "celery"}
+
+def create_job_queue():
+    if settings.JOB_BACKEND == "celery":
+        return CeleryJobQueue(settings.JOB_HISTORY_MAX_ENTRIES)
+    return LocalJobQueue(settings.JOB_WORKERS, settings.JOB_HISTORY_MAX_ENTRIES)
+
+job_queue = create_job_queue()
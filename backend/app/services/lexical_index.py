@@ -0,0 +1,145 @@
+# app/services/lexical_index.py
+import math
+import heapq
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.services.ingestion import is_front_matter
+from app.services.policy_metadata import title_and_category
+from app.services.vector_store import VectorMatch
+
+# 한국어는 띄어쓰기가 일정하지 않아 공백을 제거한 문자 bigram/trigram으로 색인
+NGRAM_SIZES = (2, 3)
+
+# 제목 n-gram Dice 유사도가 이 값 이상이면 거의 일치하는 제목으로 간주
+TITLE_MATCH_THRESHOLD = 0.8
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화 후 소문자로 바꾸고 공백/문장부호를 제거합니다."""
+    text = unicodedata.normalize("NFC", text or "").lower()
+    return re.sub(r"[\W_]+", "", text)
+
+def char_ngrams(text: str, sizes: Sequence[int] = NGRAM_SIZES) -> List[str]:
+    """정규화된 텍스트의 문자 n-gram 목록 (n보다 짧은 텍스트는 그대로 사용)"""
+    normalized = normalize_text(text)
+    if not normalized:
+        return []
+    grams = []
+    for n in sizes:
+        if len(normalized) < n:
+            continue
+        grams.extend(normalized[i:i + n] for i in range(len(normalized) - n + 1))
+    return grams or [normalized]
+
+def reciprocal_rank_fusion(rankings: List[List[Any]], top_k: int, k: int = 60) -> List[Any]:
+    """여러 검색 결과 목록(match 객체, 순위순)을 RRF로 합칩니다. 같은 ID는 처음 나온 객체를 사용합니다."""
+    scores = defaultdict(float)
+    matches = {}
+    for ranking in rankings:
+        for rank, match in enumerate(ranking):
+            scores[match.id] += 1.0 / (k + rank + 1)
+            matches.setdefault(match.id, match)
+    ordered = sorted(scores, key=lambda match_id: scores[match_id], reverse=True)
+    return [matches[match_id] for match_id in ordered[:top_k]]
+
+class LexicalIndex:
+    """
+    청크 본문과 제목에 대한 문자 n-gram 역색인
+
+    search()는 n-gram BM25 점수로 본문을 검색하고, match_title()은 정책명이
+    정확히(또는 거의) 일치하는 청크를 임베딩 없이 바로 찾습니다.
+    """
+
+    def __init__(self, ids: List[str], metadata: List[Dict[str, Any]], titles: List[str], k1: float = 1.2, b: float = 0.75):
+        self.ids = ids
+        self.metadata = metadata
+        self.titles = titles
+        self.k1 = k1
+        self.b = b
+
+        # 본문 색인: n-gram -> {행: 출현 횟수}
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.doc_lengths = []
+        for row, meta in enumerate(metadata):
+            grams = Counter(char_ngrams(meta.get("text", "")))
+            for gram, count in grams.items():
+                self.postings[gram][row] = count
+            self.doc_lengths.append(sum(grams.values()))
+        self.avg_doc_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+
+        # 제목 색인: 정규화된 제목 -> 행 목록, n-gram -> 행 집합
+        self.title_keys: Dict[str, List[int]] = defaultdict(list)
+        self.title_grams: List[set] = []
+        self.title_postings: Dict[str, set] = defaultdict(set)
+        for row, title in enumerate(titles):
+            key = normalize_text(title)
+            if key:
+                self.title_keys[key].append(row)
+            grams = set(char_ngrams(title))
+            self.title_grams.append(grams)
+            for gram in grams:
+                self.title_postings[gram].add(row)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_vector_index(cls, vector_index) -> "LexicalIndex":
+        """로컬 벡터 인덱스의 청크 메타데이터로 색인을 생성합니다. (목차 청크 제외)"""
+        ids, metadata, titles = [], [], []
+        for vector_id, meta in zip(vector_index.ids, vector_index.metadata):
+            if meta.get("is_toc", is_front_matter(meta.get("page"))):
+                continue
+            ids.append(vector_id)
+            metadata.append(meta)
+            titles.append(title_and_category(meta)[0])
+        return cls(ids, metadata, titles)
+
+    def as_match(self, row: int, score: float) -> VectorMatch:
+        return VectorMatch(id=self.ids[row], score=score, metadata=self.metadata[row])
+
+    def search(self, query: str, top_k: int = 10) -> List[VectorMatch]:
+        """n-gram BM25 점수 기준 상위 top_k개 청크"""
+        if not self.ids:
+            return []
+
+        scores = defaultdict(float)
+        total = len(self.ids)
+        for gram in set(char_ngrams(query)):
+            postings = self.postings.get(gram)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for row, count in postings.items():
+                length_norm = 1 - self.b + self.b * self.doc_lengths[row] / self.avg_doc_length
+                scores[row] += idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [self.as_match(row, score) for row, score in top]
+
+    def match_title(self, query: str, top_k: int = 10, threshold: float = TITLE_MATCH_THRESHOLD) -> List[VectorMatch]:
+        """정책명이 정확히 또는 거의 일치하는 청크. 확신할 수 있는 결과가 없으면 빈 목록을 반환합니다."""
+        key = normalize_text(query)
+        if not key:
+            return []
+
+        exact_rows = self.title_keys.get(key)
+        if exact_rows:
+            return [self.as_match(row, 1.0) for row in exact_rows[:top_k]]
+
+        query_grams = set(char_ngrams(query))
+        candidates = set()
+        for gram in query_grams:
+            candidates.update(self.title_postings.get(gram, ()))
+
+        scored: List[Tuple[int, float]] = []
+        for row in candidates:
+            title_grams = self.title_grams[row]
+            dice = 2 * len(query_grams & title_grams) / (len(query_grams) + len(title_grams))
+            if dice >= threshold:
+                scored.append((row, dice))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return [self.as_match(row, score) for row, score in scored[:top_k]]
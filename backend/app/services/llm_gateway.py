@@ -0,0 +1,407 @@
+# app/services/llm_gateway.py
+"""
+OpenAI 호출 게이트웨이
+
+모든 OpenAI 호출(채팅, 임베딩)은 이 모듈을 거칩니다.
+- 분당 요청 수/토큰 수 토큰 버킷으로 클라이언트 측에서 호출 속도를 제한
+- 429, 5xx, 연결 오류는 지터를 넣은 지수 백오프로 재시도 (Retry-After 헤더 우선)
+- 재시도와 대기를 포함한 호출 1건당 제한 시간(deadline)
+- 연속 실패 시 회로를 열어 장애 중에는 호출 없이 바로 실패
+- 작업별 호출/재시도/실패 수와 지연 시간 통계 (/metrics/llm)
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import numpy as np
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+from app.core.config import settings
+from app.services.clients import get_async_openai_client, get_openai_client
+from app.services.context_builder import count_message_tokens, count_tokens
+
+# max_tokens를 지정하지 않은 채팅 요청의 응답 토큰 추정치
+DEFAULT_COMPLETION_TOKENS = 512
+
+class LLMUnavailableError(Exception):
+    """게이트웨이가 호출하지 않고 거절한 경우 (retry_after초 뒤에 다시 시도)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CircuitOpenError(LLMUnavailableError):
+    pass
+
+class RateLimitedError(LLMUnavailableError):
+    pass
+
+class TokenBucket:
+    """분당 한도만큼 채워지는 토큰 버킷. 부족하면 채워질 때까지 기다릴 시간을 예약합니다."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, max_wait: float) -> Optional[float]:
+        """amount만큼 미리 차감하고 기다려야 할 시간(초)을 반환합니다. max_wait을 넘기면 차감하지 않고 None"""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            wait = max(0.0, (amount - self.tokens) / self.rate)
+            if wait > max_wait:
+                return None
+            self.tokens -= amount
+            return wait
+
+    def credit(self, amount: float) -> None:
+        """예약을 취소하거나 추정치와 실제 사용량의 차이를 돌려줍니다. (음수면 추가 차감)"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번이면 회로를 열고 reset_seconds 동안 모든 호출을 거절합니다.
+    그 뒤에는 시험 호출 하나만 허용해서 성공하면 닫고, 실패하면 다시 엽니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.reset_seconds - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError("OpenAI 호출 회로가 열려 있습니다.", retry_after=remaining)
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    raise CircuitOpenError("OpenAI 호출 회로 시험 중입니다.", retry_after=1.0)
+                self._probing = True
+
+    def release(self) -> None:
+        """호출하지 않고 끝난 경우 (시험 호출 자리를 돌려줌)"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+        }
+
+def _percentile(values, q: float) -> Optional[float]:
+    if not values:
+        return None
+    return float(np.percentile(np.fromiter(values, dtype=np.float64), q))
+
+class _OperationStats:
+    def __init__(self):
+        self.calls = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.rejected = 0  # 회로 열림/속도 제한으로 호출하지 않고 거절
+        self.latencies = deque(maxlen=1000)
+        self.throttle_waits = deque(maxlen=1000)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "p50_ms": _percentile(self.latencies, 50),
+            "p95_ms": _percentile(self.latencies, 95),
+            "p99_ms": _percentile(self.latencies, 99),
+            "p95_throttle_wait_ms": _percentile(self.throttle_waits, 95),
+        }
+
+def is_transient_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류 (429, 5xx, 연결 오류/시간 초과)"""
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def estimate_chat_tokens(request: Dict[str, Any]) -> int:
+    """채팅 요청이 사용할 토큰 수 추정치 (프롬프트 + 최대 응답 길이)"""
+    return count_message_tokens(request.get("messages", [])) + (request.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+def estimate_embedding_tokens(request: Dict[str, Any]) -> int:
+    texts = request.get("input", "")
+    if isinstance(texts, str):
+        texts = [texts]
+    return sum(count_tokens(text) for text in texts)
+
+class LLMGateway:
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_retries: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        deadline_seconds: float,
+        breaker: CircuitBreaker,
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.deadline_seconds = deadline_seconds
+        self.breaker = breaker
+        self._operations: Dict[str, _OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats_for(self, operation: str) -> _OperationStats:
+        with self._lock:
+            if operation not in self._operations:
+                self._operations[operation] = _OperationStats()
+            return self._operations[operation]
+
+    def _reserve(self, estimated_tokens: int, deadline: float) -> float:
+        """요청 1건과 추정 토큰을 예약하고 기다릴 시간을 반환합니다. 제한 시간 안에 못 채우면 RateLimitedError"""
+        max_wait = deadline - time.monotonic()
+        waits = []
+        reserved = []
+        for bucket, amount in ((self.request_bucket, 1), (self.token_bucket, estimated_tokens)):
+            if bucket is None:
+                continue
+            wait = bucket.reserve(amount, max_wait)
+            if wait is None:
+                for reserved_bucket, reserved_amount in reserved:
+                    reserved_bucket.credit(reserved_amount)
+                raise RateLimitedError("OpenAI 분당 호출 한도를 초과했습니다.", retry_after=max(1.0, 60.0 * amount / bucket.capacity))
+            reserved.append((bucket, amount))
+            waits.append(wait)
+        return max(waits, default=0.0)
+
+    def _reconcile(self, estimated_tokens: int, result: Any) -> None:
+        # 응답의 실제 사용량으로 토큰 버킷 보정 (스트리밍 응답은 사용량이 마지막에 오므로 추정치 유지)
+        usage = getattr(result, "usage", None)
+        total_tokens = getattr(usage, "total_tokens", None)
+        if self.token_bucket is not None and isinstance(total_tokens, int):
+            self.token_bucket.credit(estimated_tokens - total_tokens)
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: float) -> Optional[float]:
+        """다시 시도할 때까지 기다릴 시간. 재시도하지 않을 오류이거나 제한 시간을 넘기면 None"""
+        if not is_transient_error(error) or attempt >= self.max_retries:
+            return None
+        # full jitter: 0 ~ min(최대, 기본 * 2^시도) 사이에서 무작위로 기다림
+        delay = _retry_after(error)
+        if delay is None:
+            delay = random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** attempt))
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        return max(0.1, min(settings.OPENAI_TIMEOUT_SECONDS, deadline - time.monotonic()))
+
+    def _finish(self, stats: _OperationStats, started: float, error: Optional[Exception]) -> None:
+        if error is None:
+            stats.succeeded += 1
+            self.breaker.record_success()
+        elif isinstance(error, LLMUnavailableError):
+            stats.rejected += 1
+            self.breaker.release()
+        else:
+            stats.failed += 1
+            # 잘못된 요청(4xx) 등은 서비스 장애가 아니므로 회로에 반영하지 않음
+            if is_transient_error(error):
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+        stats.latencies.append((time.monotonic() - started) * 1000)
+
+    def call(self, operation: str, fn: Callable[[float], Any], estimated_tokens: int, timeout: Optional[float] = None) -> Any:
+        """
+        fn(요청 제한 시간)을 속도 제한/재시도/회로 차단기를 적용해 호출합니다. (스레드풀 경로용)
+        재시도가 끝나도 실패하면 마지막 OpenAI 오류를 그대로 전달합니다.
+        """
+        stats = self._stats_for(operation)
+        started = time.monotonic()
+        deadline = started + (timeout if timeout is not None else self.deadline_seconds)
+        stats.calls += 1
+        try:
+            self.breaker.before_call()
+        except LLMUnavailableError:
+            stats.rejected += 1
+            raise
+
+        attempt = 0
+        try:
+            while True:
+                wait = self._reserve(estimated_tokens, deadline)
+                stats.throttle_waits.append(wait * 1000)
+                if wait:
+                    time.sleep(wait)
+                try:
+                    result = fn(self._attempt_timeout(deadline))
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt, deadline)
+                    if delay is None:
+                        raise
+                    print(f"OpenAI {operation} 호출 재시도 ({attempt + 1}/{self.max_retries}, {delay:.2f}초 후): {str(e)}")
+                    stats.retries += 1
+                    attempt += 1
+                    time.sleep(delay)
+                    continue
+                self._reconcile(estimated_tokens, result)
+                self._finish(stats, started, None)
+                return result
+        except Exception as e:
+            self._finish(stats, started, e)
+            raise
+
+    async def acall(self, operation: str, fn: Callable[[float], Awaitable[Any]], estimated_tokens: int, timeout: Optional[float] = None) -> Any:
+        """call()의 비동기 버전 (이벤트 루프 경로용)"""
+        stats = self._stats_for(operation)
+        started = time.monotonic()
+        deadline = started + (timeout if timeout is not None else self.deadline_seconds)
+        stats.calls += 1
+        try:
+            self.breaker.before_call()
+        except LLMUnavailableError:
+            stats.rejected += 1
+            raise
+
+        attempt = 0
+        try:
+            while True:
+                wait = self._reserve(estimated_tokens, deadline)
+                stats.throttle_waits.append(wait * 1000)
+                if wait:
+                    await asyncio.sleep(wait)
+                try:
+                    result = await fn(self._attempt_timeout(deadline))
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt, deadline)
+                    if delay is None:
+                        raise
+                    print(f"OpenAI {operation} 호출 재시도 ({attempt + 1}/{self.max_retries}, {delay:.2f}초 후): {str(e)}")
+                    stats.retries += 1
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                self._reconcile(estimated_tokens, result)
+                self._finish(stats, started, None)
+                return result
+        except asyncio.CancelledError:
+            # 호출자가 취소한 경우(asyncio.wait_for 시간 초과 등)는 실패로 세지 않고 시험 호출 자리만 돌려줌
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self._finish(stats, started, e)
+            raise
+
+    def create_chat_completion(self, client=None, timeout: Optional[float] = None, **request) -> Any:
+        """chat.completions.create (stream=True면 응답 스트림을 반환하며, 스트림 생성까지만 재시도)"""
+        client = client if client is not None else get_openai_client()
+        operation = "chat_stream" if request.get("stream") else "chat"
+        return self.call(
+            operation,
+            lambda attempt_timeout: client.chat.completions.create(timeout=attempt_timeout, **request),
+            estimate_chat_tokens(request),
+            timeout,
+        )
+
+    def create_embedding(self, client=None, timeout: Optional[float] = None, **request) -> Any:
+        client = client if client is not None else get_openai_client()
+        return self.call(
+            "embedding",
+            lambda attempt_timeout: client.embeddings.create(timeout=attempt_timeout, **request),
+            estimate_embedding_tokens(request),
+            timeout,
+        )
+
+    async def acreate_chat_completion(self, client=None, timeout: Optional[float] = None, **request) -> Any:
+        client = client if client is not None else get_async_openai_client()
+        return await self.acall(
+            "chat",
+            lambda attempt_timeout: client.chat.completions.create(timeout=attempt_timeout, **request),
+            estimate_chat_tokens(request),
+            timeout,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = dict(self._operations)
+        return {
+            "requests_per_minute": self.request_bucket.capacity if self.request_bucket else None,
+            "tokens_per_minute": self.token_bucket.capacity if self.token_bucket else None,
+            "available_requests": self.request_bucket.available() if self.request_bucket else None,
+            "available_tokens": self.token_bucket.available() if self.token_bucket else None,
+            "circuit": self.breaker.stats(),
+            "operations": {name: operation.stats() for name, operation in operations.items()},
+        }
+
+llm_gateway = LLMGateway(
+    requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+    max_retries=settings.OPENAI_MAX_RETRIES,
+    retry_base_seconds=settings.OPENAI_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.OPENAI_RETRY_MAX_SECONDS,
+    deadline_seconds=settings.OPENAI_DEADLINE_SECONDS,
+    breaker=CircuitBreaker(
+        failure_threshold=settings.OPENAI_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds=settings.OPENAI_CIRCUIT_RESET_SECONDS,
+    ),
+)
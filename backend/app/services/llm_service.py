@@ -1,40 +1,42 @@
 # app/services/llm_service.py
-import os
+import time
 from openai import OpenAI
-from pinecone import Pinecone
-from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from app.services.answer_cache import answer_cache, profile_bucket
+from app.core.config import settings
+from app.services.clients import get_index_version, get_openai_client, get_vector_index
+from app.services.context_builder import CHAT_MODEL, PackedContext, build_context, context_stats, count_message_tokens
+from app.services.embedding_cache import embedding_cache
+from app.services.llm_gateway import llm_gateway
 
-# .env 파일 로드
-load_dotenv()
-
-# 환경 변수 가져오기
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "labor-policy")
+EMBEDDING_MODEL = "text-embedding-3-small"
 
 class RAGService:
-    def __init__(self):
-        # OpenAI 클라이언트 초기화
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+    def __init__(self, client: OpenAI = None, index=None):
+        # 공유 OpenAI 클라이언트 (커넥션 풀 재사용)
+        self.client = client if client is not None else get_openai_client()
         
-        # Pinecone 초기화
-        self.pc = Pinecone(api_key=PINECONE_API_KEY)
-        self.index = self.pc.Index(INDEX_NAME)
+        # 벡터 검색 인덱스 (Pinecone 또는 로컬 인덱스)
+        self.index = index if index is not None else get_vector_index()
     
     def get_embedding(self, text: str) -> List[float]:
-        """텍스트에 대한 임베딩 벡터를 생성합니다."""
-        response = self.client.embeddings.create(
+        """텍스트에 대한 임베딩 벡터를 생성합니다. (같은 쿼리는 캐시에서 반환)"""
+        return embedding_cache.get_or_create(text, EMBEDDING_MODEL, self._create_embedding)
+    
+    def _create_embedding(self, text: str) -> List[float]:
+        response = llm_gateway.create_embedding(
+            self.client,
             input=text,
-            model="text-embedding-3-small"
+            model=EMBEDDING_MODEL
         )
         return response.data[0].embedding
     
-    def search_similar_chunks(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def search_similar_chunks(self, query: str, top_k: int = 5, query_embedding: Optional[List[float]] = None) -> List[Dict[str, Any]]:
         """쿼리와 유사한 청크를 검색합니다."""
-        query_embedding = self.get_embedding(query)
+        if query_embedding is None:
+            query_embedding = self.get_embedding(query)
         
-        # Pinecone에서 유사한 벡터 검색
+        # 벡터 인덱스에서 유사한 벡터 검색
         results = self.index.query(
             vector=query_embedding,
             top_k=top_k,
@@ -43,32 +45,132 @@ class RAGService:
         
         return results.matches
     
-    def generate_response(self, query: str, user_profile: Dict = None) -> str:
-        """쿼리에 대한 응답을 생성합니다."""
-        # 유사한 청크 검색
-        similar_chunks = self.search_similar_chunks(query)
+    def generate_response(self, query: str, user_profile: Dict = None, cache_bucket: Optional[str] = None) -> str:
+        """
+        쿼리에 대한 응답을 생성합니다.
+        같은 프로필 버킷에서 의미가 거의 같은 질문에 답한 적이 있으면 저장된 답변을 반환합니다.
+        """
+        started = time.perf_counter()
+        query_embedding = self.get_embedding(query)
+        bucket = cache_bucket or profile_bucket(user_profile)
+        index_version = get_index_version()
         
-        # 컨텍스트 구성
-        context = "\n\n".join([match.metadata["text"] for match in similar_chunks])
+        cached = answer_cache.lookup(query_embedding, bucket, index_version)
+        if cached is not None:
+            answer_cache.record_latency(True, time.perf_counter() - started)
+            return cached
         
-        # 프롬프트 구성
-        prompt = self._build_prompt(query, context, user_profile)
+        response = self._generate_answer(query, user_profile, query_embedding)
+        # 토큰 사용량은 이번 요청의 값이므로 캐시에는 답변과 출처만 저장
+        answer_cache.store(query_embedding, bucket, {"answer": response["answer"], "sources": response["sources"]}, index_version)
+        answer_cache.record_latency(False, time.perf_counter() - started)
+        return response
+    
+    def _generate_answer(self, query: str, user_profile: Optional[Dict], query_embedding: List[float]) -> Dict[str, Any]:
+        """검색한 청크를 근거로 LLM 답변을 생성합니다."""
+        context, messages = self._prepare_answer(query, user_profile, query_embedding)
         
         # 응답 생성
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": prompt["system"]},
-                {"role": "user", "content": prompt["user"]}
-            ],
+        response = llm_gateway.create_chat_completion(
+            self.client,
+            model=CHAT_MODEL,
+            messages=messages,
             temperature=0.7,
             max_tokens=1000
         )
         
         return {
             "answer": response.choices[0].message.content,
-            "sources": [{"page": match.metadata.get("page", "N/A"), "text": match.metadata["text"][:200] + "..."} 
-                      for match in similar_chunks]
+            "sources": self._format_sources(context.matches),
+            "usage": self._record_usage(context, messages, getattr(response, "usage", None))
+        }
+    
+    def stream_response(self, query: str, user_profile: Dict = None, cache_bucket: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        응답을 스트리밍으로 생성합니다.
+        출처({"type": "sources"})를 먼저 보내고, 답변 토큰({"type": "token"})을 생성되는 대로 보낸 뒤
+        마지막에 전체 답변({"type": "done"})을 보냅니다.
+        """
+        started = time.perf_counter()
+        query_embedding = self.get_embedding(query)
+        bucket = cache_bucket or profile_bucket(user_profile)
+        index_version = get_index_version()
+        
+        cached = answer_cache.lookup(query_embedding, bucket, index_version)
+        if cached is not None:
+            answer_cache.record_latency(True, time.perf_counter() - started)
+            yield {"type": "sources", "sources": cached["sources"]}
+            yield {"type": "token", "content": cached["answer"]}
+            yield {"type": "done", **cached}
+            return
+        
+        context, messages = self._prepare_answer(query, user_profile, query_embedding)
+        sources = self._format_sources(context.matches)
+        yield {"type": "sources", "sources": sources}
+        
+        stream = llm_gateway.create_chat_completion(
+            self.client,
+            model=CHAT_MODEL,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1000,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        tokens = []
+        usage = None
+        for chunk in stream:
+            # 마지막 청크에는 choices 없이 토큰 사용량만 들어 있음
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                tokens.append(content)
+                yield {"type": "token", "content": content}
+        
+        response = {
+            "answer": "".join(tokens),
+            "sources": sources,
+            "usage": self._record_usage(context, messages, usage)
+        }
+        # 토큰 사용량은 이번 요청의 값이므로 캐시에는 답변과 출처만 저장
+        answer_cache.store(query_embedding, bucket, {"answer": response["answer"], "sources": response["sources"]}, index_version)
+        answer_cache.record_latency(False, time.perf_counter() - started)
+        yield {"type": "done", **response}
+    
+    def _prepare_answer(self, query: str, user_profile: Optional[Dict], query_embedding: List[float]) -> Tuple[PackedContext, List[Dict[str, str]]]:
+        """유사한 청크를 검색해 토큰 예산 안의 컨텍스트를 만들고 LLM에 보낼 메시지를 구성합니다."""
+        # 유사한 청크 검색
+        similar_chunks = self.search_similar_chunks(
+            query, top_k=settings.CHAT_CONTEXT_CANDIDATES, query_embedding=query_embedding
+        )
+        
+        # 컨텍스트 구성 (겹치는 청크는 이어 붙이고 점수순으로 예산까지)
+        context = build_context(similar_chunks, settings.CHAT_CONTEXT_TOKEN_BUDGET)
+        
+        # 프롬프트 구성
+        prompt = self._build_prompt(query, context.text, user_profile)
+        
+        messages = [
+            {"role": "system", "content": prompt["system"]},
+            {"role": "user", "content": prompt["user"]}
+        ]
+        return context, messages
+    
+    def _format_sources(self, similar_chunks: List[Any]) -> List[Dict[str, Any]]:
+        return [{"page": match.metadata.get("page", "N/A"), "text": match.metadata["text"][:200] + "..."} 
+                for match in similar_chunks]
+    
+    def _record_usage(self, context: PackedContext, messages: List[Dict[str, str]], usage: Any = None) -> Dict[str, int]:
+        """요청의 프롬프트 토큰 수 (API 응답 값이 있으면 그 값을 사용)"""
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or count_message_tokens(messages)
+        context_stats.record(prompt_tokens, context)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "context_tokens": context.tokens,
+            "raw_context_tokens": context.raw_tokens,
         }
     
     def _build_prompt(self, query: str, context: str, user_profile: Dict = None) -> Dict[str, str]:
@@ -0,0 +1,27 @@
+# app/services/notification.py
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Notification
+
+def create_notification(
+    db: Session,
+    user_id: int,
+    title: str,
+    content: str,
+    notification_type: Optional[str] = None,
+    related_policy_id: Optional[int] = None,
+) -> Notification:
+    """사용자 알림 저장 (/profiles/me/notifications에서 조회)"""
+    notification = Notification(
+        user_id=user_id,
+        title=title,
+        content=content,
+        type=notification_type,
+        related_policy_id=related_policy_id
+    )
+    db.add(notification)
+    db.commit()
+    db.refresh(notification)
+    return notification
@@ -1,32 +1,34 @@
-import os
-from typing import List, Dict, Any
-from pinecone import Pinecone
+from typing import List, Dict, Any, Optional
 from openai import OpenAI
-from dotenv import load_dotenv
 import json
+from app.services.clients import get_openai_client, get_vector_index
+from app.services.embedding_cache import embedding_cache
+from app.services.llm_gateway import llm_gateway
+from app.services.ingestion import query_serving_chunks
+from app.services.policy_metadata import title_and_category
 
-# .env 파일 로드
-load_dotenv()
+EMBEDDING_MODEL = "text-embedding-3-small"
 
-# 환경 변수 가져오기
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "labor-policy")
+# profile_to_query 프롬프트를 바꾸면 올려서 프로필 유형별로 저장된 검색어를 다시 생성하게 함
+PROFILE_QUERY_PROMPT_VERSION = 1
 
 class PolicyMatcher:
-    def __init__(self):
-        # OpenAI 클라이언트 초기화
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+    def __init__(self, client: OpenAI = None, index=None):
+        # 공유 OpenAI 클라이언트 (커넥션 풀 재사용)
+        self.client = client if client is not None else get_openai_client()
         
-        # Pinecone 초기화
-        self.pc = Pinecone(api_key=PINECONE_API_KEY)
-        self.index = self.pc.Index(INDEX_NAME)
+        # 벡터 검색 인덱스 (Pinecone 또는 로컬 인덱스)
+        self.index = index if index is not None else get_vector_index()
     
     def get_embedding(self, text: str) -> List[float]:
-        """텍스트에 대한 임베딩 벡터를 생성합니다."""
-        response = self.client.embeddings.create(
+        """텍스트에 대한 임베딩 벡터를 생성합니다. (같은 쿼리는 캐시에서 반환)"""
+        return embedding_cache.get_or_create(text, EMBEDDING_MODEL, self._create_embedding)
+    
+    def _create_embedding(self, text: str) -> List[float]:
+        response = llm_gateway.create_embedding(
+            self.client,
             input=text,
-            model="text-embedding-3-small"
+            model=EMBEDDING_MODEL
         )
         return response.data[0].embedding
     
@@ -85,7 +87,8 @@ class PolicyMatcher:
         검색어만 작성하고 다른 설명은 포함하지 마세요.
         """
         
-        response = self.client.chat.completions.create(
+        response = llm_gateway.create_chat_completion(
+            self.client,
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "당신은 사용자 프로필을 분석하여 관련 고용노동 정책을 찾기 위한 키워드를 생성하는 전문가입니다."},
@@ -119,7 +122,8 @@ class PolicyMatcher:
         """
         
         try:
-            response = self.client.chat.completions.create(
+            response = llm_gateway.create_chat_completion(
+                self.client,
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "당신은 고용노동 정책 전문가입니다. 정책 내용을 일반인이 이해하기 쉽게 요약하는 역할을 합니다."},
@@ -155,7 +159,8 @@ class PolicyMatcher:
         위 정책이 이 사용자에게 어떻게 도움이 될 수 있는지 2-3문장으로 간략히 설명해주세요.
         """
         
-        response = self.client.chat.completions.create(
+        response = llm_gateway.create_chat_completion(
+            self.client,
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "당신은 고용노동 정책 전문가입니다. 사용자에게 맞춤형 정책 추천을 제공합니다."},
@@ -167,36 +172,34 @@ class PolicyMatcher:
         
         return response.choices[0].message.content.strip()
     
-    def recommend_policies(self, profile: Dict[str, Any], top_k: int = 5) -> List[Dict[str, Any]]:
-        """사용자 프로필에 기반하여 정책을 추천합니다."""
+    def recommend_policies(
+        self,
+        profile: Dict[str, Any],
+        top_k: int = 5,
+        query: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        사용자 프로필에 기반하여 정책을 추천합니다.
+        프로필 유형별로 저장된 검색어/임베딩을 넘기면 LLM과 임베딩 호출을 생략합니다.
+        """
         # 프로필을 쿼리로 변환
-        query = self.profile_to_query(profile)
+        if query is None:
+            query = self.profile_to_query(profile)
         
         # 쿼리 임베딩 생성
-        query_embedding = self.get_embedding(query)
+        if query_embedding is None:
+            query_embedding = self.get_embedding(query)
         
-        # Pinecone에서 유사한 정책 검색 - 더 많은 결과를 가져옴 (목차 페이지 필터링 후 충분한 결과 확보를 위해)
-        results = self.index.query(
-            vector=query_embedding,
-            top_k=top_k * 3,  # 3배 더 많은 결과 가져오기
-            include_metadata=True
-        )
+        # 벡터 인덱스에서 유사한 정책 검색 (목차 청크는 필터로 제외)
+        matches = query_serving_chunks(self.index, query_embedding, top_k)
         
-        # 결과 가공 - 페이지 번호가 20 이하인 항목 제외
+        # 결과 가공
         recommendations = []
-        for match in results.matches:
-            # 페이지 번호 확인
+        for match in matches:
             page = match.metadata.get("page", "0")
-            try:
-                page_num = int(page)
-                # 목차 페이지(1-20) 건너뛰기
-                if page_num <= 20:
-                    continue
-            except (ValueError, TypeError):
-                # 페이지 번호를 파싱할 수 없으면 포함
-                pass
-                
             policy_text = match.metadata.get("text", "")
+            title, category = title_and_category(match.metadata)
             
             # 기본 정책 정보
             policy_info = {
@@ -205,8 +208,8 @@ class PolicyMatcher:
                 "score": match.score,
                 "policy_keywords": query, # 생성된 쿼리 키워드도 함께 반환
                 "policy_id": match.metadata.get("policy_id", "") or match.id,
-                "title": match.metadata.get("title", "") or self.extract_title_from_text(policy_text),
-                "category": self.extract_category(policy_text)
+                "title": title,
+                "category": category
             }
             
             # 사용자 친화적인 요약 추가 (시간이 오래 걸리므로 선택적으로 활성화)
@@ -214,37 +217,6 @@ class PolicyMatcher:
             # policy_info.update(user_friendly_summary)
             
             recommendations.append(policy_info)
-            
-            # 원하는 개수의 추천 항목을 얻으면 중단
-            if len(recommendations) >= top_k:
-                break
         
-        return recommendations[:top_k]  # 원하는 개수만큼만 반환
-    
-    def extract_title_from_text(self, text: str) -> str:
-        """텍스트에서 제목 추출 (첫번째 유의미한 줄 사용)"""
-        lines = text.strip().split("\n")
-        for line in lines:
-            line = line.strip()
-            if line and len(line) < 100:  # 적당한 길이의 줄 찾기
-                return line
-        return "제목 없음"
-    
-    def extract_category(self, text: str) -> str:
-        """텍스트 내용 기반으로 카테고리 추정"""
-        categories = {
-            "청년": ["청년", "20대", "30대", "학졸자", "구직자"],
-            "고령자": ["고령자", "신중년", "50대", "60대"],
-            "장애인": ["장애인", "중증장애", "경증장애"],
-            "여성": ["여성", "육아", "출산", "모성"],
-            "외국인": ["외국인", "다문화", "이주민"],
-            "사업주": ["사업주", "기업", "고용주", "사업장"],
-            "직업능력개발": ["직업훈련", "능력개발", "자격증", "교육훈련"]
-        }
-        
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return category
-        
-        return "기타"
\ No newline at end of file
+        return recommendations
+    
\ No newline at end of file
@@ -0,0 +1,95 @@
+# app/services/policy_metadata.py
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+# 카테고리별 키워드 (앞에 있는 카테고리가 우선)
+CATEGORY_KEYWORDS = {
+    "청년": ["청년", "20대", "30대", "학졸자", "구직자"],
+    "고령자": ["고령자", "신중년", "50대", "60대"],
+    "장애인": ["장애인", "중증장애", "경증장애"],
+    "여성": ["여성", "육아", "출산", "모성"],
+    "외국인": ["외국인", "다문화", "이주민"],
+    "사업주": ["사업주", "기업", "고용주", "사업장"],
+    "직업능력개발": ["직업훈련", "능력개발", "자격증", "교육훈련"]
+}
+
+DEFAULT_CATEGORY = "기타"
+DEFAULT_TITLE = "제목 없음"
+
+class KeywordClassifier:
+    """
+    Aho-Corasick 오토마톤 기반 다중 키워드 분류기
+
+    모든 키워드를 하나의 오토마톤으로 컴파일해 텍스트를 한 번만 훑으며,
+    일치한 키워드 중 우선순위가 가장 높은 카테고리를 반환합니다.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], default: str):
+        self.labels = list(categories)
+        self.default = default
+
+        # goto: 상태별 {문자: 다음 상태}, output: 상태에서 끝나는 키워드의 최고 우선순위
+        self.goto: List[Dict[str, int]] = [{}]
+        self.output: List[int] = [len(self.labels)]
+        for priority, keywords in enumerate(categories.values()):
+            for keyword in keywords:
+                state = 0
+                for char in keyword:
+                    if char not in self.goto[state]:
+                        self.goto.append({})
+                        self.output.append(len(self.labels))
+                        self.goto[state][char] = len(self.goto) - 1
+                    state = self.goto[state][char]
+                self.output[state] = min(self.output[state], priority)
+
+        # 실패 링크를 BFS로 계산하고 접미사 상태의 출력을 합침
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = min(self.output[next_state], self.output[self.fail[next_state]])
+                queue.append(next_state)
+
+    def classify(self, text: str) -> str:
+        """텍스트에 포함된 키워드 중 우선순위가 가장 높은 카테고리"""
+        best = len(self.labels)
+        state = 0
+        for char in text or "":
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state] < best:
+                best = self.output[state]
+                if best == 0:
+                    break
+        return self.labels[best] if best < len(self.labels) else self.default
+
+    def classify_batch(self, texts: List[str]) -> List[str]:
+        return [self.classify(text) for text in texts]
+
+category_classifier = KeywordClassifier(CATEGORY_KEYWORDS, DEFAULT_CATEGORY)
+
+def extract_title_from_text(text: str) -> str:
+    """텍스트에서 제목 추출 (첫번째 유의미한 줄 사용)"""
+    lines = text.strip().split("\n")
+    for line in lines:
+        line = line.strip()
+        if line and len(line) < 100:  # 적당한 길이의 줄 찾기
+            return line
+    return DEFAULT_TITLE
+
+def extract_category(text: str) -> str:
+    """텍스트 내용 기반으로 카테고리 추정"""
+    return category_classifier.classify(text)
+
+def title_and_category(metadata: Dict[str, Any]) -> Tuple[str, str]:
+    """청크 메타데이터의 제목/카테고리 (적재 시 계산된 값이 없을 때만 본문에서 추출)"""
+    text = metadata.get("text", "")
+    title = metadata.get("title") or extract_title_from_text(text)
+    category = metadata.get("category") or extract_category(text)
+    return title, category
@@ -0,0 +1,227 @@
+# app/services/policy_summaries.py
+import asyncio
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.singleflight import openai_flight, request_key
+from app.db.models import PolicySummary
+from app.services.description_cache import description_cache, normalize_profile
+from app.services.llm_gateway import llm_gateway
+
+# 요약 프롬프트가 바뀌면 올려서 저장된 요약을 모두 다시 생성하게 함
+SUMMARY_PROMPT_VERSION = 1
+
+# 프롬프트에 넣는 정책 본문 최대 길이
+POLICY_TEXT_LIMIT = 3000
+
+# 검색 결과 LLM 요약의 프로세스 전체 동시 호출 수 제한
+summary_semaphore = asyncio.Semaphore(settings.LLM_SUMMARY_CONCURRENCY)
+
+# LLM 설명 생성 실패 시 사용하는 기본 설명
+DEFAULT_POLICY_DESCRIPTION = {
+    "summary": "이 정책은 고용노동부에서 제공하는 지원 제도입니다. 자세한 내용은 상세 정보를 확인해주세요.",
+    "eligibility": ["해당 정책의 지원 대상 정보를 확인할 수 없습니다."],
+    "benefits": ["해당 정책의 혜택 정보를 확인할 수 없습니다."],
+    "application": "자세한 신청 방법은 고용노동부 홈페이지나 관련 기관에 문의하세요."
+}
+
+def build_policy_description_request(policy_text: str, user_profile: Optional[Dict] = None) -> Dict[str, Any]:
+    """정책 설명 생성용 chat completion 요청 인자"""
+    # 프로필 정보가 있으면 사용자 맞춤형 설명 추가
+    profile_context = ""
+    if user_profile:
+        profile_context = f"""
+        다음은 사용자 프로필 정보입니다:
+        {json.dumps(user_profile, ensure_ascii=False, indent=2)}
+        
+        위 사용자에게 이 정책이 어떻게 도움이 될 수 있는지 고려하여 설명해주세요.
+        """
+    
+    prompt = f"""
+    다음은 고용노동부 정책 내용입니다:
+    {policy_text[:POLICY_TEXT_LIMIT]}  # 정책 텍스트 길이 제한
+    
+    다음 정보를 추출해서 JSON 형식으로 반환해주세요:
+    1. "summary": 이 정책의 핵심 내용을 3-4문장으로 요약 (일반인이 이해하기 쉽게)
+    2. "eligibility": 이 정책의 대상자/신청자격을 2-4가지 항목으로 정리 (리스트 형식)
+    3. "benefits": 이 정책의 주요 혜택을 2-4가지 항목으로 추출 (리스트 형식)
+    4. "application": 신청 방법을 1-2문장으로 간략히 설명
+    
+    {profile_context}
+    
+    JSON 형식으로 반환해주세요. 각 항목은 간결하고 이해하기 쉽게 작성해주세요.
+    """
+    
+    return {
+        "model": "gpt-3.5-turbo",
+        "messages": [
+            {"role": "system", "content": "당신은 고용노동부 정책을 일반인이 이해하기 쉽게 설명해주는 전문가입니다."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,
+        "response_format": {"type": "json_object"}
+    }
+
+def _create_description(request: Dict[str, Any]) -> Dict:
+    response = llm_gateway.create_chat_completion(**request)
+    # JSON 파싱
+    return json.loads(response.choices[0].message.content)
+
+def generate_user_friendly_policy_description(policy_text: str, user_profile: Optional[Dict] = None) -> Dict:
+    """
+    정책 텍스트를 사용자 친화적인 형태로 변환.
+    (본문, 프로필 묶음, 프롬프트 버전)별로 캐시하므로 비슷한 프로필의 사용자는 같은 설명을 공유합니다.
+    """
+    profile = normalize_profile(user_profile)
+    policy_text = (policy_text or "")[:POLICY_TEXT_LIMIT]
+    key = description_cache.make_key(SUMMARY_PROMPT_VERSION, policy_text, profile)
+    
+    try:
+        return description_cache.get_or_create(
+            key, lambda: _create_description(build_policy_description_request(policy_text, profile))
+        )
+    except Exception as e:
+        print(f"정책 설명 생성 오류: {str(e)}")
+        # 실패한 경우 기본값 반환 (캐시하지 않음)
+        return dict(DEFAULT_POLICY_DESCRIPTION)
+
+async def agenerate_user_friendly_policy_description(
+    policy_text: str,
+    user_profile: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Optional[Dict]:
+    """
+    정책 설명 생성 (비동기). 동기 버전과 같은 키로 2단계 캐시를 사용하고,
+    동시 호출 수는 세마포어로 제한하며, 제한 시간을 넘기거나 실패하면 None을 반환해 원문으로 표시하게 합니다.
+    """
+    timeout = timeout if timeout is not None else settings.LLM_SUMMARY_TIMEOUT_SECONDS
+    
+    profile = normalize_profile(user_profile)
+    policy_text = (policy_text or "")[:POLICY_TEXT_LIMIT]
+    key = description_cache.make_key(SUMMARY_PROMPT_VERSION, policy_text, profile)
+    request = build_policy_description_request(policy_text, profile)
+    
+    async def _create() -> Dict:
+        async with semaphore or summary_semaphore:
+            response = await llm_gateway.acreate_chat_completion(timeout=timeout, **request)
+        return json.loads(response.choices[0].message.content)
+    
+    try:
+        return await asyncio.wait_for(description_cache.aget_or_create(key, _create), timeout=timeout)
+    except asyncio.TimeoutError:
+        print(f"정책 설명 생성 시간 초과 ({timeout}초)")
+    except Exception as e:
+        print(f"정책 설명 생성 오류: {str(e)}")
+    return None
+
+def summary_content_hash(policy_text: str) -> str:
+    """요약 입력(프롬프트 버전 + 본문)의 해시. 값이 바뀌면 저장된 요약을 다시 생성해야 함"""
+    source = f"{SUMMARY_PROMPT_VERSION}\n{(policy_text or '')[:POLICY_TEXT_LIMIT]}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def summary_fields(row: PolicySummary) -> Dict[str, Any]:
+    return {
+        "summary": row.summary,
+        "eligibility": row.eligibility or [],
+        "benefits": row.benefits or [],
+        "application": row.application,
+    }
+
+def _load_summary_rows(db: Session, policy_texts: Dict[str, str]) -> Dict[str, PolicySummary]:
+    if not policy_texts:
+        return {}
+    rows = db.query(PolicySummary).filter(PolicySummary.vector_id.in_(list(policy_texts))).all()
+    return {row.vector_id: row for row in rows}
+
+def get_stored_summaries(db: Session, policy_texts: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    청크(벡터 ID -> 본문)의 미리 생성된 요약을 한 번의 쿼리로 가져옵니다.
+    본문이 바뀌어 해시가 다른 요약은 제외합니다.
+    """
+    rows = _load_summary_rows(db, policy_texts)
+    return {
+        vector_id: summary_fields(row)
+        for vector_id, row in rows.items()
+        if row.content_hash == summary_content_hash(policy_texts[vector_id])
+    }
+
+async def describe_policies(db: AsyncSession, policy_texts: Dict[str, str], user_profile: Optional[Dict] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    청크(벡터 ID -> 본문)의 사용자 친화적 설명.
+    저장된 요약을 먼저 사용하고, 없는 청크만 LLM으로 동시에 생성합니다. (시간 초과/실패한 청크는 None)
+    생성한 설명은 프로필 묶음별 설명 캐시를 거치므로 같은 묶음의 다른 사용자도 다시 생성하지 않고,
+    프로필 묶음이 없는 설명은 일괄 생성 작업과 같은 요약이므로 저장해 다음 요청부터 바로 반환합니다.
+    """
+    rows = await db.run_sync(_load_summary_rows, policy_texts)
+    hashes = {vector_id: summary_content_hash(text) for vector_id, text in policy_texts.items()}
+    
+    descriptions: Dict[str, Optional[Dict[str, Any]]] = {}
+    pending = []
+    for vector_id in policy_texts:
+        row = rows.get(vector_id)
+        if row is not None and row.content_hash == hashes[vector_id]:
+            descriptions[vector_id] = summary_fields(row)
+        else:
+            pending.append(vector_id)
+    
+    generated = await asyncio.gather(*[
+        agenerate_user_friendly_policy_description(policy_texts[vector_id], user_profile)
+        for vector_id in pending
+    ])
+    descriptions.update(zip(pending, generated))
+    
+    if normalize_profile(user_profile) is None and any(description is not None for description in generated):
+        try:
+            for vector_id, description in zip(pending, generated):
+                if description is not None:
+                    save_summary(db.sync_session, vector_id, hashes[vector_id], description, rows.get(vector_id))
+            await db.commit()
+        except Exception as e:
+            # 같은 청크를 동시에 저장한 요청이 있어도 응답에는 영향 없음
+            print(f"정책 요약 저장 오류: {str(e)}")
+            await db.rollback()
+    
+    return descriptions
+
+def generate_missing_summaries(db: Session, policy_texts: Dict[str, str]) -> Dict[str, int]:
+    """
+    저장된 요약이 없거나 본문이 바뀐 청크의 (프로필 없는) 설명을 생성해 저장합니다. (백그라운드 작업용)
+    실패한 청크는 건너뛰므로 다음 작업에서 다시 시도됩니다.
+    """
+    rows = _load_summary_rows(db, policy_texts)
+    generated = 0
+    failed = 0
+    for vector_id, text in policy_texts.items():
+        content_hash = summary_content_hash(text)
+        row = rows.get(vector_id)
+        if row is not None and row.content_hash == content_hash:
+            continue
+        
+        request = build_policy_description_request(text)
+        try:
+            description = openai_flight.do(request_key(request), lambda: _create_description(request))
+            save_summary(db, vector_id, content_hash, description, row)
+            db.commit()
+            generated += 1
+        except Exception as e:
+            print(f"정책 요약 생성 오류 ({vector_id}): {str(e)}")
+            db.rollback()
+            failed += 1
+    return {"generated": generated, "failed": failed}
+
+def save_summary(db: Session, vector_id: str, content_hash: str, description: Dict[str, Any], existing: Optional[PolicySummary] = None) -> PolicySummary:
+    """요약을 저장하거나 기존 요약을 갱신합니다. (커밋은 호출한 쪽에서)"""
+    row = existing or PolicySummary(vector_id=vector_id)
+    row.content_hash = content_hash
+    row.summary = description.get("summary", "")
+    row.eligibility = description.get("eligibility", [])
+    row.benefits = description.get("benefits", [])
+    row.application = description.get("application", "")
+    db.add(row)
+    return row
@@ -0,0 +1,72 @@
+# app/services/principal_cache.py
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.db.models import User, UserProfile
+
+def get_user_profile(user: User) -> Optional[UserProfile]:
+    """사용자의 프로필 (인증할 때 함께 로드되므로 추가 조회 없음, 없으면 None)"""
+    return user.profiles[0] if user.profiles else None
+
+class PrincipalCache:
+    """
+    인증된 사용자 캐시
+
+    사용자 ID마다 프로필을 함께 로드한 User를 세션에서 분리해 TTL 동안 보관하고,
+    요청마다 그 요청의 세션에 merge(load=False)로 연결해 DB 조회 없이 반환합니다.
+    (요청 세션에서 수정/커밋해도 캐시된 객체는 바뀌지 않음)
+    프로필을 수정하면 invalidate로 지우고, 다른 워커 프로세스의 항목은 TTL이 지나면 다시 조회합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: Optional[float] = 30):
+        self.entries = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.generation = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: int) -> Optional[User]:
+        """db 세션에 연결된 사용자 (캐시에 없으면 프로필과 함께 쿼리 1번으로 조회, 없는 사용자면 None)"""
+        cached = self.entries.get(user_id)
+        if cached is None:
+            with self._lock:
+                generation = self.generation
+            cached = self._fetch(db, user_id)
+            if cached is None:
+                return None
+            with self._lock:
+                # 조회하는 동안 무효화되었다면 수정 전 값일 수 있으므로 저장하지 않음
+                if generation == self.generation:
+                    self.entries.set(user_id, cached)
+        return db.merge(cached, load=False)
+
+    @staticmethod
+    def _fetch(db: Session, user_id: int) -> Optional[User]:
+        # 요청 세션과 같은 DB의 별도 세션에서 조회하고 닫아, 어느 세션에도 속하지 않은 객체로 보관
+        with Session(bind=db.get_bind()) as loader:
+            return loader.query(User).options(joinedload(User.profiles)).filter(User.id == user_id).first()
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자/프로필을 수정한 뒤 호출"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+        self.entries.delete(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.entries.stats()
+        stats["invalidations"] = self.invalidations
+        return stats
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,105 @@
+# app/services/profile_queries.py
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models import ProfileQuery, ProfileRecommendation, ProfileType
+from app.services.policy_matcher import EMBEDDING_MODEL, PROFILE_QUERY_PROMPT_VERSION, PolicyMatcher
+from app.services.policy_metadata import extract_category, extract_title_from_text
+
+def profile_type_to_profile(profile_type: ProfileType) -> Dict[str, Any]:
+    """프로필 유형을 대표하는 프로필 딕셔너리"""
+    return {
+        "age": 25 if profile_type.age_group == "청년" else 45 if profile_type.age_group == "중장년" else 65,
+        "gender": "male" if profile_type.gender == "남성" else "female" if profile_type.gender == "여성" else "other",
+        "employment_status": (
+            "employed" if profile_type.employment_status == "재직자" else
+            "unemployed" if profile_type.employment_status == "구직자" else
+            "business" if profile_type.employment_status == "자영업자" else "student"
+        ),
+        "is_disabled": profile_type.is_disabled,
+        "is_foreign": profile_type.is_foreign,
+        "family_status": (
+            "parent" if profile_type.family_status == "영유아 자녀 있음" else
+            "single_parent" if profile_type.family_status == "한부모" else
+            "caregiver" if profile_type.family_status == "주 양육자" else "none"
+        )
+    }
+
+def get_profile_query(db: Session, profile_type_id: int, policy_matcher: PolicyMatcher) -> Optional[Tuple[str, List[float]]]:
+    """
+    프로필 유형의 정책 검색어와 임베딩.
+    저장된 값이 현재 프롬프트 버전/임베딩 모델과 같으면 그대로 사용하고, 아니면 생성해 저장합니다.
+    """
+    row = db.query(ProfileQuery).filter(ProfileQuery.profile_type_id == profile_type_id).first()
+    if row and row.prompt_version == PROFILE_QUERY_PROMPT_VERSION and row.embedding_model == EMBEDDING_MODEL:
+        return row.query, np.frombuffer(row.embedding, dtype=np.float32).tolist()
+
+    profile_type = db.query(ProfileType).filter(ProfileType.id == profile_type_id).first()
+    if not profile_type:
+        return None
+
+    query = policy_matcher.profile_to_query(profile_type_to_profile(profile_type))
+    embedding = policy_matcher.get_embedding(query)
+
+    row = row or ProfileQuery(profile_type_id=profile_type_id)
+    row.prompt_version = PROFILE_QUERY_PROMPT_VERSION
+    row.query = query
+    row.embedding_model = EMBEDDING_MODEL
+    row.embedding = np.asarray(embedding, dtype=np.float32).tobytes()
+    try:
+        db.add(row)
+        db.commit()
+    except IntegrityError:
+        # 같은 유형을 동시에 생성한 요청이 먼저 저장한 경우
+        db.rollback()
+    return query, embedding
+
+def recommend_for_profile(
+    db: Session,
+    policy_matcher: PolicyMatcher,
+    profile: Dict[str, Any],
+    profile_type_id: Optional[int],
+    top_k: int = 5,
+) -> List[Dict[str, Any]]:
+    """프로필 유형이 있으면 유형별로 저장된 검색어/임베딩으로, 없으면 프로필에서 바로 검색어를 생성해 추천합니다."""
+    if profile_type_id is not None:
+        profile_query = get_profile_query(db, profile_type_id, policy_matcher)
+        if profile_query is not None:
+            query, query_embedding = profile_query
+            return policy_matcher.recommend_policies(profile, top_k=top_k, query=query, query_embedding=query_embedding)
+    return policy_matcher.recommend_policies(profile, top_k=top_k)
+
+def save_profile_type_recommendations(
+    db: Session,
+    policy_matcher: PolicyMatcher,
+    profile_type: ProfileType,
+    top_k: int = 5,
+) -> List[ProfileRecommendation]:
+    """프로필 유형의 추천 정책을 새로 계산해 기존 추천을 교체합니다. (추천을 먼저 계산한 뒤 삭제/저장)"""
+    recommendations = recommend_for_profile(db, policy_matcher, profile_type_to_profile(profile_type), profile_type.id, top_k=top_k)
+    
+    db.query(ProfileRecommendation).filter(
+        ProfileRecommendation.profile_type_id == profile_type.id
+    ).delete()
+    
+    rows = []
+    for rank, rec in enumerate(recommendations, 1):
+        policy_text = rec.get("text", "")
+        row = ProfileRecommendation(
+            profile_type_id=profile_type.id,
+            policy_id=rec.get("id", "") or rec.get("policy_id", ""),
+            policy_title=rec.get("title") or extract_title_from_text(policy_text),
+            policy_content=policy_text,
+            page_number=rec.get("page", ""),
+            category=rec.get("category") or extract_category(policy_text),
+            relevance_score=rec.get("score", 0.0),
+            rank_order=rank
+        )
+        db.add(row)
+        rows.append(row)
+    
+    db.commit()
+    return rows
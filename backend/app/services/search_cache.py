@@ -0,0 +1,59 @@
+# app/services/search_cache.py
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.services.embedding_cache import normalize_query
+
+# 프로필 유형이 없는 비로그인 사용자 버킷
+ANONYMOUS = "anonymous"
+
+class SearchResponseCache:
+    """
+    정책 검색 응답 캐시
+
+    (정규화된 검색어, 프로필 유형) 단위로 LLM 요약까지 끝난 결과 목록을 저장합니다.
+    사용자별 값(is_saved)은 저장하지 않고 조회 후 덧씌우며,
+    검색 인덱스 버전이 바뀌면 저장된 결과를 모두 버립니다.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: Optional[float] = 600):
+        self.entries = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.index_version: Optional[str] = None
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(q: str, profile_type_id: Optional[int]) -> Hashable:
+        return (normalize_query(q), profile_type_id if profile_type_id is not None else ANONYMOUS)
+
+    def _check_version(self, index_version: str) -> None:
+        with self._lock:
+            if self.index_version == index_version:
+                return
+            if self.index_version is not None:
+                self.entries.clear()
+                self.invalidations += 1
+            self.index_version = index_version
+
+    def get(self, key: Hashable, index_version: str) -> Optional[List[Any]]:
+        self._check_version(index_version)
+        return self.entries.get(key)
+
+    def set(self, key: Hashable, index_version: str, results: List[Any]) -> None:
+        self._check_version(index_version)
+        self.entries.set(key, results)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.entries.stats()
+        stats.update({"index_version": self.index_version, "invalidations": self.invalidations})
+        return stats
+
+search_response_cache = SearchResponseCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,73 @@
+# app/services/tasks.py
+"""
+백그라운드 작업 함수
+
+요청 처리 중에 하기에는 오래 걸리는 LLM/벡터 검색 작업입니다.
+app.services.jobs의 작업 큐(로컬 스레드 풀 또는 Celery 워커)가 이름으로 찾아 실행하므로
+인자와 반환값은 JSON으로 직렬화할 수 있어야 합니다.
+"""
+from typing import Any, Dict, List
+
+from app.db.base import SessionLocal
+from app.db.models import ProfileRecommendation, ProfileType
+from app.services.clients import get_policy_matcher
+from app.services.notification import create_notification
+from app.services.policy_service import create_user_policy_recommendations
+from app.services.policy_summaries import generate_missing_summaries
+from app.services.profile_queries import save_profile_type_recommendations
+from app.services.vector_search import get_policies_by_ids
+
+def refresh_user_recommendations(user_id: int) -> Dict[str, Any]:
+    """사용자 추천 정책을 다시 생성하고 완료 알림을 남깁니다."""
+    db = SessionLocal()
+    try:
+        recommendations = create_user_policy_recommendations(db, user_id)
+        create_notification(
+            db,
+            user_id,
+            "추천 정책 갱신",
+            f"맞춤 추천 정책 {len(recommendations)}개가 갱신되었습니다.",
+            "policy_update"
+        )
+        return {"recommendations": len(recommendations)}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def generate_profile_type_recommendations(profile_type_id: int, only_if_missing: bool = True) -> Dict[str, Any]:
+    """프로필 유형의 추천 정책 생성 (회원가입 직후 등)"""
+    db = SessionLocal()
+    try:
+        if only_if_missing and db.query(ProfileRecommendation.id).filter(
+            ProfileRecommendation.profile_type_id == profile_type_id
+        ).first():
+            return {"recommendations": 0, "skipped": True}
+
+        profile_type = db.query(ProfileType).filter(ProfileType.id == profile_type_id).first()
+        if not profile_type:
+            raise ValueError(f"프로필 유형을 찾을 수 없습니다: {profile_type_id}")
+
+        rows = save_profile_type_recommendations(db, get_policy_matcher(), profile_type, top_k=5)
+        return {"recommendations": len(rows), "skipped": False}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def generate_policy_summaries(vector_ids: List[str]) -> Dict[str, Any]:
+    """검색 중 시간 초과/실패한 청크의 요약을 생성해 저장 (다음 검색부터 저장된 요약 사용)"""
+    policies = get_policies_by_ids(vector_ids)
+    db = SessionLocal()
+    try:
+        return generate_missing_summaries(db, {policy["id"]: policy["content"] for policy in policies})
+    finally:
+        db.close()
+
+# 작업 이름 -> 함수 (Celery 작업 이름으로도 사용)
+TASKS = {
+    task.__name__: task
+    for task in (refresh_user_recommendations, generate_profile_type_recommendations, generate_policy_summaries)
+}
@@ -1,104 +1,66 @@
 from typing import Dict, Optional, Any, List
-from pinecone import Pinecone
-import os
-from dotenv import load_dotenv
+from app.services.clients import get_vector_index, get_policy_matcher
+from app.services.ingestion import query_serving_chunks
+from app.services.policy_metadata import title_and_category
 
-# .env 파일 로드
-load_dotenv()
+# fetch 한 번에 조회할 최대 ID 수 (Pinecone fetch는 ID를 쿼리 문자열로 전달)
+FETCH_BATCH_SIZE = 100
 
-# 환경 변수 가져오기
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "labor-policy")
+def _policy_from_vector(policy_id: str, vector) -> Dict[str, Any]:
+    title, category = title_and_category(vector.metadata)
+    return {
+        "id": policy_id,
+        "title": title,
+        "content": vector.metadata.get("text", ""),
+        "page": vector.metadata.get("page"),
+        "category": category
+    }
 
 def get_policy_by_id(policy_id: str) -> Optional[Dict[str, Any]]:
     """정책 ID로 정책 정보 가져오기"""
+    policies = get_policies_by_ids([policy_id])
+    return policies[0] if policies else None
+
+def get_policies_by_ids(policy_ids: List[str]) -> List[Dict[str, Any]]:
+    """여러 정책 ID를 한 번에 조회 (요청한 순서 유지, 없는 ID는 제외)"""
+    if not policy_ids:
+        return []
     try:
-        # Pinecone에서 벡터 ID로 검색
-        pc = Pinecone(api_key=PINECONE_API_KEY)
-        index = pc.Index(INDEX_NAME)
+        # 벡터 인덱스에서 벡터 ID 목록으로 한 번에 조회
+        index = get_vector_index()
+        unique_ids = list(dict.fromkeys(policy_ids))
         
-        # 해당 ID의 벡터 조회
-        result = index.fetch(ids=[policy_id])
+        vectors = {}
+        for start in range(0, len(unique_ids), FETCH_BATCH_SIZE):
+            result = index.fetch(ids=unique_ids[start:start + FETCH_BATCH_SIZE])
+            vectors.update(result.vectors)
         
-        if policy_id in result.vectors:
-            vector = result.vectors[policy_id]
-            text = vector.metadata.get("text", "")
-            
-            # 제목 추출
-            title = extract_title_from_text(text)
-            
-            return {
-                "id": policy_id,
-                "title": title,
-                "content": text,
-                "page": vector.metadata.get("page"),
-                "category": extract_category(text)
-            }
-        return None
+        return [
+            _policy_from_vector(policy_id, vectors[policy_id])
+            for policy_id in policy_ids
+            if policy_id in vectors
+        ]
     except Exception as e:
         print(f"정책 조회 오류: {str(e)}")
-        return None
-
-def extract_title_from_text(text: str) -> str:
-    """텍스트에서 제목 추출 (첫번째 유의미한 줄 사용)"""
-    lines = text.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if line and len(line) < 100:  # 적당한 길이의 줄 찾기
-            return line
-    return "제목 없음"
-
-def extract_category(text: str) -> str:
-    """텍스트 내용 기반으로 카테고리 추정"""
-    categories = {
-        "청년": ["청년", "20대", "30대", "학졸자", "구직자"],
-        "고령자": ["고령자", "신중년", "50대", "60대"],
-        "장애인": ["장애인", "중증장애", "경증장애"],
-        "여성": ["여성", "육아", "출산", "모성"],
-        "외국인": ["외국인", "다문화", "이주민"],
-        "사업주": ["사업주", "기업", "고용주", "사업장"],
-        "직업능력개발": ["직업훈련", "능력개발", "자격증", "교육훈련"]
-    }
-    
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            if keyword in text:
-                return category
-    
-    return "기타"
+        return []
 
 def search_policies(query: str, top_k: int = 5, user_profile: Optional[Dict] = None) -> List[Dict[str, Any]]:
     """정책 검색 및 결과 가공"""
     try:
-        # Pinecone 초기화
-        pc = Pinecone(api_key=PINECONE_API_KEY)
-        index = pc.Index(INDEX_NAME)
+        # 벡터 인덱스 (Pinecone 또는 로컬 인덱스)
+        index = get_vector_index()
         
         # 임베딩 생성 (OpenAI API 호출 필요)
-        from app.services.policy_matcher import PolicyMatcher
-        policy_matcher = PolicyMatcher()
-        query_embedding = policy_matcher.get_embedding(query)
+        query_embedding = get_policy_matcher().get_embedding(query)
         
-        # 벡터 검색
-        results = index.query(
-            vector=query_embedding,
-            top_k=top_k * 2,  # 목차 페이지 필터링 위해 더 많이 가져옴
-            include_metadata=True
-        )
+        # 벡터 검색 (목차 청크는 필터로 제외)
+        matches = query_serving_chunks(index, query_embedding, top_k)
         
         # 결과 가공
         search_results = []
-        for match in results.matches:
-            # 페이지 번호 확인 (목차 페이지 건너뛰기)
-            page = match.metadata.get("page", "0")
-            try:
-                page_num = int(page)
-                if page_num <= 20:  # 목차 페이지 건너뛰기
-                    continue
-            except (ValueError, TypeError):
-                pass
-                
+        for match in matches:
             policy_text = match.metadata.get("text", "")
+            title, category = title_and_category(match.metadata)
             
             # 기본 정보
             policy_info = {
@@ -106,15 +68,11 @@ def search_policies(query: str, top_k: int = 5, user_profile: Optional[Dict] = N
                 "content": policy_text,
                 "page": match.metadata.get("page", ""),
                 "score": match.score,
-                "title": match.metadata.get("title", "") or extract_title_from_text(policy_text),
-                "category": extract_category(policy_text)
+                "title": title,
+                "category": category
             }
             
             search_results.append(policy_info)
-            
-            # 원하는 개수만큼 정책 가져오기
-            if len(search_results) >= top_k:
-                break
         
         return search_results
     except Exception as e:
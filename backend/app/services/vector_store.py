@@ -0,0 +1,396 @@
+# app/services/vector_store.py
+import os
+import json
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+
+class VectorMatch:
+    """Pinecone 검색 결과(match)와 같은 형태의 검색 결과 항목"""
+
+    def __init__(self, id: str, score: float, metadata: Dict[str, Any]):
+        self.id = id
+        self.score = score
+        self.metadata = metadata
+
+
+class QueryResult:
+    """Pinecone query 응답과 같은 형태 (results.matches)"""
+
+    def __init__(self, matches: List[VectorMatch]):
+        self.matches = matches
+
+
+class FetchedVector:
+    def __init__(self, id: str, values: List[float], metadata: Dict[str, Any]):
+        self.id = id
+        self.values = values
+        self.metadata = metadata
+
+
+class FetchResult:
+    """Pinecone fetch 응답과 같은 형태 (result.vectors[id])"""
+
+    def __init__(self, vectors: Dict[str, FetchedVector]):
+        self.vectors = vectors
+
+
+# 인덱스 파일 포맷 버전 (포맷이 바뀌면 올리고 load에서 호환성 확인)
+INDEX_FORMAT_VERSION = 1
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """코사인 유사도 계산을 위해 각 행을 단위 벡터로 정규화합니다."""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _normalize_query(vector: List[float]) -> np.ndarray:
+    query_vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(query_vector)
+    if norm > 0:
+        query_vector = query_vector / norm
+    return query_vector
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 배열에서 상위 k개의 위치를 점수 내림차순으로 반환합니다."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top])]
+
+
+def _matches_filter(metadata: Dict[str, Any], filter: Dict[str, Any]) -> bool:
+    """Pinecone 메타데이터 필터 문법 중 $eq/$ne/$in/$nin을 지원합니다."""
+    for field, condition in filter.items():
+        value = metadata.get(field)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        for operator, expected in condition.items():
+            if operator == "$eq" and value != expected:
+                return False
+            if operator == "$ne" and value == expected:
+                return False
+            if operator == "$in" and value not in expected:
+                return False
+            if operator == "$nin" and value in expected:
+                return False
+            if operator not in ("$eq", "$ne", "$in", "$nin"):
+                raise ValueError(f"지원하지 않는 필터 연산자입니다: {operator}")
+    return True
+
+
+class LocalVectorIndex:
+    """
+    프로세스 내 NumPy 벡터 인덱스 (전수 검색)
+
+    모든 청크 임베딩을 하나의 연속된 float32 행렬로 메모리에 올려두고
+    행렬곱 한 번과 argpartition으로 top-k 코사인 유사도 검색을 수행합니다.
+    query/fetch는 Pinecone Index와 같은 인터페이스를 제공합니다.
+    """
+
+    index_type = "exact"
+
+    def __init__(self, ids: List[str], embeddings: np.ndarray, metadata: List[Dict[str, Any]]):
+        if len(ids) != len(metadata) or len(ids) != len(embeddings):
+            raise ValueError("ids, embeddings, metadata의 개수가 일치하지 않습니다.")
+
+        self.ids = list(ids)
+        self.metadata = list(metadata)
+        self.id_to_row = {vector_id: row for row, vector_id in enumerate(self.ids)}
+        self.matrix = _normalize_rows(embeddings)
+        self._filter_rows = {}
+        # 내용이 바뀔 때마다 증가 (검색 결과 캐시 무효화에 사용)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalVectorIndex":
+        """저장된 인덱스 파일(.npz)을 불러옵니다."""
+        return load_vector_index(path)
+
+    @classmethod
+    def _from_arrays(cls, data, ids: List[str], metadata: List[Dict[str, Any]]) -> "LocalVectorIndex":
+        return cls(ids, data["embeddings"], metadata)
+
+    def _extra_arrays(self) -> Dict[str, np.ndarray]:
+        return {}
+
+    def save(self, path: str) -> None:
+        """인덱스를 버전 정보와 함께 .npz 파일로 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(
+            path,
+            format_version=np.array(INDEX_FORMAT_VERSION),
+            index_type=np.array(self.index_type),
+            ids=np.array(self.ids, dtype=str),
+            embeddings=self.matrix,
+            metadata=np.array(json.dumps(self.metadata, ensure_ascii=False)),
+            **self._extra_arrays(),
+        )
+
+    def add(self, ids: List[str], embeddings: np.ndarray, metadata: List[Dict[str, Any]]) -> None:
+        """벡터를 인덱스에 추가합니다. 이미 있는 ID는 새 값으로 덮어씁니다."""
+        if len(ids) != len(metadata) or len(ids) != len(embeddings):
+            raise ValueError("ids, embeddings, metadata의 개수가 일치하지 않습니다.")
+        if not ids:
+            return
+
+        vectors = _normalize_rows(embeddings)
+        # 같은 배치에 같은 ID가 여러 번 있으면 마지막 값만 사용
+        latest = {vector_id: position for position, vector_id in enumerate(ids)}
+        updated_rows, updated_positions, new_positions = [], [], []
+        for vector_id, position in latest.items():
+            row = self.id_to_row.get(vector_id)
+            if row is None:
+                new_positions.append(position)
+            else:
+                updated_rows.append(row)
+                updated_positions.append(position)
+
+        updated_rows = np.array(updated_rows, dtype=np.int64)
+        if len(updated_rows):
+            self.matrix[updated_rows] = vectors[updated_positions]
+            for row, position in zip(updated_rows, updated_positions):
+                self.metadata[row] = metadata[position]
+
+        first_row = len(self.ids)
+        if new_positions:
+            for offset, position in enumerate(new_positions):
+                self.ids.append(ids[position])
+                self.metadata.append(metadata[position])
+                self.id_to_row[ids[position]] = first_row + offset
+            self.matrix = np.ascontiguousarray(
+                np.vstack([self.matrix.reshape(-1, vectors.shape[1]), vectors[new_positions]]),
+                dtype=np.float32,
+            )
+
+        self._on_rows_changed(updated_rows, first_row)
+        self._filter_rows.clear()
+        self.version += 1
+
+    def _on_rows_changed(self, updated_rows: np.ndarray, first_row: int) -> None:
+        """add 한 번에 바뀐 행(덮어쓴 행 updated_rows, first_row 이후의 새 행)을 반영합니다."""
+        pass
+
+    def _candidate_rows(self, query_vector: np.ndarray, **kwargs) -> Optional[np.ndarray]:
+        """검색 대상 행 목록. None이면 전체 행을 검색합니다."""
+        return None
+
+    def _rows_matching(self, filter: Dict[str, Any]) -> np.ndarray:
+        """필터를 만족하는 행 목록 (필터별로 캐시)"""
+        key = json.dumps(filter, sort_keys=True, ensure_ascii=False)
+        rows = self._filter_rows.get(key)
+        if rows is None:
+            rows = np.array(
+                [row for row, meta in enumerate(self.metadata) if _matches_filter(meta, filter)],
+                dtype=np.int64,
+            )
+            self._filter_rows[key] = rows
+        return rows
+
+    def query(
+        self,
+        vector: List[float],
+        top_k: int = 5,
+        include_metadata: bool = True,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> QueryResult:
+        """쿼리 벡터와 가장 유사한 top_k개의 벡터를 반환합니다. filter로 메타데이터 조건을 줄 수 있습니다."""
+        if not self.ids or top_k <= 0:
+            return QueryResult([])
+
+        query_vector = _normalize_query(vector)
+        rows = self._candidate_rows(query_vector, **kwargs)
+        if filter:
+            allowed = self._rows_matching(filter)
+            rows = allowed if rows is None else rows[np.isin(rows, allowed, assume_unique=True)]
+
+        if rows is None:
+            scores = self.matrix @ query_vector
+            top_rows = _top_k(scores, top_k)
+            top_scores = scores[top_rows]
+        else:
+            scores = self.matrix[rows] @ query_vector
+            top = _top_k(scores, top_k)
+            top_rows = rows[top]
+            top_scores = scores[top]
+
+        matches = [
+            VectorMatch(
+                id=self.ids[row],
+                score=float(score),
+                metadata=self.metadata[row] if include_metadata else {},
+            )
+            for row, score in zip(top_rows, top_scores)
+        ]
+        return QueryResult(matches)
+
+    def fetch(self, ids: List[str], **kwargs) -> FetchResult:
+        """ID 목록에 해당하는 벡터와 메타데이터를 반환합니다."""
+        vectors = {}
+        for vector_id in ids:
+            row = self.id_to_row.get(vector_id)
+            if row is None:
+                continue
+            vectors[vector_id] = FetchedVector(
+                id=vector_id,
+                values=self.matrix[row].tolist(),
+                metadata=self.metadata[row],
+            )
+        return FetchResult(vectors)
+
+
+def _train_centroids(matrix: np.ndarray, nlist: int, n_iter: int = 20, seed: int = 0) -> np.ndarray:
+    """구면 k-means로 IVF 클러스터 중심을 학습합니다."""
+    rng = np.random.default_rng(seed)
+
+    # 학습은 클러스터당 최대 256개 샘플로 제한
+    max_samples = nlist * 256
+    if len(matrix) > max_samples:
+        sample = matrix[rng.choice(len(matrix), max_samples, replace=False)]
+    else:
+        sample = matrix
+
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(n_iter):
+        assignments = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=nlist)
+
+        # 비어 있는 클러스터는 임의의 샘플로 다시 초기화
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
+class IVFVectorIndex(LocalVectorIndex):
+    """
+    IVF(Inverted File) 근사 최근접 이웃 인덱스
+
+    벡터를 nlist개의 클러스터로 나누고, 검색 시 쿼리와 가까운 nprobe개 클러스터만
+    전수 검색합니다. nprobe를 키우면 재현율이 오르고 지연 시간이 늘어납니다.
+    """
+
+    index_type = "ivf"
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]],
+        centroids: np.ndarray,
+        assignments: Optional[np.ndarray] = None,
+        nprobe: int = 8,
+    ):
+        super().__init__(ids, embeddings, metadata)
+        self.centroids = _normalize_rows(centroids)
+        self.nprobe = nprobe
+
+        if assignments is None:
+            assignments = self._assign(self.matrix)
+        self.assignments = np.asarray(assignments, dtype=np.int64)
+        self._rebuild_lists()
+
+    @classmethod
+    def build(
+        cls,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]],
+        nlist: int = 64,
+        nprobe: int = 8,
+    ) -> "IVFVectorIndex":
+        """벡터로부터 클러스터를 학습하여 IVF 인덱스를 생성합니다."""
+        matrix = _normalize_rows(embeddings)
+        if len(matrix) == 0:
+            raise ValueError("벡터가 없어 IVF 클러스터를 학습할 수 없습니다.")
+        nlist = max(1, min(nlist, len(matrix)))
+        centroids = _train_centroids(matrix, nlist)
+        return cls(ids, matrix, metadata, centroids, nprobe=nprobe)
+
+    @classmethod
+    def _from_arrays(cls, data, ids: List[str], metadata: List[Dict[str, Any]]) -> "IVFVectorIndex":
+        return cls(
+            ids,
+            data["embeddings"],
+            metadata,
+            centroids=data["centroids"],
+            assignments=data["assignments"],
+            nprobe=int(data["nprobe"]),
+        )
+
+    def _extra_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "centroids": self.centroids,
+            "assignments": self.assignments,
+            "nprobe": np.array(self.nprobe),
+        }
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if len(vectors) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def _rebuild_lists(self) -> None:
+        order = np.argsort(self.assignments, kind="stable")
+        counts = np.bincount(self.assignments, minlength=self.nlist)
+        self.lists = np.split(order, np.cumsum(counts)[:-1])
+
+    def _on_rows_changed(self, updated_rows: np.ndarray, first_row: int) -> None:
+        # 바뀐 행만 다시 배정하고 클러스터 목록은 add마다 한 번만 다시 만듦
+        if len(updated_rows):
+            self.assignments[updated_rows] = self._assign(self.matrix[updated_rows])
+        new_assignments = self._assign(self.matrix[first_row:])
+        self.assignments = np.concatenate([self.assignments, new_assignments])
+        self._rebuild_lists()
+
+    def _candidate_rows(self, query_vector: np.ndarray, nprobe: Optional[int] = None, **kwargs) -> Optional[np.ndarray]:
+        nprobe = nprobe or self.nprobe
+        if nprobe >= self.nlist:
+            return None
+        probe = _top_k(self.centroids @ query_vector, nprobe)
+        return np.concatenate([self.lists[cluster] for cluster in probe])
+
+
+INDEX_TYPES = {
+    LocalVectorIndex.index_type: LocalVectorIndex,
+    IVFVectorIndex.index_type: IVFVectorIndex,
+}
+
+
+def load_vector_index(path: str) -> LocalVectorIndex:
+    """인덱스 파일의 포맷 버전과 종류를 확인하여 알맞은 인덱스로 불러옵니다."""
+    with np.load(path, allow_pickle=False) as data:
+        # 버전 정보가 없는 파일은 최초 포맷(전수 검색 인덱스)으로 간주
+        format_version = int(data["format_version"]) if "format_version" in data else 1
+        if format_version > INDEX_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 파일 버전입니다: {format_version}")
+
+        index_type = str(data["index_type"]) if "index_type" in data else LocalVectorIndex.index_type
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"알 수 없는 인덱스 종류입니다: {index_type}")
+
+        ids = data["ids"].tolist()
+        metadata = json.loads(str(data["metadata"]))
+        return INDEX_TYPES[index_type]._from_arrays(data, ids, metadata)
@@ -0,0 +1,12 @@
+# celery_worker.py
+# JOB_BACKEND=celery일 때 백그라운드 작업을 실행하는 워커
+#
+#   celery -A celery_worker worker --loglevel=info --concurrency=2
+
+from app.services.jobs import create_celery_app
+from app.services.tasks import TASKS
+
+celery_app = create_celery_app()
+
+for name, task in TASKS.items():
+    celery_app.task(name=name)(task)
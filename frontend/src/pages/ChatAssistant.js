@@ -2,7 +2,7 @@
 import React, { useState, useEffect, useRef, useContext } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
 import { AuthContext } from '../context/AuthContext';
-import api from '../services/api';
+import api, { getAllPages } from '../services/api';
 import './ChatAssistant.css';
 
 const ChatAssistant = () => {
@@ -48,9 +48,10 @@ const ChatAssistant = () => {
 
     try {
       setLoading(true);
-      const response = await api.get(`/chat/${id}/messages`);
+      // 긴 대화는 여러 페이지로 나뉘어 오므로 끝까지 조회
+      const chatMessages = await getAllPages(`/chat/${id}/messages`);
 
-      if (response.data.length === 0) {
+      if (chatMessages.length === 0) {
         // 메시지가 없으면 초기 인사말 설정
         setMessages([
           {
@@ -61,7 +62,7 @@ const ChatAssistant = () => {
         ]);
       } else {
         // 서버에서 받은 메시지 형식 변환
-        const formattedMessages = response.data.map(msg => ({
+        const formattedMessages = chatMessages.map(msg => ({
           id: msg.id,
           sender: msg.is_user ? 'user' : 'assistant',
           text: msg.content,
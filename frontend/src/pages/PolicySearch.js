@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useContext } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '../services/api';
+import api, { getAllPages } from '../services/api';
 import { AuthContext } from '../context/AuthContext';
 import PolicyCard from '../components/PolicyCard';
 import './PolicySearch.css';
@@ -34,11 +34,9 @@ const PolicySearch = () => {
           setPolicies([]);
         }
         
-        // 저장된 정책도 함께 가져오기
-        const savedResponse = await api.get('/policies/saved/');
-        if (savedResponse.data) {
-          setSavedPolicies(savedResponse.data);
-        }
+        // 저장된 정책도 함께 가져오기 (페이지 단위로 반환되므로 끝까지 조회)
+        const saved = await getAllPages('/policies/saved/');
+        setSavedPolicies(saved);
       } catch (err) {
         setError('추천 정책을 불러오는데 실패했습니다.');
         console.error('정책 추천 API 오류:', err);
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useContext } from 'react';
 import { AuthContext } from '../context/AuthContext';
-import api, { apiService } from '../services/api';
+import api, { apiService, getAllPages } from '../services/api';
 import './Profile.css';
 import PolicyCard from '../components/PolicyCard';
 
@@ -58,9 +58,8 @@ const Profile = () => {
 
 
         try {
-          // 저장한 정책 가져오기 (가능한 경우)
-          const policiesResponse = await api.get('/policies/saved/');
-          setSavedPolicies(policiesResponse.data);
+          // 저장한 정책 가져오기 (가능한 경우, 페이지 단위로 반환되므로 끝까지 조회)
+          setSavedPolicies(await getAllPages('/policies/saved/'));
         } catch (err) {
           console.warn('저장된 정책을 가져오는데 실패했습니다:', err);
           setSavedPolicies([]);
@@ -44,6 +44,18 @@ api.interceptors.response.use(
 // 기본 API 사용
 export default api;
 
+// 커서 페이지네이션 목록을 끝까지 조회 (다음 페이지 커서는 X-Next-Cursor 헤더로 전달됨)
+export const getAllPages = async (url, params = {}) => {
+  const items = [];
+  let cursor = null;
+  do {
+    const response = await api.get(url, { params: cursor ? { ...params, cursor } : params });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return items;
+};
+
 // API 요청 함수들
 export const apiService = {
   // 인증 관련
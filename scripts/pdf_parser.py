@@ -11,10 +11,12 @@ import json
 import sys
 from pathlib import Path
 
-# 상위 디렉토리를 모듈 검색 경로에 추가
+# 상위 디렉토리와 백엔드 패키지(app)를 모듈 검색 경로에 추가
 sys.path.append(str(Path(__file__).resolve().parent.parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
 
 from backend.app.core.config import settings
+from app.services.ingestion import build_chunk_metadata
 
 # OpenAI 및 Pinecone 초기화
 os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY
@@ -127,10 +129,8 @@ def embed_and_store_chunks(chunk_metadata):
             # 벡터 및 메타데이터 준비
             for j, (chunk_data, embedding) in enumerate(zip(current_batch, embeddings_list)):
                 vector_id = f"chunk_{i+j}"
-                metadata = {
-                    "text": chunk_data["chunk"],
-                    "page": chunk_data["page_number"]
-                }
+                # 목차 여부(is_toc), 제목/카테고리를 적재 시 함께 저장
+                metadata = build_chunk_metadata(chunk_data["chunk"], chunk_data["page_number"])
                 
                 vectors.append((vector_id, embedding, metadata))
                 
@@ -1,8 +1,15 @@
 import os
 import re
+import sys
+from pathlib import Path
 from tqdm import tqdm
 from dotenv import load_dotenv
-from pinecone import Pinecone, PodSpec
+
+# 백엔드 패키지(app)를 모듈 검색 경로에 추가 (청크 메타데이터 생성 공유)
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.append(str(BACKEND_DIR))
+
+from app.services.ingestion import build_chunk_metadata
 
 # .env 파일 로드
 load_dotenv()
@@ -10,6 +17,9 @@ load_dotenv()
 # 환경 변수 가져오기
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "labor-policy")
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "pinecone")
+# 상대 경로는 백엔드 서버와 같은 파일을 쓰도록 backend/ 기준
+LOCAL_VECTOR_INDEX_PATH = str(BACKEND_DIR / os.getenv("LOCAL_VECTOR_INDEX_PATH", "data/vector_index.npz"))
 
 # 작업 디렉토리 설정
 work_dir = "work_labor_sample_naver"
@@ -81,6 +91,8 @@ def get_embeddings(chunks):
 
 # Pinecone에 업로드 - 메타데이터 포함
 def upload_to_pinecone(chunks, embeddings, metadatas):
+    from pinecone import Pinecone
+
     print("Pinecone에 업로드 중...")
     
     # Pinecone 초기화
@@ -110,10 +122,8 @@ def upload_to_pinecone(chunks, embeddings, metadatas):
             vectors.append({
                 "id": f"chunk_{j}",
                 "values": embeddings[j],
-                "metadata": {
-                    "text": chunks[j],
-                    "page": metadatas[j]["page"]
-                }
+                # 목차 여부(is_toc), 제목/카테고리를 적재 시 함께 저장
+                "metadata": build_chunk_metadata(chunks[j], metadatas[j]["page"])
             })
         
         # 벡터 업로드
@@ -121,6 +131,27 @@ def upload_to_pinecone(chunks, embeddings, metadatas):
     
     print("Pinecone 업로드 완료!")
 
+# 로컬 벡터 인덱스(VECTOR_BACKEND=local)에 추가 - 기존 인덱스를 다시 만들지 않고 새 청크만 삽입
+def upload_to_local_index(chunks, embeddings, metadatas):
+    import numpy as np
+    from app.services.vector_store import LocalVectorIndex, load_vector_index
+
+    print(f"로컬 인덱스 '{LOCAL_VECTOR_INDEX_PATH}'에 추가 중...")
+
+    ids = [f"chunk_{j}" for j in range(len(chunks))]
+    vectors = np.array(embeddings, dtype=np.float32)
+    chunk_metadata = [build_chunk_metadata(chunk, meta["page"]) for chunk, meta in zip(chunks, metadatas)]
+
+    if os.path.exists(LOCAL_VECTOR_INDEX_PATH):
+        # 전수 검색/IVF 인덱스 모두 같은 ID는 덮어쓰고 새 ID만 추가
+        index = load_vector_index(LOCAL_VECTOR_INDEX_PATH)
+        index.add(ids, vectors, chunk_metadata)
+    else:
+        index = LocalVectorIndex(ids, vectors, chunk_metadata)
+
+    index.save(LOCAL_VECTOR_INDEX_PATH)
+    print(f"로컬 인덱스 저장 완료! (벡터 {len(index)}개)")
+
 # 메인 실행 코드
 def main():
     print(f"텍스트 파일 '{merged_file}' 처리 중...")
@@ -132,8 +163,11 @@ def main():
     # 임베딩 생성
     embeddings = get_embeddings(chunks)
     
-    # Pinecone에 업로드 (메타데이터 포함)
-    upload_to_pinecone(chunks, embeddings, metadatas)
+    # 벡터 인덱스에 업로드 (메타데이터 포함)
+    if VECTOR_BACKEND == "local":
+        upload_to_local_index(chunks, embeddings, metadatas)
+    else:
+        upload_to_pinecone(chunks, embeddings, metadatas)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
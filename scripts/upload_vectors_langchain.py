@@ -1,8 +1,15 @@
 import os
 import re
+import sys
+from pathlib import Path
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+# 백엔드 패키지(app)를 모듈 검색 경로에 추가 (청크 메타데이터 생성 공유)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.ingestion import build_chunk_metadata
+
 # .env 파일 로드
 load_dotenv()
 
@@ -113,11 +120,10 @@ def upload_to_pinecone(chunks, embeddings, metadatas):
             vectors.append({
                 "id": f"naver_chunk_{timestamp}_{j}",  # 타임스탬프 추가
                 "values": embeddings[j],
-                "metadata": {
-                    "text": chunks[j],
-                    "page": metadatas[j]["page"],
-                    "source": metadatas[j]["source"]
-                }
+                # 목차 여부(is_toc), 제목/카테고리를 적재 시 함께 저장
+                "metadata": build_chunk_metadata(
+                    chunks[j], metadatas[j]["page"], {"source": metadatas[j]["source"]}
+                )
             })
         # 벡터 업로드
         index.upsert(vectors=vectors)
@@ -13,6 +13,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 from backend.app.core.config import settings
 from backend.app.db.base import engine, SessionLocal, Base
 from backend.app.db.models import PolicyChunk, Policy
+from backend.app.services.policy_metadata import title_and_category
 
 def create_tables():
     """데이터베이스 테이블 생성"""
@@ -61,13 +62,17 @@ def store_chunks_in_db(index_name):
                 # 데이터베이스에 저장
                 for vector_id, vector_data in fetch_response['vectors'].items():
                     metadata = vector_data['metadata']
+                    # 적재 시 저장한 제목/카테고리 (메타데이터가 없는 예전 벡터는 본문에서 추출)
+                    title, category = title_and_category(metadata)
                     
                     # PolicyChunk 객체 생성
                     policy_chunk = PolicyChunk(
                         content=metadata.get('text', ''),
                         page_number=metadata.get('page', None),
                         vector_id=vector_id,
-                        metadata=metadata
+                        title=title,
+                        category=category,
+                        chunk_metadata=metadata
                     )
                     
                     db.add(policy_chunk)
@@ -118,6 +123,7 @@ def extract_policies_from_chunks():
                     current_policy = Policy(
                         title=title,
                         description=text,
+                        category=chunk.category,
                         source_page=page
                     )
                     